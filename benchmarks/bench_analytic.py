@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark: motor analítico (Meeus) vs. DE421.
+
+Para um intervalo de anos, mede:
+
+- erro, em minutos, das fases da lua e das estações em relação ao DE421;
+- datas UTC divergentes (o que importa para um calendário por dia);
+- se os meses de cada ano são idênticos nos dois motores;
+- tempo de um ano novo (sem tabelas em memória) em cada motor.
+
+Uso:
+    python benchmarks/bench_analytic.py [primeiro_ano] [último_ano]
+"""
+
+import sys
+import os
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from biblical_calendar import analytic, calendar_core
+from biblical_calendar.analytic import analytic_context
+from biblical_calendar.calendar_core import (
+    compute_seasons_for_years,
+    ephemeris_context,
+    generate_biblical_months_range,
+    generate_month_table,
+)
+
+
+def error_stats(pairs):
+    """Erro médio, máximo e viés (minutos) e datas divergentes de pares (analítico, DE421)."""
+    errors = [(a - r).total_seconds() / 60 for a, r in pairs]
+    mismatches = sum(a.date() != r.date() for a, r in pairs)
+    return (sum(abs(e) for e in errors) / len(errors), max(abs(e) for e in errors),
+            sum(errors) / len(errors), mismatches, len(errors))
+
+
+def cold_year_ms(year, ctx):
+    """Tempo (ms) de ``generate_month_table`` com as tabelas por ano vazias."""
+    calendar_core._phases_table.clear()
+    calendar_core._seasons_table.clear()
+    start = time.perf_counter()
+    generate_month_table(year, ctx=ctx)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    first_year = int(sys.argv[1]) if len(sys.argv) > 1 else 1900
+    last_year = int(sys.argv[2]) if len(sys.argv) > 2 else 2049
+    de421 = ephemeris_context(2000)
+
+    reference = calendar_core._solve_moon_phases(date(first_year, 1, 1), date(last_year + 1, 1, 1), de421)
+    phases = analytic.moon_phases_between(date(first_year, 1, 1), date(last_year + 1, 1, 1))
+    assert [p for _, p in phases] == [p for _, p in reference], "sequências de fases diferentes"
+    pairs = list(zip([utc for utc, _ in phases], [utc for utc, _ in reference]))
+    new_moons = [pair for pair, (_, p) in zip(pairs, reference) if p == 0]
+
+    ref_seasons = compute_seasons_for_years(first_year, last_year, de421)
+    ana_seasons = analytic.seasons_for_years(first_year, last_year)
+    season_pairs = [(utc, ref["utc"]) for year in ref_seasons
+                    for (utc, _), ref in zip(ana_seasons[year], ref_seasons[year])]
+
+    print(f"{first_year}-{last_year}: erro do motor analítico contra DE421 (minutos)")
+    print(f"{'':<24}{'médio':>8}{'máximo':>8}{'viés':>8}{'datas diferentes':>20}")
+    for label, rows in (("luas novas", new_moons), ("todas as fases", pairs),
+                        ("equinócios/solstícios", season_pairs)):
+        mean, worst, bias, mismatches, total = error_stats(rows)
+        print(f"{label:<24}{mean:>8.2f}{worst:>8.2f}{bias:>8.2f}{f'{mismatches}/{total}':>20}")
+
+    same = generate_biblical_months_range(first_year, last_year, ctx=de421).equals(
+        generate_biblical_months_range(first_year, last_year, ctx=analytic_context()))
+    print(f"meses idênticos em todos os anos: {'sim' if same else 'não'}")
+
+    year = 2025
+    cold_year_ms(year, analytic_context())  # import numpy once
+    print(f"{year} sem cache: DE421 {cold_year_ms(year, de421):.1f} ms, "
+          f"analítico {cold_year_ms(year, analytic_context()):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark: ICS com icalendar vs. escritor em fluxo.
+
+Calcula uma vez os festivais de um intervalo de anos e mede, para cada caminho,
+o tempo de serialização e o pico de memória (``tracemalloc``):
+
+- ``events_to_ics``: um ``icalendar.Event`` por festival e ``Calendar.to_ical()``
+  do calendário inteiro;
+- ``iter_ics``: VEVENTs escritos como texto, um por vez, consumidos por um
+  destino que só conta os bytes (como uma resposta HTTP em fluxo).
+
+Uso:
+    python benchmarks/bench_ics.py [primeiro_ano] [último_ano] [repetições]
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from biblical_calendar.calendar_core import (
+    ALL_EVENTS_DEF,
+    ephemeris_context,
+    events_to_ics,
+    generate_month_table,
+    map_festivals_to_dates,
+)
+from biblical_calendar.export import event_uid, iter_ics
+
+
+def festival_events(start_year, end_year):
+    """Festivais do intervalo no formato aceito pelos dois caminhos."""
+    events = []
+    for year in range(start_year, end_year + 1):
+        ctx = ephemeris_context(year)
+        table = generate_month_table(year, ctx=ctx)
+        for fest in map_festivals_to_dates(table, ALL_EVENTS_DEF):
+            events.append({
+                "name": fest["name"],
+                "date": fest["date"],
+                "description": f"Calendário bíblico lunissolar - {ctx.name}",
+                "uid": event_uid(fest["name"], year),
+            })
+    return events
+
+
+def icalendar_path(events):
+    """Caminho antigo: calendário inteiro em memória."""
+    return len(events_to_ics(events))
+
+
+def streaming_path(events):
+    """Caminho novo: texto produzido e descartado evento a evento."""
+    return sum(len(chunk.encode("utf-8")) for chunk in iter_ics(iter(events)))
+
+
+def measure(func, events, repeat):
+    """Tempo médio (ms), pico de memória (KiB) e tamanho da saída (bytes)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        size = func(events)
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    tracemalloc.start()
+    func(events)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024, size
+
+
+def main():
+    start_year = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    end_year = int(sys.argv[2]) if len(sys.argv) > 2 else 2049
+    repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    events = festival_events(start_year, end_year)
+
+    old = measure(icalendar_path, events, repeat)
+    new = measure(streaming_path, events, repeat)
+    print(f"{start_year}-{end_year}: {len(events)} eventos")
+    print(f"{'':<22}{'tempo (ms)':>12}{'pico (KiB)':>12}{'saída (bytes)':>15}")
+    print(f"{'icalendar':<22}{old[0]:>12.1f}{old[1]:>12.1f}{old[2]:>15}")
+    print(f"{'iter_ics (fluxo)':<22}{new[0]:>12.1f}{new[1]:>12.1f}{new[2]:>15}")
+    print(f"ganho: {old[0] / new[0]:.1f}x tempo, {old[1] / new[1]:.1f}x memória")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark: tempo de importação e tempo até o primeiro calendário.
+
+Executa cada cenário em um processo novo (``python -X importtime``) para medir:
+
+- ``import biblical_calendar.calendar_core`` sozinho (deve ser barato: nenhuma
+  efeméride carregada, sem skyfield/pandas);
+- modo lazy: importação + ``generate_biblical_months_dynamic`` (dependências e
+  efeméride carregadas no primeiro uso);
+- modo eager: importação + ``preload()`` + o mesmo cálculo.
+
+Também lista os módulos com maior tempo cumulativo de importação.
+
+Uso:
+    python benchmarks/bench_import.py [ano] [top_n]
+"""
+
+import sys
+import os
+import subprocess
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+SCENARIOS = {
+    "import": "import biblical_calendar.calendar_core as core",
+    "lazy": "import biblical_calendar.calendar_core as core; "
+            "core.generate_biblical_months_dynamic({year})",
+    "eager": "import biblical_calendar.calendar_core as core; core.preload(); "
+             "core.generate_biblical_months_dynamic({year})",
+}
+
+# Runs the scenario and reports wall time and which heavy modules got imported
+TEMPLATE = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+heavy = [m for m in ('skyfield', 'pandas', 'numpy', 'astral', 'icalendar') if m in sys.modules]
+print(f"{{elapsed * 1000:.1f}}|{{','.join(heavy) or '-'}}")
+"""
+
+
+def run(code):
+    """Executa o cenário em um subprocesso e retorna (ms, módulos pesados, importtime)."""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", TEMPLATE.format(code=code)],
+                          capture_output=True, text=True, env=env, check=True)
+    elapsed, heavy = proc.stdout.strip().splitlines()[-1].split("|")
+    return float(elapsed), heavy, proc.stderr
+
+
+def top_imports(importtime_output, top_n):
+    """Módulos com maior tempo cumulativo (µs) na saída de ``-X importtime``."""
+    rows = []
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == "site" and not name.startswith("  "):
+            # ignore the interpreter startup (site and everything it imported)
+            rows = []
+            continue
+        rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top_n]
+
+
+def main():
+    year = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
+    top_n = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    for label, code in SCENARIOS.items():
+        elapsed, heavy, importtime_output = run(code.format(year=year))
+        print(f"{label:<7} {elapsed:8.1f} ms  módulos pesados: {heavy}")
+        if label == "import":
+            for cumulative, name in top_imports(importtime_output, top_n):
+                print(f"        {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark: interpolantes de Chebyshev vs. Skyfield para a visibilidade.
+
+Para cada ano do intervalo, ajusta o interpolante de Jerusalém e o compara com
+o Skyfield em instantes aleatórios do ano. Mede:
+
+- erro máximo da elongação (acima de 2°) e da altitude (abaixo de 80°), em graus;
+- erro máximo de ``cos(elongação)`` e ``sen(altitude)`` (todas as amostras);
+- tempo de ajuste de um ano e de uma consulta nos dois caminhos.
+
+Uso:
+    python benchmarks/bench_interpolants.py [primeiro_ano] [último_ano] [amostras_por_ano]
+"""
+
+import sys
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from biblical_calendar.calendar_core import (
+    JERUSALEM,
+    _elongation_and_altitude,
+    _fit_visibility_interpolant,
+    ephemeris_context,
+    sun_moon_elongation_and_altitude_at,
+)
+
+
+def year_errors(year, samples, ctx, rng):
+    """Erros do interpolante do ano em ``samples`` instantes aleatórios."""
+    interp = _fit_visibility_interpolant(JERUSALEM, year, ctx)
+    start = datetime(year, 1, 1, tzinfo=timezone.utc)
+    length = (datetime(year + 1, 1, 1, tzinfo=timezone.utc) - start).total_seconds()
+    instants = [start + timedelta(seconds=rng.uniform(0, length)) for _ in range(samples)]
+    t = ctx.ts.from_datetimes(instants)
+    seps, alts = _elongation_and_altitude(JERUSALEM, t, ctx)
+    got = np.array([interp.evaluate(w) for w in instants])
+    sep_err = np.abs(got[:, 0] - seps)
+    alt_err = np.abs(got[:, 1] - alts)
+    return (sep_err[seps > 2].max(), alt_err[alts < 80].max(),
+            np.abs(np.cos(np.radians(got[:, 0])) - np.cos(np.radians(seps))).max(),
+            np.abs(np.sin(np.radians(got[:, 1])) - np.sin(np.radians(alts))).max())
+
+
+def main():
+    first_year = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    last_year = int(sys.argv[2]) if len(sys.argv) > 2 else 2030
+    samples = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+    ctx = ephemeris_context(2000)
+    rng = random.Random(1)
+
+    worst = np.max([year_errors(year, samples, ctx, rng) for year in range(first_year, last_year + 1)], axis=0)
+    print(f"{first_year}-{last_year}: erro máximo do interpolante contra o Skyfield")
+    print(f"  elongação (> 2°):  {worst[0]:.1e}°   cos: {worst[2]:.1e}")
+    print(f"  altitude (< 80°):  {worst[1]:.1e}°   sen: {worst[3]:.1e}")
+
+    start = time.perf_counter()
+    interp = _fit_visibility_interpolant(JERUSALEM, 2025, ctx)
+    fit_ms = (time.perf_counter() - start) * 1000
+    when = datetime(2025, 3, 30, 16, 30, tzinfo=timezone.utc)
+    repeat = 20000
+    start = time.perf_counter()
+    for _ in range(repeat):
+        interp.evaluate(when)
+    fast_us = (time.perf_counter() - start) / repeat * 1e6
+    repeat = 200
+    start = time.perf_counter()
+    for _ in range(repeat):
+        sun_moon_elongation_and_altitude_at(JERUSALEM, when, ctx, exact=True)
+    exact_us = (time.perf_counter() - start) / repeat * 1e6
+    print(f"ajuste de um ano: {fit_ms:.0f} ms")
+    print(f"consulta: Skyfield {exact_us:.0f} µs, interpolante {fast_us:.1f} µs ({exact_us / fast_us:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark: chamadas ao Skyfield por ano gerado (antes/depois do motor de lunações).
+
+Compara a busca legada (15 chamadas a ``next_new_moon_on_or_after``, cada uma
+varrendo uma janela de ~2 anos) com ``find_lunations`` (uma única busca).
+
+Uso:
+    python benchmarks/bench_lunations.py [ano_inicial] [ano_final]
+"""
+
+import sys
+import os
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from skyfield import almanac
+
+from biblical_calendar import calendar_core
+from biblical_calendar.calendar_core import (
+    get_march_equinox,
+    next_new_moon_on_or_after,
+    find_lunations,
+    LUNATIONS_PER_YEAR,
+)
+
+
+class SkyfieldCounter:
+    """Conta chamadas a find_discrete e instantes avaliados pela função de fase."""
+
+    def __init__(self):
+        self.find_discrete_calls = 0
+        self.instants = 0
+        self._original = almanac.find_discrete
+
+    def __enter__(self):
+        def counting_find_discrete(t0, t1, f, *args, **kwargs):
+            self.find_discrete_calls += 1
+
+            def counted(t):
+                self.instants += len(t.tt) if t.shape else 1
+                return f(t)
+            counted.step_days = f.step_days
+            return self._original(t0, t1, counted, *args, **kwargs)
+
+        almanac.find_discrete = counting_find_discrete
+        return self
+
+    def __exit__(self, *exc):
+        almanac.find_discrete = self._original
+
+
+def legacy_new_moons(year):
+    """Busca legada: uma janela de ~2 anos por lua nova."""
+    nissan_astro = next_new_moon_on_or_after(get_march_equinox(year))
+    new_moons = [nissan_astro]
+    cursor = nissan_astro + timedelta(days=1)
+    for _ in range(LUNATIONS_PER_YEAR - 1):
+        nm = next_new_moon_on_or_after(cursor)
+        new_moons.append(nm)
+        cursor = nm + timedelta(days=1)
+    return new_moons
+
+
+def single_pass_new_moons(year):
+    """Motor de lunações: uma única busca por ano."""
+    return find_lunations(get_march_equinox(year), LUNATIONS_PER_YEAR)
+
+
+def run(label, fn, years):
+    with SkyfieldCounter() as counter:
+        start = time.perf_counter()
+        results = [fn(y) for y in years]
+        elapsed = time.perf_counter() - start
+    n = len(years)
+    print(f"{label:<12} find_discrete/ano: {counter.find_discrete_calls / n:6.1f}   "
+          f"instantes avaliados/ano: {counter.instants / n:9.0f}   "
+          f"tempo/ano: {elapsed / n * 1000:8.1f} ms")
+    return results
+
+
+def main():
+    start_year = int(sys.argv[1]) if len(sys.argv) > 1 else 2020
+    end_year = int(sys.argv[2]) if len(sys.argv) > 2 else 2029
+    years = list(range(start_year, end_year + 1))
+    print(f"Efeméride: {calendar_core.CURRENT_EPHEMERIS} | anos {start_year}-{end_year}")
+
+    before = run("antes", legacy_new_moons, years)
+    after = run("depois", single_pass_new_moons, years)
+    assert before == after, "Resultados divergentes entre as buscas"
+    print("Resultados idênticos.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark: conversão gregoriano -> bíblico pelo índice de meses.
+
+Compara, para as mesmas datas aleatórias do intervalo:
+
+- caminho anterior: gerar os meses do ano da data e do ano anterior
+  (``generate_month_table``, sem cache persistente) e procurar o mês com
+  ``month_for_date``. As tabelas de fases e estações em memória já estão
+  quentes pela montagem do índice, então este é o melhor caso do caminho
+  anterior;
+- ``MonthIndex.to_biblical``: busca binária nos inícios dos meses;
+- ``MonthIndex.to_biblical_array``: a mesma busca em NumPy
+  (``searchsorted``) sobre um milhão de datas ``datetime64[D]``.
+
+Mostra também o custo de montar o índice (uma vez por processo) e quantas
+datas os dois caminhos classificam de forma diferente (só dias de um 13º mês
+que coincide com o Nissan seguinte).
+
+Uso:
+    python benchmarks/bench_month_index.py [ano_inicial] [ano_final] [datas]
+"""
+
+import sys
+import os
+import random
+import time
+from datetime import date
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from biblical_calendar.calendar_core import generate_month_table
+from biblical_calendar.month_index import build_month_index
+
+
+def legacy_to_biblical(d):
+    """Caminho anterior: meses do ano da data (ou do anterior, antes de Nissan)."""
+    for year in (d.year, d.year - 1):
+        table = generate_month_table(year)
+        found = table.month_for_date(d)
+        if found is not None:
+            month, day = found
+            return year, month.index, month.name, day
+    return None
+
+
+def main():
+    first_year = int(sys.argv[1]) if len(sys.argv) > 1 else 1900
+    last_year = int(sys.argv[2]) if len(sys.argv) > 2 else 2049
+    count = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    start = time.perf_counter()
+    index = build_month_index(first_year, last_year)
+    build_s = time.perf_counter() - start
+
+    rng = random.Random(42)
+    span = index.starts[-1] - index.starts[0]
+    dates = [date.fromordinal(index.starts[0] + rng.randrange(span)) for _ in range(count)]
+
+    start = time.perf_counter()
+    legacy = [legacy_to_biblical(d) for d in dates]
+    legacy_us = (time.perf_counter() - start) / count * 1e6
+
+    repeat = max(1, 100000 // count)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        indexed = [index.to_biblical(d) for d in dates]
+    index_us = (time.perf_counter() - start) / (repeat * count) * 1e6
+
+    bulk = np.array(dates, dtype="datetime64[D]")[np.arange(1_000_000) % count]
+    start = time.perf_counter()
+    result = index.to_biblical_array(bulk)
+    bulk_us = (time.perf_counter() - start) / len(bulk) * 1e6
+    assert result.day[:count].tolist() == [b.day for b in indexed]
+
+    differ = sum(1 for old, new in zip(legacy, indexed) if old != tuple(new))
+
+    print(f"índice {first_year}-{last_year}: {len(index)} meses, montado em {build_s:.2f} s")
+    print(f"{'caminho':<28}{'µs/data':>12}")
+    print(f"{'generate_month_table':<28}{legacy_us:>12.1f}")
+    print(f"{'MonthIndex.to_biblical':<28}{index_us:>12.2f}")
+    print(f"{'to_biblical_array (1M)':<28}{bulk_us:>12.3f}")
+    print(f"speedup: {legacy_us / index_us:.0f}x; datas divergentes: {differ}/{count}")
+
+
+if __name__ == "__main__":
+    main()
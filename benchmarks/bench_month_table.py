@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark: MonthTable vs. DataFrame de meses.
+
+Usa os mesmos meses (calculados uma vez) e mede, para cada representação:
+
+- memória retida pela tabela (``tracemalloc``);
+- construção a partir da lista de dicts de ``build_biblical_months``;
+- mapeamento dos festivais (``map_festivals_to_dates``);
+- busca do mês de cada dia do ano (``iterrows`` vs. ``month_for_date``);
+- acesso por índice (``iloc`` vs. ``table[i]``).
+
+Uso:
+    python benchmarks/bench_month_table.py [ano] [repetições]
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pandas as pd
+
+from biblical_calendar.calendar_core import (
+    get_march_equinox,
+    find_lunations,
+    build_biblical_months,
+    map_festivals_to_dates,
+    FESTIVALS_DEF,
+    YESHUA_EVENTS_DEF,
+    LUNATIONS_PER_YEAR,
+)
+from biblical_calendar.month_table import MonthTable
+
+
+def per_call_us(func, repeat):
+    """Tempo médio por chamada, em microssegundos."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def retained_bytes(factory):
+    """Bytes alocados e ainda retidos pelo objeto criado por ``factory``."""
+    tracemalloc.start()
+    obj = factory()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return size
+
+
+def month_for_date_df(df, d):
+    """Caminho antigo: varredura com iterrows."""
+    for _, row in df.iterrows():
+        if row["start"] <= d <= row["end"]:
+            return row, (d - row["start"]).days + 1
+    return None
+
+
+def main():
+    year = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    months, embolismic = build_biblical_months(find_lunations(get_march_equinox(year), LUNATIONS_PER_YEAR))
+    festivals = {**FESTIVALS_DEF, **YESHUA_EVENTS_DEF}
+    df = pd.DataFrame(months)
+    table = MonthTable.from_months(months, embolismic)
+    days = [table.nissan_start + timedelta(days=i) for i in range(365)]
+
+    rows = [
+        ("memória (bytes)",
+         retained_bytes(lambda: pd.DataFrame(months)),
+         retained_bytes(lambda: MonthTable.from_months(months, embolismic))),
+        ("construção (µs)",
+         per_call_us(lambda: pd.DataFrame(months), repeat),
+         per_call_us(lambda: MonthTable.from_months(months, embolismic), repeat)),
+        ("festivais (µs)",
+         per_call_us(lambda: map_festivals_to_dates(df, festivals), repeat),
+         per_call_us(lambda: map_festivals_to_dates(table, festivals), repeat)),
+        ("365 buscas dia->mês (µs)",
+         per_call_us(lambda: [month_for_date_df(df, d) for d in days], max(1, repeat // 20)),
+         per_call_us(lambda: [table.month_for_date(d) for d in days], repeat)),
+        ("acesso por índice (µs)",
+         per_call_us(lambda: df.iloc[6], repeat),
+         per_call_us(lambda: table[6], repeat)),
+    ]
+    print(f"Ano {year}: {len(table)} meses")
+    print(f"{'':<26}{'DataFrame':>12}{'MonthTable':>12}{'ganho':>9}")
+    for label, old, new in rows:
+        print(f"{label:<26}{old:>12.1f}{new:>12.1f}{old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
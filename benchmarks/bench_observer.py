@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark: preparo por chamada no caminho astronômico (antes/depois).
+
+Compara, para as mesmas entradas, o preparo refeito a cada chamada (versão
+anterior, reproduzida aqui) com os objetos reutilizados por ``observer_context``:
+
+- ``_elongation_and_altitude``: ``Topos`` e ``earth + Topos`` novos e duas
+  chamadas a ``obs.at(t)`` vs. ``Topos`` em cache e uma única ``obs.at(t)``;
+- ``_crescent_check_time``: ``LocationInfo`` e ``astral.sun.sun`` (cinco
+  eventos) vs. ``Observer`` em cache e só ``sunset``;
+- todas as noites candidatas de um ano verificadas uma a uma: tempo total e
+  objetos de preparo criados (``Topos``, ``LocationInfo``, ``sun()``,
+  posições do observador).
+
+Uso:
+    python benchmarks/bench_observer.py [repetições]
+"""
+
+import sys
+import os
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytz
+
+from biblical_calendar import calendar_core
+from biblical_calendar.calendar_core import (
+    JERUSALEM,
+    _crescent_check_time,
+    _elongation_and_altitude,
+    ephemeris_context,
+    find_lunations,
+    get_march_equinox,
+)
+
+
+def legacy_elongation_and_altitude(city_cfg, t, ctx):
+    """Versão anterior: observador recriado e ``obs.at(t)`` duas vezes."""
+    from skyfield.api import Topos
+    obs = ctx.eph['earth'] + Topos(latitude_degrees=city_cfg["lat"], longitude_degrees=city_cfg["lon"])
+    astrometric_moon = obs.at(t).observe(ctx.eph['moon']).apparent()
+    astrometric_sun = obs.at(t).observe(ctx.eph['sun']).apparent()
+    alt, az, distance = astrometric_moon.altaz()
+    return astrometric_moon.separation_from(astrometric_sun).degrees, alt.degrees
+
+
+def legacy_crescent_check_time(cand, city_cfg):
+    """Versão anterior: ``LocationInfo`` e ``sun()`` completos a cada noite."""
+    from astral import LocationInfo
+    from astral.sun import sun
+    loc = LocationInfo(city_cfg["name"], city_cfg["region"], city_cfg["tz"], city_cfg["lat"], city_cfg["lon"])
+    try:
+        sunset_local = sun(loc.observer, date=cand)['sunset']
+    except Exception:
+        tz = pytz.timezone(city_cfg["tz"])
+        sunset_local = tz.localize(datetime.combine(cand, datetime.min.time().replace(hour=18)))
+    return sunset_local.astimezone(pytz.UTC) + timedelta(minutes=30)
+
+
+def per_call_us(func, args, repeat):
+    """Tempo médio por chamada (µs)."""
+    func(*args)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def evenings(ctx):
+    """Noites candidatas de um ano (4 por lua nova) e seus instantes de observação."""
+    new_moons = find_lunations(get_march_equinox(2025, ctx), 13, ctx)
+    return [nm + timedelta(days=delta) for nm in new_moons for delta in range(4)]
+
+
+def request_setup(label, ctx, candidates):
+    """Objetos criados e tempo de uma verificação escalar de todas as noites do ano."""
+    import astral
+    import astral.sun
+    import skyfield.api
+    counts = {"Topos": 0, "LocationInfo": 0, "astral.sun.sun": 0, "Geometric.at": 0}
+
+    def counting(module, name, key):
+        original = getattr(module, name)
+
+        def wrapper(*args, **kwargs):
+            counts[key] += 1
+            return original(*args, **kwargs)
+        setattr(module, name, wrapper)
+        return module, name, original
+
+    from skyfield import vectorlib
+    patches = [counting(skyfield.api, "Topos", "Topos"), counting(astral, "LocationInfo", "LocationInfo"),
+               counting(astral.sun, "sun", "astral.sun.sun"),
+               counting(vectorlib.VectorSum, "at", "Geometric.at")]
+    try:
+        start = time.perf_counter()
+        for cand in candidates:
+            check_time = calendar_core._crescent_check_time(cand, JERUSALEM)
+            t = ctx.ts.from_datetime(check_time)
+            calendar_core._elongation_and_altitude(JERUSALEM, t, ctx)
+        elapsed = (time.perf_counter() - start) * 1000
+    finally:
+        for module, name, original in patches:
+            setattr(module, name, original)
+    print(f"{label:<8}{elapsed:8.1f} ms  " + "  ".join(f"{k}: {v}" for k, v in counts.items()))
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    ctx = ephemeris_context(2025)
+    t = ctx.ts.utc(2025, 3, 30, 16, 30)
+    cand = date(2025, 3, 30)
+
+    old = per_call_us(legacy_elongation_and_altitude, (JERUSALEM, t, ctx), repeat)
+    new = per_call_us(_elongation_and_altitude, (JERUSALEM, t, ctx), repeat)
+    print(f"elongação/altitude:   antes {old:7.0f} µs   depois {new:7.0f} µs   (-{old - new:.0f} µs por chamada)")
+    old = per_call_us(legacy_crescent_check_time, (cand, JERUSALEM), repeat * 10)
+    new = per_call_us(_crescent_check_time, (cand, JERUSALEM), repeat * 10)
+    print(f"instante da crescente: antes {old:6.1f} µs   depois {new:6.1f} µs   (-{old - new:.1f} µs por noite)")
+
+    candidates = evenings(ctx)
+    print(f"{len(candidates)} noites candidatas de 2025 (heurística escalar, sem interpolantes):")
+    original = (calendar_core._elongation_and_altitude, calendar_core._crescent_check_time)
+    calendar_core._elongation_and_altitude = legacy_elongation_and_altitude
+    calendar_core._crescent_check_time = legacy_crescent_check_time
+    try:
+        request_setup("antes", ctx, candidates)
+    finally:
+        calendar_core._elongation_and_altitude, calendar_core._crescent_check_time = original
+    request_setup("depois", ctx, candidates)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Benchmark: geração serial vs. paralela (ProcessPoolExecutor).
+
+Compara ``generate_biblical_months_range`` em um único processo com
+``generate_biblical_months_parallel`` e verifica que os resultados são idênticos.
+O ganho é limitado pelo número de CPUs disponíveis.
+
+Uso:
+    python benchmarks/bench_parallel.py [ano_inicial] [ano_final] [processos] [--academic]
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from biblical_calendar.calendar_core import ephemeris_context, generate_biblical_months_range
+from biblical_calendar.batch import generate_biblical_months_parallel
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    academic = "--academic" in sys.argv
+    start_year = int(args[0]) if len(args) > 0 else 1950
+    end_year = int(args[1]) if len(args) > 1 else 2049
+    workers = int(args[2]) if len(args) > 2 else os.cpu_count()
+    ctx = ephemeris_context(end_year, force_academic=academic)
+    print(f"Efeméride: {ctx.name} | anos {start_year}-{end_year} | {workers} processo(s)")
+
+    start = time.perf_counter()
+    serial = generate_biblical_months_range(start_year, end_year, ctx=ctx)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = generate_biblical_months_parallel(
+        start_year, end_year, force_academic=academic, max_workers=workers,
+        progress=lambda done, total: print(f"\r  {done}/{total} anos", end="", flush=True))
+    parallel_time = time.perf_counter() - start
+    print()
+
+    assert serial.equals(parallel), "Resultados divergentes"
+    print(f"serial    {serial_time:8.1f} s")
+    print(f"paralelo  {parallel_time:8.1f} s")
+    print(f"aceleração: {serial_time / parallel_time:.1f}x  (resultados idênticos)")
+
+
+if __name__ == "__main__":
+    main()
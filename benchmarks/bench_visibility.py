@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Benchmark: heurística de visibilidade escalar vs. vetorizada.
+
+Compara, para as luas novas de cada ano, a heurística escalar
+(``is_first_crescent_visible_heuristic``, uma consulta por noite ao
+interpolante de Chebyshev do ano, incluindo o ajuste na primeira consulta)
+com ``first_crescent_dates`` (todas as noites do ano em um único Time vetorial)
+e verifica que os resultados são idênticos.
+
+Uso:
+    python benchmarks/bench_visibility.py [ano_inicial] [ano_final]
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from biblical_calendar.calendar_core import (
+    get_march_equinox,
+    find_lunations,
+    is_first_crescent_visible_heuristic,
+    first_crescent_dates,
+    JERUSALEM,
+    CURRENT_EPHEMERIS,
+)
+
+
+def main():
+    start_year = int(sys.argv[1]) if len(sys.argv) > 1 else 2020
+    end_year = int(sys.argv[2]) if len(sys.argv) > 2 else 2029
+    years = list(range(start_year, end_year + 1))
+    print(f"Efeméride: {CURRENT_EPHEMERIS} | anos {start_year}-{end_year}")
+
+    new_moons = {y: find_lunations(get_march_equinox(y), 13) for y in years}
+
+    scalar_total = batched_total = 0.0
+    for year in years:
+        start = time.perf_counter()
+        scalar = [is_first_crescent_visible_heuristic(nm, JERUSALEM) for nm in new_moons[year]]
+        scalar_total += time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = first_crescent_dates(new_moons[year], JERUSALEM)
+        batched_total += time.perf_counter() - start
+
+        assert scalar == batched, f"Resultados divergentes em {year}"
+
+    n = len(years)
+    print(f"escalar     tempo/ano: {scalar_total / n * 1000:8.1f} ms")
+    print(f"vetorizado  tempo/ano: {batched_total / n * 1000:8.1f} ms")
+    print(f"aceleração: {scalar_total / batched_total:.1f}x  (resultados idênticos)")
+
+
+if __name__ == "__main__":
+    main()
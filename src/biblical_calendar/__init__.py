@@ -23,28 +23,52 @@ Versão:
     1.0.0
 """
 
-# Import GUI version (with tkinter)
-try:
-    from .calendar import BiblicalCalendarApp, main
-    GUI_AVAILABLE = True
-except ImportError:
-    GUI_AVAILABLE = False
+import importlib
+import importlib.util
+
+# GUI version (with tkinter) is imported on first access, see __getattr__
+GUI_AVAILABLE = importlib.util.find_spec("tkinter") is not None
 
 # Import core version (web-compatible)
 from .calendar_core import (
     BiblicalCalendarCore,
+    ephemeris_context,
+    default_ephemeris_context,
+    ephemeris_runs,
+    preload,
     generate_biblical_months_dynamic,
+    generate_biblical_months_range,
+    generate_month_table,
+    generate_month_tables_range,
     map_festivals_to_dates,
     export_events_to_ics,
     compute_seasons_for_year,
+    compute_seasons_for_years,
+    compute_moon_phases_for_years,
+    get_moon_phases_for_year,
+    visibility_interpolant,
     sunrise_sunset,
     FESTIVALS_DEF,
     YESHUA_EVENTS_DEF,
     MONTH_NAMES,
-    JERUSALEM,
-    SAOPAULO
 )
 
+from .analytic import analytic_context
+from .month_table import Month, MonthTable
+from .month_index import (
+    MONTH_NAME_CODES,
+    BiblicalDate,
+    BiblicalDates,
+    MonthIndex,
+    from_biblical,
+    get_month_index,
+    to_biblical,
+    to_biblical_array,
+)
+from .locations import JERUSALEM, SAOPAULO, LocationRegistry, get_location_registry, make_location, sun_times_for_year
+from .export import iter_calendar_csv, iter_calendar_ics
+from .calendar_cache import CalendarCache, get_calendar_cache, set_calendar_cache
+
 __version__ = "2.0.0"
 __author__ = "Vander Loto"
 __email__ = "vander.loto@outlook.com"
@@ -52,11 +76,43 @@ __description__ = "Calendário bíblico-lunissolar dinâmico com cálculos astro
 
 __all__ = [
     "BiblicalCalendarCore",
+    "ephemeris_context",
+    "default_ephemeris_context",
+    "ephemeris_runs",
+    "analytic_context",
+    "preload",
     "generate_biblical_months_dynamic", 
+    "generate_biblical_months_range",
+    "generate_biblical_months_parallel",
+    "generate_month_table",
+    "generate_month_tables_range",
+    "Month",
+    "MonthTable",
+    "MonthIndex",
+    "BiblicalDate",
+    "BiblicalDates",
+    "MONTH_NAME_CODES",
+    "get_month_index",
+    "to_biblical",
+    "to_biblical_array",
+    "from_biblical",
+    "CalendarCache",
+    "get_calendar_cache",
+    "set_calendar_cache",
     "map_festivals_to_dates",
     "export_events_to_ics",
+    "iter_calendar_csv",
+    "iter_calendar_ics",
     "compute_seasons_for_year",
+    "compute_seasons_for_years",
+    "compute_moon_phases_for_years",
+    "get_moon_phases_for_year",
+    "visibility_interpolant",
     "sunrise_sunset",
+    "sun_times_for_year",
+    "LocationRegistry",
+    "get_location_registry",
+    "make_location",
     "FESTIVALS_DEF",
     "YESHUA_EVENTS_DEF", 
     "MONTH_NAMES",
@@ -67,4 +123,23 @@ __all__ = [
 
 # Add GUI exports if available
 if GUI_AVAILABLE:
-    __all__.extend(["BiblicalCalendarApp", "main"])
\ No newline at end of file
+    __all__.extend(["BiblicalCalendarApp", "main"])
+
+
+# Attributes imported on first access: the GUI (tkinter) and the parallel
+# batch generator (multiprocessing)
+_LAZY_EXPORTS = {
+    "BiblicalCalendarApp": ".calendar",
+    "main": ".calendar",
+    "generate_biblical_months_parallel": ".batch",
+}
+
+
+def __getattr__(name):
+    """Importa a GUI e o gerador paralelo apenas quando são usados."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is not None and (module != ".calendar" or GUI_AVAILABLE):
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
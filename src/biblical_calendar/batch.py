@@ -0,0 +1,111 @@
+"""Batch Generation - Geração paralela de calendários em larga escala.
+
+Divide um intervalo grande de anos (séculos, no modo acadêmico com DE440) em
+blocos e calcula cada bloco com ``generate_biblical_months_range`` em um
+``ProcessPoolExecutor``. Cada ano usa a efeméride de ``ephemeris_context(year)``;
+o registro de efemérides de cada processo carrega cada kernel uma única vez,
+e os blocos são reunidos em ordem cronológica.
+
+Exemplo:
+    >>> df = generate_biblical_months_parallel(1600, 2400, force_academic=True,
+    ...                                        progress=lambda done, total: print(done, total))
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import CancelledError, ProcessPoolExecutor, FIRST_COMPLETED, wait
+import typing
+
+from .calendar_core import ephemeris_runs, generate_biblical_months_range
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+# Years computed by each task; one extra lunation year is solved per block
+DEFAULT_CHUNK_YEARS = 10
+
+# Interval (s) between cancellation checks while waiting for blocks
+CANCEL_POLL_SECONDS = 0.2
+
+def _generate_chunk(start_year: int, end_year: int, use_visibility_heuristic: bool,
+                    force_academic: bool) -> pd.DataFrame:
+    """Calcula um bloco de anos, com uma busca por trecho de anos com o mesmo kernel."""
+    import pandas as pd
+    frames = [generate_biblical_months_range(first, last, use_visibility_heuristic, ctx)
+              for ctx, first, last in ephemeris_runs(start_year, end_year, force_academic)]
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+def year_chunks(start_year: int, end_year: int, chunk_years: int = DEFAULT_CHUNK_YEARS) -> list[tuple[int, int]]:
+    """Divide o intervalo em blocos ``(primeiro, último)`` de até ``chunk_years`` anos."""
+    if chunk_years < 1:
+        raise ValueError("chunk_years deve ser positivo")
+    return [(year, min(year + chunk_years - 1, end_year))
+            for year in range(start_year, end_year + 1, chunk_years)]
+
+
+def generate_biblical_months_parallel(start_year: int, end_year: int,
+                                      use_visibility_heuristic: bool = False,
+                                      force_academic: bool = False,
+                                      max_workers: int | None = None,
+                                      chunk_years: int = DEFAULT_CHUNK_YEARS,
+                                      progress: typing.Callable[[int, int], None] | None = None,
+                                      cancel_event: object = None,
+                                      mp_context: object = None) -> pd.DataFrame:
+    """Gera os meses bíblicos de um intervalo grande usando vários processos.
+
+    Args:
+        start_year (int): Primeiro ano (inclusivo).
+        end_year (int): Último ano (inclusivo).
+        use_visibility_heuristic (bool): Usa a primeira crescente visível em Jerusalém.
+        force_academic (bool): Se True, força uso de DE440 para máxima precisão;
+            caso contrário cada ano usa ``ephemeris_context(year)``, como
+            ``generate_biblical_months_range``.
+        max_workers (int | None): Número de processos (padrão: CPUs disponíveis).
+        chunk_years (int): Anos por tarefa.
+        progress (Callable[[int, int], None] | None): Chamado com (anos
+            concluídos, total de anos) a cada bloco concluído.
+        cancel_event (object): Objeto com ``is_set()`` (ex.: ``threading.Event``);
+            quando sinalizado, os blocos pendentes são cancelados.
+        mp_context (object): Contexto ``multiprocessing`` para o executor.
+
+    Returns:
+        pd.DataFrame: Mesmo formato de ``generate_biblical_months_range``.
+
+    Raises:
+        ValueError: Se o intervalo ou o tamanho do bloco for inválido.
+        concurrent.futures.CancelledError: Se a geração for cancelada.
+    """
+    import pandas as pd
+    if end_year < start_year:
+        raise ValueError("end_year deve ser maior ou igual a start_year")
+    chunks = year_chunks(start_year, end_year, chunk_years)
+    total_years = end_year - start_year + 1
+    if cancel_event is not None and cancel_event.is_set():
+        raise CancelledError()
+
+    results = [None] * len(chunks)
+    done_years = 0
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+    try:
+        futures = {executor.submit(_generate_chunk, first, last, use_visibility_heuristic, force_academic): i
+                   for i, (first, last) in enumerate(chunks)}
+        pending = set(futures)
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError()
+            finished, pending = wait(pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i = futures[future]
+                results[i] = future.result()
+                first, last = chunks[i]
+                done_years += last - first + 1
+                if progress is not None:
+                    progress(done_years, total_years)
+    finally:
+        # on error or cancellation drop the blocks that have not started
+        executor.shutdown(wait=True, cancel_futures=True)
+    return pd.concat(results, ignore_index=True)
@@ -27,20 +27,7 @@ Versão:
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from datetime import datetime, date, timedelta, timezone, time as dt_time
-import pandas as pd
-import pytz
-import os
-import math
-
-# Astronomy
-from skyfield import api, almanac
-from skyfield.api import Topos
-from astral import LocationInfo
-from astral.sun import sun
-
-# ICS
-from icalendar import Calendar, Event
+from datetime import datetime, date, timedelta
 
 # Optional nicer widget
 try:
@@ -50,8 +37,7 @@ except Exception:
     TKCAL_AVAILABLE = False
 
 # ---------------- CONFIG ----------------
-JERUSALEM = {"name": "Jerusalem", "region": "Israel", "lat": 31.7683, "lon": 35.2137, "tz": "Asia/Jerusalem"}
-SAOPAULO  = {"name": "São Paulo",  "region": "Brazil", "lat": -23.5505, "lon": -46.6333, "tz": "America/Sao_Paulo"}
+from .locations import JERUSALEM, SAOPAULO
 
 MONTH_NAMES = ["Nissan", "Iyar", "Sivan", "Tammuz", "Av", "Elul",
                "Tishrei", "Cheshvan", "Kislev", "Tevet", "Shevat", "Adar"]
@@ -154,381 +140,26 @@ FESTIVAL_DESCRIPTIONS = {
     "Solstício de Inverno": "Em Jerusalém, marca o início do inverno (Hemisfério Norte)\nEm São Paulo, marca o início do verão (Hemisfério Sul)"
 }
 
-# Skyfield ephemeris - Dynamic loading based on year
-TS = api.load.timescale()
-
-# Global ephemeris variable - will be set dynamically
-Eph = None
-CURRENT_EPHEMERIS = "none"
-
-# Jerusalem Topos for positional checks
-JER_TOPOS = Topos(latitude_degrees=JERUSALEM["lat"], longitude_degrees=JERUSALEM["lon"])
-
-def load_optimal_ephemeris(year: int, force_academic: bool = False) -> tuple[object, str]:
-    """Carrega a efeméride mais adequada para o ano especificado.
-    
-    Args:
-        year (int): Ano para o qual calcular.
-        force_academic (bool): Se True, força uso de DE440 para máxima precisão.
-        
-    Returns:
-        tuple[object, str]: Objeto efeméride e nome da efeméride carregada.
-        
-    Raises:
-        RuntimeError: Se nenhuma efeméride adequada puder ser carregada.
-    """
-    global Eph, CURRENT_EPHEMERIS
-    
-    # Modo acadêmico sempre usa DE440
-    if force_academic:
-        try:
-            eph = api.load('de440.bsp')
-            Eph = eph
-            CURRENT_EPHEMERIS = "DE440 (Modo Acadêmico)"
-            return eph, CURRENT_EPHEMERIS
-        except Exception as e:
-            # Fallback para DE430 se DE440 não disponível
-            try:
-                eph = api.load('de430.bsp')
-                Eph = eph
-                CURRENT_EPHEMERIS = "DE430 (Fallback Acadêmico)"
-                return eph, CURRENT_EPHEMERIS
-            except Exception:
-                raise RuntimeError(f"Modo acadêmico requer DE440/DE430. Erro: {e}")
-    
-    # Seleção automática baseada no ano
-    if year <= 2050:
-        # DE421 para anos "normais" (1900-2050)
-        try:
-            eph = api.load('de421.bsp')
-            Eph = eph
-            CURRENT_EPHEMERIS = "DE421 (Padrão)"
-            return eph, CURRENT_EPHEMERIS
-        except Exception as e:
-            # Fallback para DE440 se DE421 não disponível
-            try:
-                eph = api.load('de440.bsp')
-                Eph = eph
-                CURRENT_EPHEMERIS = "DE440 (Fallback)"
-                return eph, CURRENT_EPHEMERIS
-            except Exception:
-                raise RuntimeError(f"Não foi possível carregar efeméride adequada. Erro: {e}")
-    else:
-        # DE440 para anos > 2050
-        try:
-            eph = api.load('de440.bsp')
-            Eph = eph
-            CURRENT_EPHEMERIS = "DE440 (Ano > 2050)"
-            return eph, CURRENT_EPHEMERIS
-        except Exception as e:
-            # Fallback para DE430
-            try:
-                eph = api.load('de430.bsp')
-                Eph = eph
-                CURRENT_EPHEMERIS = "DE430 (Fallback)"
-                return eph, CURRENT_EPHEMERIS
-            except Exception:
-                raise RuntimeError(f"Anos > 2050 requerem DE440/DE430. Erro: {e}")
-
-# Initialize with default ephemeris
-try:
-    Eph, CURRENT_EPHEMERIS = load_optimal_ephemeris(datetime.now().year)
-except Exception:
-    # Ultimate fallback
-    Eph = api.load('de421.bsp')
-    CURRENT_EPHEMERIS = "DE421 (Fallback)"
-
-# ---------------- Astronomical helpers ----------------
-
-def get_march_equinox(year: int) -> date:
-    """Obtém a data do equinócio de março.
-    
-    Args:
-        year (int): Ano para calcular o equinócio.
-        
-    Returns:
-        date: Data UTC do equinócio de março.
-    """
-    t0 = TS.utc(year, 1, 1)
-    t1 = TS.utc(year, 12, 31)
-    times, events = almanac.find_discrete(t0, t1, almanac.seasons(Eph))
-    for ti, ev in zip(times, events):
-        if ev == 0:
-            return ti.utc_datetime().date()
-    return date(year, 3, 20)
-
-def find_new_moons_window(start_date: date, end_date: date) -> list[date]:
-    """Encontra luas novas astronômicas em um período.
-    
-    Args:
-        start_date (date): Data inicial (inclusiva).
-        end_date (date): Data final (inclusiva).
-        
-    Returns:
-        list[date]: Lista de datas UTC das luas novas.
-    """
-    t0 = TS.utc(start_date.year, start_date.month, start_date.day)
-    t1 = TS.utc(end_date.year, end_date.month, end_date.day + 1)
-    f = almanac.moon_phases(Eph)
-    times, phases = almanac.find_discrete(t0, t1, f)
-    out = []
-    for ti, ph in zip(times, phases):
-        if ph == 0:
-            # convert to UTC date
-            out.append(ti.utc_datetime().date())
-    return out
-
-def next_new_moon_on_or_after(start_date: date) -> date:
-    """Próxima lua nova astronômica em ou após a data especificada.
-    
-    Args:
-        start_date (date): Data inicial para busca.
-        
-    Returns:
-        date: Data da próxima lua nova.
-        
-    Raises:
-        RuntimeError: Se nenhuma lua nova for encontrada na janela de busca.
-    """
-    # search 2 years ahead
-    t0 = TS.utc(start_date.year, start_date.month, start_date.day)
-    t1 = TS.utc(start_date.year + 2, 12, 31)
-    f = almanac.moon_phases(Eph)
-    times, phases = almanac.find_discrete(t0, t1, f)
-    for ti, ph in zip(times, phases):
-        if ph == 0:
-            dt = ti.utc_datetime().date()
-            if dt >= start_date:
-                return dt
-    raise RuntimeError("No new moon found in search window.")
-
-def sun_moon_elongation_and_altitude_at(city_cfg: dict, when_dt_utc: datetime) -> tuple[float, float]:
-    """Calcula elongação e altitude da lua para uma cidade.
-    
-    Args:
-        city_cfg (dict): Configuração da cidade com lat, lon.
-        when_dt_utc (datetime): Momento UTC para cálculo.
-        
-    Returns:
-        tuple[float, float]: Elongação em graus e altitude da lua em graus.
-    """
-    # when_dt_utc: timezone-aware UTC datetime
-    t = TS.utc(when_dt_utc.year, when_dt_utc.month, when_dt_utc.day,
-               when_dt_utc.hour, when_dt_utc.minute, when_dt_utc.second)
-    sun = Eph['sun']
-    moon = Eph['moon']
-    earth = Eph['earth']
-    # Observer location
-    obs = earth + Topos(latitude_degrees=city_cfg["lat"], longitude_degrees=city_cfg["lon"])
-    # Apparent positions
-    astrometric_moon = obs.at(t).observe(moon).apparent()
-    astrometric_sun = obs.at(t).observe(sun).apparent()
-    # Separation
-    sep = astrometric_moon.separation_from(astrometric_sun).degrees
-    # Moon altitude
-    alt, az, distance = astrometric_moon.altaz()
-    alt_deg = alt.degrees
-    return sep, alt_deg
-
-def is_first_crescent_visible_heuristic(new_moon_date: date, city_cfg: dict) -> date | None:
-    """Heurística para determinar visibilidade da primeira crescente.
-    
-    Verifica até 3 noites após a lua nova astronômica procurando por:
-    - Elongação >= 10 graus
-    - Altitude da lua >= 3 graus no pôr do sol local
-    
-    Args:
-        new_moon_date (date): Data da lua nova astronômica.
-        city_cfg (dict): Configuração da cidade.
-        
-    Returns:
-        date | None: Data local quando a crescente é considerada visível, ou None.
-    """
-    tz = pytz.timezone(city_cfg["tz"])
-    # candidate days: new_moon_date, new_moon_date+1, +2, +3
-    for delta in range(0, 4):
-        cand = new_moon_date + timedelta(days=delta)
-        # compute local sunset time for the city on 'cand' date
-        loc = LocationInfo(city_cfg["name"], city_cfg["region"], city_cfg["tz"], city_cfg["lat"], city_cfg["lon"])
-        try:
-            s = sun(loc.observer, date=cand)
-            sunset_local = s['sunset']  # timezone-aware local
-        except Exception:
-            # fallback: use 18:00 local
-            sunset_local = tz.localize(datetime.combine(cand, dt_time(hour=18, minute=0)))
-        # convert sunset to UTC
-        sunset_utc = sunset_local.astimezone(pytz.UTC)
-        # compute elongation and altitude at 20-30 minutes after sunset (safer)
-        check_time = sunset_utc + timedelta(minutes=30)
-        sep, alt = sun_moon_elongation_and_altitude_at(city_cfg, check_time)
-        # thresholds: elongation >= 7-10 deg, altitude >= 3 deg
-        if sep >= 10 and alt >= 3:
-            # return the local date cand as the month start (Nissan 1 = that evening -> local date)
-            return cand
-    return None
-
-# ---------------- Month generation ----------------
-
-def generate_biblical_months_dynamic(reference_year: int, use_visibility_heuristic: bool = False) -> tuple[pd.DataFrame, bool, date]:
-    """Gera meses bíblicos dinâmicos para um ano.
-    
-    Constrói meses ancorados em Nissan = primeira lua nova em/após equinócio de março.
-    Opcionalmente ajusta para primeira crescente visível em Jerusalém.
-    Detecta ano embolísmico (13 meses lunares em ~370 dias).
-    
-    Args:
-        reference_year (int): Ano de referência.
-        use_visibility_heuristic (bool): Se deve usar heurística de visibilidade.
-        
-    Returns:
-        tuple[pd.DataFrame, bool, date]: DataFrame dos meses, se é embolísmico, data início Nissan.
-    """
-    equinox = get_march_equinox(reference_year)
-    # find first astronomical new moon on/after equinox
-    nissan_astro = next_new_moon_on_or_after(equinox)
-    # if using heuristic visibility, try to determine visible date for Nissan
-    if use_visibility_heuristic:
-        vis = is_first_crescent_visible_heuristic(nissan_astro, JERUSALEM)
-        if vis is not None:
-            nissan_start = vis
-        else:
-            nissan_start = nissan_astro
-    else:
-        nissan_start = nissan_astro
-
-    # collect successive astronomical new moons (14+) to detect embolismic
-    new_moons = [nissan_astro]
-    cursor = nissan_astro + timedelta(days=1)
-    for _ in range(14):
-        nm = next_new_moon_on_or_after(cursor)
-        new_moons.append(nm)
-        cursor = nm + timedelta(days=1)
-
-    # count new moons within ~370 days -> embolismic if >=13
-    limit = nissan_astro + timedelta(days=370)
-    count = sum(1 for nm in new_moons if nm <= limit)
-    embolismic = (count >= 13)
-
-    # Now build months using astronomical new moons, but shift start to visible date if heuristic True
-    months = []
-    # prepare names sequence
-    if embolismic:
-        # will have 13 months: Nissan..Shevat, Adar I, Adar II
-        for i in range(13):
-            astro_start = new_moons[i]
-            # If using visibility rule, compute local visible date for this astro new moon
-            if use_visibility_heuristic:
-                vis = is_first_crescent_visible_heuristic(astro_start, JERUSALEM)
-                start_date = vis if vis is not None else astro_start
-            else:
-                start_date = astro_start
-            end_date = new_moons[i+1] - timedelta(days=1)
-            # name mapping: 0..10 -> MONTH_NAMES[0..10]; 11->Adar I, 12->Adar II
-            if i < 11:
-                name = MONTH_NAMES[i]
-            elif i == 11:
-                name = "Adar I"
-            else:
-                name = "Adar II"
-            months.append({"index": i+1, "name": name, "start": start_date, "end": end_date, "days": (end_date - start_date).days + 1})
-    else:
-        for i in range(12):
-            astro_start = new_moons[i]
-            if use_visibility_heuristic:
-                vis = is_first_crescent_visible_heuristic(astro_start, JERUSALEM)
-                start_date = vis if vis is not None else astro_start
-            else:
-                start_date = astro_start
-            end_date = new_moons[i+1] - timedelta(days=1)
-            name = MONTH_NAMES[i]
-            months.append({"index": i+1, "name": name, "start": start_date, "end": end_date, "days": (end_date - start_date).days + 1})
-
-    df = pd.DataFrame(months)
-    # Ensure Nissan start returned is the mapped start (visible or astro)
-    nissan_mapped_start = df.iloc[0]["start"] if not df.empty else nissan_start
-    return df, embolismic, nissan_mapped_start
-
-# ---------------- Festival mapping & ICS export ----------------
-
-def map_festivals_to_dates(months_df: pd.DataFrame, festivals_dict: dict) -> list[dict]:
-    """Mapeia festivais para datas específicas.
-    
-    Args:
-        months_df (pd.DataFrame): DataFrame com os meses.
-        festivals_dict (dict): Dicionário de festivais {nome: (mês, dia)}.
-        
-    Returns:
-        list[dict]: Lista de eventos com nome e data.
-    """
-    out = []
-    for fname, (midx, day) in festivals_dict.items():
-        row = months_df[months_df["index"] == midx]
-        if not row.empty:
-            start = row.iloc[0]["start"]
-            ev_date = start + timedelta(days=day-1)
-            out.append({"name": fname, "date": ev_date})
-    return out
-
-def export_events_to_ics(event_list: list[dict], filename: str) -> None:
-    """Exporta lista de eventos para arquivo ICS.
-    
-    Args:
-        event_list (list[dict]): Lista de eventos com name, date, description.
-        filename (str): Caminho do arquivo ICS a ser criado.
-    """
-    cal = Calendar()
-    cal.add('prodid', '-//Biblical Lunisolar Calendar//')
-    cal.add('version', '2.0')
-    for ev in event_list:
-        ical = Event()
-        ical.add('summary', ev['name'])
-        # all-day event
-        dt = ev['date']
-        ical.add('dtstart', dt)
-        ical.add('dtend', dt + timedelta(days=1))
-        if ev.get('description'):
-            ical.add('description', ev['description'])
-        cal.add_component(ical)
-    with open(filename, 'wb') as f:
-        f.write(cal.to_ical())
-
-# ---------------- Seasons & sun events ----------------
-
-def compute_seasons_for_year(year: int) -> list[dict]:
-    """Calcula as estações astronômicas para um ano.
-    
-    Args:
-        year (int): Ano para calcular as estações.
-        
-    Returns:
-        list[dict]: Lista com eventos das estações e timestamps UTC.
-    """
-    t0 = TS.utc(year, 1, 1)
-    t1 = TS.utc(year, 12, 31)
-    times, events = almanac.find_discrete(t0, t1, almanac.seasons(Eph))
-    mapping = {0: "March Equinox", 1: "June Solstice", 2: "September Equinox", 3: "December Solstice"}
-    out = []
-    for ti, ev in zip(times, events):
-        out.append({"event": mapping[ev], "utc": ti.utc_datetime().replace(tzinfo=timezone.utc)})
-    return out
-
-def sunrise_sunset(location_cfg: dict, target_date: date) -> dict:
-    """Calcula nascer e pôr do sol para uma localização e data.
-    
-    Args:
-        location_cfg (dict): Configuração da localização.
-        target_date (date): Data alvo.
-        
-    Returns:
-        dict: Dicionário com sunrise e sunset (timezone-aware).
-    """
-    loc = LocationInfo(location_cfg["name"], location_cfg["region"], location_cfg["tz"], location_cfg["lat"], location_cfg["lon"])
-    try:
-        s = sun(loc.observer, date=target_date)
-        return {"sunrise": s["sunrise"].astimezone(pytz.timezone(location_cfg["tz"])),
-                "sunset": s["sunset"].astimezone(pytz.timezone(location_cfg["tz"]))}
-    except Exception:
-        return {"sunrise": None, "sunset": None}
+# Astronomical engine, month generation and exports are shared with the
+# web-compatible core so the GUI and the API use a single implementation
+from .calendar_core import (
+    default_ephemeris_context,
+    ephemeris_context,
+    load_optimal_ephemeris,
+    get_march_equinox,
+    find_new_moons_window,
+    next_new_moon_on_or_after,
+    find_lunations,
+    sun_moon_elongation_and_altitude_at,
+    is_first_crescent_visible_heuristic,
+    build_biblical_months,
+    generate_biblical_months_dynamic,
+    map_festivals_to_dates,
+    export_events_to_ics,
+    compute_seasons_for_year,
+    sunrise_sunset,
+    get_moon_phases_for_year,
+)
 
 # ---------------- GUI Application ----------------
 
@@ -542,6 +173,7 @@ class BiblicalCalendarApp(tk.Tk):
         months_df (pd.DataFrame): DataFrame com os meses calculados.
         embolismic (bool): Se o ano é embolísmico (13 meses).
         nissan_start (date): Data de início do mês de Nissan.
+        ephemeris_ctx (EphemerisContext): Efeméride usada no cálculo atual.
         visual_index (int): Índice do mês sendo visualizado.
     """
     
@@ -589,7 +221,8 @@ class BiblicalCalendarApp(tk.Tk):
         ttk.Button(row2, text="Exportar CSV", command=self.on_export_csv).pack(side="left", padx=6)
         
         # Ephemeris status label
-        self.ephemeris_status = ttk.Label(row2, text=f"Efeméride: {CURRENT_EPHEMERIS}", foreground="blue")
+        default_ephemeris_name = default_ephemeris_context().name
+        self.ephemeris_status = ttk.Label(row2, text=f"Efeméride: {default_ephemeris_name}", foreground="blue")
         self.ephemeris_status.pack(side="right", padx=8)
 
         # Build tab UIs
@@ -603,7 +236,8 @@ class BiblicalCalendarApp(tk.Tk):
         self.embolismic = False
         self.nissan_start = None
         self.visual_index = 0
-        self.current_ephemeris_name = CURRENT_EPHEMERIS
+        self.current_ephemeris_name = default_ephemeris_name
+        self.ephemeris_ctx = None
 
         # initial generate
         self.generate_all()
@@ -715,9 +349,9 @@ class BiblicalCalendarApp(tk.Tk):
                     "• Download de ~128MB pode ser necessário\n"
                     "• Dados exportados com precisão estendida")
             
-            eph, eph_name = load_optimal_ephemeris(year, force_academic=academic_mode)
-            self.current_ephemeris_name = eph_name
-            self.ephemeris_status.config(text=f"Efeméride: {eph_name}")
+            self.ephemeris_ctx = ephemeris_context(year, force_academic=academic_mode)
+            self.current_ephemeris_name = self.ephemeris_ctx.name
+            self.ephemeris_status.config(text=f"Efeméride: {self.current_ephemeris_name}")
             
         except Exception as e:
             messagebox.showerror("Erro de Efeméride", 
@@ -726,7 +360,8 @@ class BiblicalCalendarApp(tk.Tk):
             return
         
         try:
-            df, embol, nissan = generate_biblical_months_dynamic(year, use_visibility_heuristic=use_vis)
+            df, embol, nissan = generate_biblical_months_dynamic(year, use_visibility_heuristic=use_vis,
+                                                                 ctx=self.ephemeris_ctx)
         except Exception as e:
             messagebox.showerror("Erro", f"Falha ao calcular meses: {e}")
             return
@@ -761,7 +396,7 @@ class BiblicalCalendarApp(tk.Tk):
             self.txt_fest.insert(tk.END, f" - {ev['name']}: {ev['date'].isoformat()}\n")
 
         # seasons (astronomical instants in UTC)
-        self.seasons = compute_seasons_for_year(year)
+        self.seasons = compute_seasons_for_year(year, self.ephemeris_ctx)
         self.txt_seasons_jer.delete("1.0", tk.END)
         self.txt_seasons_sp.delete("1.0", tk.END)
         for s in self.seasons:
@@ -896,21 +531,7 @@ class BiblicalCalendarApp(tk.Tk):
     
     def _get_moon_phases_for_year(self, year: int) -> list[dict]:
         """Obtém todas as fases da lua para um ano."""
-        t0 = TS.utc(year, 1, 1)
-        t1 = TS.utc(year, 12, 31)
-        f = almanac.moon_phases(Eph)
-        times, phases = almanac.find_discrete(t0, t1, f)
-        phase_names = {0: "🌑", 1: "🌓", 2: "🌕", 3: "🌗"}
-        phase_labels = {0: "Nova", 1: "Crescente", 2: "Cheia", 3: "Minguante"}
-        out = []
-        for ti, ph in zip(times, phases):
-            out.append({
-                "date": ti.utc_datetime().date(),
-                "phase": ph,
-                "icon": phase_names[ph],
-                "name": phase_labels[ph]
-            })
-        return out
+        return get_moon_phases_for_year(year, self.ephemeris_ctx)
     
     def _set_current_month(self) -> None:
         """Define o índice para o mês que contém a data atual."""
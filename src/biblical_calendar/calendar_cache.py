@@ -0,0 +1,341 @@
+"""Calendar Cache - Cache persistente de calendários calculados.
+
+Guarda em SQLite as partes de um calendário (meses, festivais, estações e fases
+da lua). Para uma mesma chave o resultado nunca muda, então cada parte é
+calculada uma única vez e reaproveitada entre reinícios do processo.
+
+A chave é endereçada por conteúdo: SHA-256 de (tipo, ano, parâmetros, nome da
+efeméride, checksum do kernel, índice de lunações em uso, versão da biblioteca,
+versão dos dados). Trocar o arquivo do kernel ou o índice de lunações,
+atualizar a biblioteca ou mudar o que é calculado (``CACHE_DATA_VERSION``)
+invalida as entradas automaticamente.
+
+As gravações são transações SQLite (atômicas, seguras entre processos) e o
+tamanho total é limitado: ao exceder o limite, as entradas usadas há mais
+tempo são descartadas. Os valores são serializados com ``pickle`` + ``zlib``;
+use apenas arquivos de cache confiáveis.
+
+Exemplo:
+    $ export BIBLICAL_CALENDAR_CACHE=/var/cache/biblical_calendar.sqlite
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import typing
+import warnings
+
+# sqlite3, pickle, zlib and hashlib are imported on first use so that importing
+# calendar_core stays cheap when the cache is disabled
+
+# Environment variables with the cache path and its size limit in megabytes
+CALENDAR_CACHE_ENV = "BIBLICAL_CALENDAR_CACHE"
+CALENDAR_CACHE_SIZE_ENV = "BIBLICAL_CALENDAR_CACHE_MAX_MB"
+DEFAULT_MAX_MB = 64
+
+# Version of the computed data; bump it in any change that alters what is
+# cached (and the ETags derived from the keys), even without a release:
+#   2 - phases up to the end of December 31
+#   3 - season instants from the multi-year seasons table
+CACHE_DATA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS kernels (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+"""
+
+
+def _library_version() -> str:
+    """Versão da biblioteca usada na chave."""
+    from . import __version__
+    return __version__
+
+
+def file_checksum(path: str) -> str:
+    """SHA-256 do arquivo."""
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _kernel_file(eph: object) -> tuple[str | None, os.stat_result | None, str]:
+    """Caminho e ``stat`` do arquivo do kernel, mais a identidade usada sem arquivo.
+
+    Kernels sem arquivo em disco usam o nome do arquivo como identidade.
+    """
+    fallback = f"name:{os.path.basename(getattr(eph, 'filename', '') or repr(eph))}"
+    path = getattr(eph, "path", None)
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None, None, fallback
+    return os.path.abspath(path), stat, fallback
+
+
+# Kernel checksums computed by this process: "path:size:mtime_ns" -> sha256
+_process_checksums: dict[str, str] = {}
+
+
+def kernel_checksum(eph: object) -> str:
+    """Checksum do kernel pelo cache ativo ou, sem cache, uma vez por processo."""
+    cache = get_calendar_cache()
+    if cache is not None:
+        return cache.kernel_checksum(eph)
+    path, stat, fallback = _kernel_file(eph)
+    if stat is None:
+        return fallback
+    memo = f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+    if memo not in _process_checksums:
+        _process_checksums[memo] = file_checksum(path)
+    return _process_checksums[memo]
+
+
+def _content_key(kind: str, year: int, ctx: object, checksum: str, params: dict) -> str:
+    """SHA-256 da identidade (tipo, ano, parâmetros, efeméride, kernel, índice, versões)."""
+    import hashlib
+    import json
+    from .lunation_index import lunation_index_for
+    index = lunation_index_for(ctx.kernel)
+    identity = {
+        "kind": kind,
+        "year": year,
+        "params": params,
+        "ephemeris": ctx.name,
+        "kernel": checksum,
+        "lunations": index.checksum if index is not None else None,
+        "version": _library_version(),
+        "data": CACHE_DATA_VERSION,
+    }
+    raw = json.dumps(identity, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def content_key(kind: str, year: int, ctx: object, **params) -> str:
+    """Chave endereçada por conteúdo de um resultado calculado.
+
+    Args:
+        kind (str): Tipo do resultado (ex.: "months", "seasons").
+        year (int): Ano.
+        ctx (EphemerisContext): Efeméride usada no cálculo.
+        **params: Demais parâmetros (ex.: ``visibility=True``).
+
+    Returns:
+        str: SHA-256 hexadecimal; muda com a efeméride, o arquivo do kernel,
+        o índice de lunações usado pelo kernel, a versão da biblioteca ou
+        ``CACHE_DATA_VERSION``.
+    """
+    return _content_key(kind, year, ctx, kernel_checksum(ctx.eph), params)
+
+
+class CalendarCache:
+    """Cache SQLite endereçado por conteúdo com limite de tamanho.
+
+    Attributes:
+        path (str): Arquivo SQLite.
+        max_bytes (int): Tamanho máximo dos valores guardados.
+        hits (int): Consultas atendidas pelo cache neste processo.
+        misses (int): Consultas que precisaram calcular o valor.
+    """
+
+    def __init__(self, path: str, max_mb: float | None = None):
+        """Abre (ou cria) o cache.
+
+        Args:
+            path (str): Arquivo SQLite.
+            max_mb (float | None): Limite em MB. Padrão: variável de ambiente
+                ``BIBLICAL_CALENDAR_CACHE_MAX_MB`` ou 64.
+        """
+        import sqlite3
+        if max_mb is None:
+            max_mb = float(os.environ.get(CALENDAR_CACHE_SIZE_ENV, DEFAULT_MAX_MB))
+        self.path = path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._checksums: dict[str, str] = {}
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Fecha a conexão."""
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def total_bytes(self) -> int:
+        """Tamanho total dos valores guardados."""
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def kernel_checksum(self, eph: object) -> str:
+        """Checksum do arquivo do kernel, guardado no cache e recalculado só se o arquivo mudar."""
+        path, stat, fallback = _kernel_file(eph)
+        if stat is None:
+            return fallback
+        memo = f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+        if memo in self._checksums:
+            return self._checksums[memo]
+        with self._lock:
+            row = self._db.execute("SELECT size, mtime_ns, sha256 FROM kernels WHERE path = ?",
+                                   (path,)).fetchone()
+        if row is not None and row[:2] == (stat.st_size, stat.st_mtime_ns):
+            checksum = row[2]
+        else:
+            checksum = file_checksum(path)
+            with self._lock:
+                self._db.execute("INSERT OR REPLACE INTO kernels VALUES (?, ?, ?, ?)",
+                                 (path, stat.st_size, stat.st_mtime_ns, checksum))
+        self._checksums[memo] = checksum
+        return checksum
+
+    def key(self, kind: str, year: int, ctx: object, **params) -> str:
+        """Chave SHA-256 de uma parte do calendário (ver ``content_key``)."""
+        return _content_key(kind, year, ctx, self.kernel_checksum(ctx.eph), params)
+
+    def get(self, key: str, default: object = None) -> object:
+        """Valor guardado para a chave (marcado como usado agora), ou ``default``."""
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys: typing.Iterable[str]) -> dict[str, object]:
+        """Valores guardados das chaves encontradas, marcados como usados agora.
+
+        Conta um acerto por chave encontrada e uma falta por chave ausente
+        (ou ilegível) em ``hits`` e ``misses``.
+        """
+        import pickle
+        import zlib
+        keys = list(keys)
+        now = time.time()
+        blobs = {}
+        with self._lock:
+            for key in keys:
+                row = self._db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+                    blobs[key] = row[0]
+        values = {}
+        for key, blob in blobs.items():
+            try:
+                values[key] = pickle.loads(zlib.decompress(blob))
+            except (zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                # unreadable entry (e.g. written by an incompatible version): recompute
+                pass
+        with self._lock:
+            self.hits += len(values)
+            self.misses += len(keys) - len(values)
+        return values
+
+    def put(self, key: str, value: object) -> None:
+        """Guarda o valor em uma transação e aplica o limite de tamanho."""
+        import pickle
+        import zlib
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                                 (key, blob, len(blob), time.time()))
+                self._evict()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        """Descarta as entradas usadas há mais tempo até caber no limite."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall()
+        # always keep the newest entry, even if it alone exceeds the limit
+        for key, size in rows[:-1]:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+
+    def get_or_compute(self, kind: str, year: int, ctx: object,
+                       compute: typing.Callable[[], object], **params) -> object:
+        """Valor da parte do calendário, calculado só na primeira vez.
+
+        Args:
+            kind (str): Tipo da parte.
+            year (int): Ano.
+            ctx (EphemerisContext): Efeméride usada no cálculo.
+            compute (Callable[[], object]): Calcula o valor em caso de falta.
+            **params: Demais parâmetros da chave.
+        """
+        key = self.key(kind, year, ctx, **params)
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        with self._lock:
+            self._db.execute("DELETE FROM entries")
+
+
+# Active cache used by calendar_core; False means "not resolved yet"
+_active_cache = False
+
+
+def get_calendar_cache() -> CalendarCache | None:
+    """Cache ativo, aberto na primeira chamada a partir de ``CALENDAR_CACHE_ENV``."""
+    global _active_cache
+    if _active_cache is False:
+        path = os.environ.get(CALENDAR_CACHE_ENV)
+        _active_cache = None
+        if path:
+            import sqlite3
+            try:
+                _active_cache = CalendarCache(path)
+            except (OSError, sqlite3.Error) as e:
+                warnings.warn(f"Cache de calendários ignorado: {e}")
+    return _active_cache
+
+
+def set_calendar_cache(cache: "CalendarCache | str | None") -> CalendarCache | None:
+    """Define o cache ativo (objeto, caminho ou None para desativar)."""
+    global _active_cache
+    _active_cache = CalendarCache(cache) if isinstance(cache, str) else cache
+    return _active_cache
+
+
+def cached(kind: str, year: int, ctx: object, compute: typing.Callable[[], object], **params) -> object:
+    """Usa o cache ativo, se houver; caso contrário apenas calcula."""
+    cache = get_calendar_cache()
+    if cache is None:
+        return compute()
+    return cache.get_or_compute(kind, year, ctx, compute, **params)
@@ -23,28 +23,43 @@ Versão:
     2.0.0
 """
 
+from __future__ import annotations
+
 from datetime import datetime, date, timedelta, timezone, time as dt_time
-import pandas as pd
+import bisect
+import importlib
+import threading
+import typing
 import pytz
 import os
 import math
 
-# Astronomy
-from skyfield import api, almanac
-from skyfield.api import Topos
-from astral import LocationInfo
-from astral.sun import sun
-
-# ICS
-from icalendar import Calendar, Event
+# Heavy dependencies (skyfield, astral, pandas, icalendar) are imported on
+# first use inside the functions that need them, and the default ephemeris is
+# loaded on first access, so importing this module does no I/O.
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+from . import analytic
+from .analytic import is_analytic
+from .calendar_cache import cached, get_calendar_cache
+from .ephemeris import EphemerisContext, get_registry
+from .interpolants import CHEBYSHEV_DEGREE, VisibilityInterpolant, sample_days
+from .locations import JERUSALEM, observer_context
+from .lunation_index import lunation_index_for
+from .month_table import MonthTable
 
 # ---------------- CONFIG ----------------
-JERUSALEM = {"name": "Jerusalem", "region": "Israel", "lat": 31.7683, "lon": 35.2137, "tz": "Asia/Jerusalem"}
-SAOPAULO  = {"name": "São Paulo",  "region": "Brazil", "lat": -23.5505, "lon": -46.6333, "tz": "America/Sao_Paulo"}
-
 MONTH_NAMES = ["Nissan", "Iyar", "Sivan", "Tammuz", "Av", "Elul",
                "Tishrei", "Cheshvan", "Kislev", "Tevet", "Shevat", "Adar"]
 
+# Mean synodic month (days), used to size lunation search windows
+SYNODIC_MONTH_DAYS = 29.530588853
+
+# Astronomical new moons needed to build one year: 13 month starts plus the
+# start of the following year (to close the last month) and one spare
+LUNATIONS_PER_YEAR = 15
+
 # Cronologias para comparação de anos
 def calculate_ussher_year(gregorian_year: int) -> int:
     """Calcula ano segundo cronologia de Ussher (Criação em 4004 AC)."""
@@ -79,6 +94,9 @@ YESHUA_EVENTS_DEF = {
     "Mavet Yeshua (Tzliva)": (1, 14)
 }
 
+# Festivals and Yeshua events together, built once
+ALL_EVENTS_DEF = {**FESTIVALS_DEF, **YESHUA_EVENTS_DEF}
+
 # Traduções para português
 FESTIVAL_TRANSLATIONS = {
     # Festas da Primavera
@@ -128,239 +146,501 @@ FESTIVAL_DESCRIPTIONS = {
     "Solstício de Inverno": "Em Jerusalém, marca o início do inverno (Hemisfério Norte)\\nEm São Paulo, marca o início do verão (Hemisfério Sul)"
 }
 
-# Skyfield ephemeris - Dynamic loading based on year
-TS = api.load.timescale()
-
-# Global ephemeris variable - will be set dynamically
-Eph = None
-CURRENT_EPHEMERIS = "none"
-
-# Jerusalem Topos for positional checks
-JER_TOPOS = Topos(latitude_degrees=JERUSALEM["lat"], longitude_degrees=JERUSALEM["lon"])
+def ephemeris_context(year: int, force_academic: bool = False) -> EphemerisContext:
+    """Contexto imutável com a efeméride mais adequada para o ano."""
+    return get_registry().context(year, force_academic=force_academic)
+
+def ephemeris_runs(start_year: int, end_year: int,
+                   force_academic: bool = False) -> list[tuple[EphemerisContext, int, int]]:
+    """Divide o intervalo em trechos de anos consecutivos com a mesma efeméride.
+
+    Cada ano usa ``ephemeris_context(year)``, como uma requisição de um único
+    ano; os trechos ``(ctx, primeiro, último)`` podem ser resolvidos em uma
+    única busca cada.
+    """
+    runs = []
+    for year in range(start_year, end_year + 1):
+        ctx = ephemeris_context(year, force_academic=force_academic)
+        if runs and runs[-1][0].kernel == ctx.kernel:
+            runs[-1][2] = year
+        else:
+            runs.append([ctx, year, year])
+    return [tuple(run) for run in runs]
 
 def load_optimal_ephemeris(year: int, force_academic: bool = False) -> tuple[object, str]:
-    """Carrega a efeméride mais adequada para o ano especificado."""
-    global Eph, CURRENT_EPHEMERIS
-    
-    # Modo acadêmico sempre usa DE440
-    if force_academic:
-        try:
-            eph = api.load('de440.bsp')
-            Eph = eph
-            CURRENT_EPHEMERIS = "DE440 (Modo Acadêmico)"
-            return eph, CURRENT_EPHEMERIS
-        except Exception as e:
-            # Fallback para DE430 se DE440 não disponível
-            try:
-                eph = api.load('de430.bsp')
-                Eph = eph
-                CURRENT_EPHEMERIS = "DE430 (Fallback Acadêmico)"
-                return eph, CURRENT_EPHEMERIS
-            except Exception:
-                raise RuntimeError(f"Modo acadêmico requer DE440/DE430. Erro: {e}")
-    
-    # Seleção automática baseada no ano
-    if year <= 2050:
-        # DE421 para anos "normais" (1900-2050)
-        try:
-            eph = api.load('de421.bsp')
-            Eph = eph
-            CURRENT_EPHEMERIS = "DE421 (Padrão)"
-            return eph, CURRENT_EPHEMERIS
-        except Exception as e:
-            # Fallback para DE440 se DE421 não disponível
-            try:
-                eph = api.load('de440.bsp')
-                Eph = eph
-                CURRENT_EPHEMERIS = "DE440 (Fallback)"
-                return eph, CURRENT_EPHEMERIS
-            except Exception:
-                raise RuntimeError(f"Não foi possível carregar efeméride adequada. Erro: {e}")
-    else:
-        # DE440 para anos > 2050
-        try:
-            eph = api.load('de440.bsp')
-            Eph = eph
-            CURRENT_EPHEMERIS = "DE440 (Ano > 2050)"
-            return eph, CURRENT_EPHEMERIS
-        except Exception as e:
-            # Fallback para DE430
-            try:
-                eph = api.load('de430.bsp')
-                Eph = eph
-                CURRENT_EPHEMERIS = "DE430 (Fallback)"
-                return eph, CURRENT_EPHEMERIS
-            except Exception:
-                raise RuntimeError(f"Anos > 2050 requerem DE440/DE430. Erro: {e}")
-
-# Initialize with default ephemeris
-try:
-    Eph, CURRENT_EPHEMERIS = load_optimal_ephemeris(datetime.now().year)
-except Exception:
-    # Ultimate fallback
-    Eph = api.load('de421.bsp')
-    CURRENT_EPHEMERIS = "DE421 (Fallback)"
+    """Carrega a efeméride mais adequada para o ano especificado (sem alterar o contexto padrão)."""
+    ctx = ephemeris_context(year, force_academic=force_academic)
+    return ctx.eph, ctx.name
+
+# Default context, used when a caller does not pass one. It is resolved once,
+# on first use, and never reassigned; per-request ephemerides travel in their
+# own context.
+_default_context = None
+_default_context_lock = threading.Lock()
+
+def default_ephemeris_context() -> EphemerisContext:
+    """Contexto padrão (efeméride do ano corrente), carregado no primeiro uso."""
+    global _default_context
+    if _default_context is None:
+        with _default_context_lock:
+            if _default_context is None:
+                try:
+                    _default_context = ephemeris_context(datetime.now().year)
+                except Exception:
+                    # Ultimate fallback
+                    _default_context = get_registry().context_for('de421.bsp', "DE421 (Fallback)")
+    return _default_context
+
+def preload() -> EphemerisContext:
+    """Carrega antecipadamente módulos pesados e a efeméride padrão (modo eager)."""
+    for module in ("skyfield.almanac", "astral.sun", "pandas", "icalendar"):
+        importlib.import_module(module)
+    return default_ephemeris_context()
+
+# Module attributes kept for compatibility, resolved lazily (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "DEFAULT_CONTEXT": lambda: default_ephemeris_context(),
+    "TS": lambda: default_ephemeris_context().ts,
+    "Eph": lambda: default_ephemeris_context().eph,
+    "CURRENT_EPHEMERIS": lambda: default_ephemeris_context().name,
+    # Jerusalem Topos for positional checks
+    "JER_TOPOS": lambda: observer_context(JERUSALEM).topos,
+    "api": lambda: importlib.import_module("skyfield.api"),
+    "almanac": lambda: importlib.import_module("skyfield.almanac"),
+    "pd": lambda: importlib.import_module("pandas"),
+}
+
+def __getattr__(name: str):
+    """Resolve sob demanda os atributos de ``_LAZY_ATTRIBUTES``."""
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ---------------- Astronomical helpers ----------------
 
-def get_march_equinox(year: int) -> date:
+def get_march_equinox(year: int, ctx: EphemerisContext | None = None) -> date:
     """Obtém a data do equinócio de março."""
-    t0 = TS.utc(year, 1, 1)
-    t1 = TS.utc(year, 12, 31)
-    times, events = almanac.find_discrete(t0, t1, almanac.seasons(Eph))
-    for ti, ev in zip(times, events):
-        if ev == 0:
-            return ti.utc_datetime().date()
+    for season in _seasons_of(year, ctx or default_ephemeris_context()):
+        if season["event"] == SEASON_NAMES[0]:
+            return season["utc"].date()
     return date(year, 3, 20)
 
-def find_new_moons_window(start_date: date, end_date: date) -> list[date]:
-    """Encontra luas novas astronômicas em um período."""
-    t0 = TS.utc(start_date.year, start_date.month, start_date.day)
-    t1 = TS.utc(end_date.year, end_date.month, end_date.day + 1)
-    f = almanac.moon_phases(Eph)
-    times, phases = almanac.find_discrete(t0, t1, f)
-    out = []
-    for ti, ph in zip(times, phases):
-        if ph == 0:
-            out.append(ti.utc_datetime().date())
-    return out
+# Moon phase engine: every lunar phase of a year is solved once, with a single
+# find_discrete over [Jan 1, next Jan 1), and shared by the month builder, the
+# moon phase listings, the API and the GUI
+
+PHASE_ICONS = {0: "🌑", 1: "🌓", 2: "🌕", 3: "🌗"}
+PHASE_LABELS = {0: "Nova", 1: "Crescente", 2: "Cheia", 3: "Minguante"}
+
+# Phases table: (ephemeris file, year) -> [(utc datetime, phase 0-3), ...]
+_phases_table: dict[tuple[str, int], list[tuple[datetime, int]]] = {}
+
+def _solve_moon_phases(start: date, end: date, ctx: EphemerisContext) -> list[tuple[datetime, int]]:
+    """Fases da lua de ``start`` (inclusivo) a ``end`` (exclusivo) em uma única busca."""
+    if is_analytic(ctx):
+        return analytic.moon_phases_between(start, end)
+    from skyfield import almanac
+    t0 = ctx.ts.utc(start.year, start.month, start.day)
+    t1 = ctx.ts.utc(end.year, end.month, end.day)
+    times, phases = almanac.find_discrete(t0, t1, almanac.moon_phases(ctx.eph))
+    return [(ti.utc_datetime().replace(tzinfo=timezone.utc), int(ph)) for ti, ph in zip(times, phases)]
+
+def compute_moon_phases_for_years(start_year: int, end_year: int, ctx: EphemerisContext | None = None) -> None:
+    """Resolve as fases da lua dos anos que faltam na tabela com uma única busca.
+
+    Anos já resolvidos (neste processo ou no cache persistente) não são
+    recalculados; os que faltam são resolvidos juntos, do primeiro ao último.
+    """
+    ctx = ctx or default_ephemeris_context()
+    missing = [year for year in range(start_year, end_year + 1) if (ctx.kernel, year) not in _phases_table]
+    if not missing:
+        return
+    cache = get_calendar_cache()
+    if cache is not None:
+        keys = {year: cache.key("lunar_phases", year, ctx) for year in missing}
+        stored = cache.get_many(keys.values())
+        for year in list(missing):
+            if keys[year] in stored:
+                _phases_table[(ctx.kernel, year)] = stored[keys[year]]
+                missing.remove(year)
+        if not missing:
+            return
+    solved = {year: [] for year in range(missing[0], missing[-1] + 1)}
+    for utc, phase in _solve_moon_phases(date(missing[0], 1, 1), date(missing[-1] + 1, 1, 1), ctx):
+        solved[utc.year].append((utc, phase))
+    for year, phases in solved.items():
+        _phases_table[(ctx.kernel, year)] = phases
+        if cache is not None and year in missing:
+            cache.put(cache.key("lunar_phases", year, ctx), phases)
+
+def _phases_of(year: int, ctx: EphemerisContext) -> list[tuple[datetime, int]]:
+    """Fases da lua do ano pela tabela, resolvendo o ano na primeira consulta."""
+    key = (ctx.kernel, year)
+    if key not in _phases_table:
+        compute_moon_phases_for_years(year, year, ctx)
+    return _phases_table[key]
+
+def _new_moons_from_table(start_date: date, end_date: date, ctx: EphemerisContext) -> list[date]:
+    """Luas novas do período pela tabela de fases."""
+    try:
+        compute_moon_phases_for_years(start_date.year, end_date.year, ctx)
+    except Exception as e:
+        from skyfield.errors import EphemerisRangeError
+        if not isinstance(e, EphemerisRangeError):
+            raise
+        # whole years cross the end of the kernel: solve just the window
+        phases = _solve_moon_phases(start_date, end_date + timedelta(days=1), ctx)
+    else:
+        phases = [p for year in range(start_date.year, end_date.year + 1) for p in _phases_table[(ctx.kernel, year)]]
+    return [utc.date() for utc, ph in phases if ph == 0 and start_date <= utc.date() <= end_date]
 
-def next_new_moon_on_or_after(start_date: date) -> date:
+def find_new_moons_window(start_date: date, end_date: date, ctx: EphemerisContext | None = None) -> list[date]:
+    """Encontra luas novas astronômicas em um período."""
+    ctx = ctx or default_ephemeris_context()
+    # a lunation index built from the same kernel answers without solving it
+    index = lunation_index_for(ctx.kernel)
+    if index is not None and index.covers(start_date, end_date):
+        return index.new_moons_between(start_date, end_date)
+    return _new_moons_from_table(start_date, end_date, ctx)
+
+def next_new_moon_on_or_after(start_date: date, ctx: EphemerisContext | None = None) -> date:
     """Próxima lua nova astronômica em ou após a data especificada."""
-    # search 2 years ahead - force UTC
-    t0 = TS.utc(start_date.year, start_date.month, start_date.day)
-    t1 = TS.utc(start_date.year + 2, 12, 31)
-    f = almanac.moon_phases(Eph)
-    times, phases = almanac.find_discrete(t0, t1, f)
-    for ti, ph in zip(times, phases):
-        if ph == 0:
-            # Get UTC datetime and convert to date
-            dt_utc = ti.utc_datetime()
-            # Force date conversion in UTC
-            dt = date(dt_utc.year, dt_utc.month, dt_utc.day)
-            if dt >= start_date:
-                return dt
-    raise RuntimeError("No new moon found in search window.")
-
-def sun_moon_elongation_and_altitude_at(city_cfg: dict, when_dt_utc: datetime) -> tuple[float, float]:
-    """Calcula elongação e altitude da lua para uma cidade."""
-    # when_dt_utc: timezone-aware UTC datetime
-    t = TS.utc(when_dt_utc.year, when_dt_utc.month, when_dt_utc.day,
-               when_dt_utc.hour, when_dt_utc.minute, when_dt_utc.second)
-    sun = Eph['sun']
-    moon = Eph['moon']
-    earth = Eph['earth']
-    # Observer location
-    obs = earth + Topos(latitude_degrees=city_cfg["lat"], longitude_degrees=city_cfg["lon"])
-    # Apparent positions
-    astrometric_moon = obs.at(t).observe(moon).apparent()
-    astrometric_sun = obs.at(t).observe(sun).apparent()
+    ctx = ctx or default_ephemeris_context()
+    index = lunation_index_for(ctx.kernel)
+    if index is not None:
+        nm = index.next_new_moon_on_or_after(start_date)
+        if nm is not None:
+            return nm
+    # one lunation ahead always contains a new moon
+    new_moons = _new_moons_from_table(start_date, start_date + timedelta(days=math.ceil(SYNODIC_MONTH_DAYS)), ctx)
+    if not new_moons:
+        raise RuntimeError("No new moon found in search window.")
+    return new_moons[0]
+
+def find_lunations(start_date: date, count: int, ctx: EphemerisContext | None = None) -> list[date]:
+    """Encontra as `count` primeiras luas novas em/após a data com uma única busca."""
+    # one find_discrete over count+1 mean lunations covers the first new moon
+    # (up to one lunation away) plus the worst-case drift of true conjunctions
+    end_date = start_date + timedelta(days=math.ceil((count + 1) * SYNODIC_MONTH_DAYS))
+    new_moons = find_new_moons_window(start_date, end_date, ctx)
+    if len(new_moons) < count:
+        raise RuntimeError("No new moon found in search window.")
+    return new_moons[:count]
+
+def _require_kernel(ctx: EphemerisContext) -> None:
+    """Garante que o contexto tem um kernel (posições topocêntricas)."""
+    if ctx.eph is None:
+        raise ValueError(f"{ctx.name} não calcula posições topocêntricas; a heurística de visibilidade requer uma efeméride JPL")
+
+def _elongation_and_altitude(city_cfg: dict, t, ctx: EphemerisContext) -> tuple:
+    """Elongação Sol-Lua e altitude da lua para um Time escalar ou vetorial."""
+    # Observer location (the Topos is built once per location)
+    obs = ctx.eph['earth'] + observer_context(city_cfg).topos
+    # Apparent positions, both seen from the same observer position
+    position = obs.at(t)
+    astrometric_moon = position.observe(ctx.eph['moon']).apparent()
+    astrometric_sun = position.observe(ctx.eph['sun']).apparent()
     # Separation
     sep = astrometric_moon.separation_from(astrometric_sun).degrees
     # Moon altitude
     alt, az, distance = astrometric_moon.altaz()
-    alt_deg = alt.degrees
-    return sep, alt_deg
+    return sep, alt.degrees
+
+# Visibility interpolants: (ephemeris file, year, lat, lon, elevation) -> VisibilityInterpolant
+_interpolants_table: dict[tuple[str, int, float, float, float], VisibilityInterpolant] = {}
+
+# Same keys, for years whose fit crosses the end of the kernel: the error is
+# raised again without refitting the year
+_interpolant_failures: dict[tuple[str, int, float, float, float], Exception] = {}
+
+def _fit_visibility_interpolant(city_cfg: dict, year: int, ctx: EphemerisContext) -> VisibilityInterpolant:
+    """Ajusta o interpolante do ano com uma única chamada vetorial do Skyfield."""
+    days = sample_days()
+    seps, alts = _elongation_and_altitude(city_cfg, ctx.ts.utc(year, 1, [1 + d for d in days]), ctx)
+    return VisibilityInterpolant.fit(year, seps, alts)
+
+def visibility_interpolant(city_cfg: dict, year: int, ctx: EphemerisContext | None = None) -> VisibilityInterpolant:
+    """Interpolante de Chebyshev de elongação e altitude da lua no ano, ajustado uma única vez.
+
+    Guardado em memória e no cache persistente por efeméride, ano e
+    coordenadas do observador.
+
+    Args:
+        city_cfg (dict): Observador (``lat``/``lon``).
+        year (int): Ano (UTC).
+        ctx (EphemerisContext | None): Efeméride (precisa de kernel).
+
+    Raises:
+        EphemerisRangeError: Se o ano passar do fim do kernel; a falha é
+            lembrada, e as consultas seguintes do ano falham sem novo ajuste.
+    """
+    ctx = ctx or default_ephemeris_context()
+    _require_kernel(ctx)
+    elevation = city_cfg.get("elevation", 0.0)
+    key = (ctx.kernel, year, city_cfg["lat"], city_cfg["lon"], elevation)
+    interp = _interpolants_table.get(key)
+    if interp is None:
+        if key in _interpolant_failures:
+            raise _interpolant_failures[key].with_traceback(None)
+        try:
+            interp = cached("visibility_interpolant", year, ctx,
+                            lambda: _fit_visibility_interpolant(city_cfg, year, ctx),
+                            lat=city_cfg["lat"], lon=city_cfg["lon"], elevation=elevation, degree=CHEBYSHEV_DEGREE)
+        except Exception as e:
+            from skyfield.errors import EphemerisRangeError
+            if isinstance(e, EphemerisRangeError):
+                _interpolant_failures[key] = e
+            raise
+        _interpolants_table[key] = interp
+    return interp
+
+def sun_moon_elongation_and_altitude_at(city_cfg: dict, when_dt_utc: datetime, ctx: EphemerisContext | None = None,
+                                        exact: bool = True) -> tuple[float, float]:
+    """Calcula elongação e altitude da lua para uma cidade.
+
+    Por padrão usa o Skyfield diretamente, como ``first_crescent_dates``.
+    ``exact=False`` avalia o interpolante de Chebyshev do ano
+    (``visibility_interpolant``, erro de ~1e-4°, ver ``interpolants``), que
+    só compensa o ajuste (~180 ms por ano) em consultas em massa.
+    """
+    ctx = ctx or default_ephemeris_context()
+    _require_kernel(ctx)
+    if not exact:
+        try:
+            return visibility_interpolant(city_cfg, when_dt_utc.year, ctx).evaluate(when_dt_utc)
+        except Exception as e:
+            from skyfield.errors import EphemerisRangeError
+            if not isinstance(e, EphemerisRangeError):
+                raise
+            # the year crosses the end of the kernel: evaluate this instant only
+    # when_dt_utc: timezone-aware UTC datetime
+    t = ctx.ts.utc(when_dt_utc.year, when_dt_utc.month, when_dt_utc.day,
+               when_dt_utc.hour, when_dt_utc.minute, when_dt_utc.second)
+    return _elongation_and_altitude(city_cfg, t, ctx)
+
+def _crescent_check_time(cand: date, city_cfg: dict) -> datetime:
+    """Instante UTC de observação da crescente: 30 minutos após o pôr do sol local."""
+    from astral.sun import sunset
+    observer = observer_context(city_cfg)
+    # sunset of 'cand' in UTC
+    try:
+        sunset_utc = sunset(observer.astral, cand).astimezone(pytz.UTC)
+    except ValueError:
+        # fallback: use 18:00 local
+        sunset_utc = observer.tz.localize(datetime.combine(cand, dt_time(hour=18, minute=0))).astimezone(pytz.UTC)
+    # compute elongation and altitude at 20-30 minutes after sunset (safer)
+    return sunset_utc + timedelta(minutes=30)
 
-def is_first_crescent_visible_heuristic(new_moon_date: date, city_cfg: dict) -> date | None:
+def _is_crescent_visible(sep: float, alt: float) -> bool:
+    """Limiares da heurística: elongação >= 10 graus e altitude >= 3 graus."""
+    return sep >= 10 and alt >= 3
+
+# Evenings checked after each astronomical new moon: new_moon_date, +1, +2, +3
+CRESCENT_CANDIDATE_DAYS = 4
+
+def is_first_crescent_visible_heuristic(new_moon_date: date, city_cfg: dict, ctx: EphemerisContext | None = None) -> date | None:
     """Heurística para determinar visibilidade da primeira crescente."""
-    tz = pytz.timezone(city_cfg["tz"])
-    # candidate days: new_moon_date, new_moon_date+1, +2, +3
-    for delta in range(0, 4):
+    for delta in range(0, CRESCENT_CANDIDATE_DAYS):
         cand = new_moon_date + timedelta(days=delta)
-        # compute local sunset time for the city on 'cand' date
-        loc = LocationInfo(city_cfg["name"], city_cfg["region"], city_cfg["tz"], city_cfg["lat"], city_cfg["lon"])
-        try:
-            s = sun(loc.observer, date=cand)
-            sunset_local = s['sunset']  # timezone-aware local
-        except Exception:
-            # fallback: use 18:00 local
-            sunset_local = tz.localize(datetime.combine(cand, dt_time(hour=18, minute=0)))
-        # convert sunset to UTC
-        sunset_utc = sunset_local.astimezone(pytz.UTC)
-        # compute elongation and altitude at 20-30 minutes after sunset (safer)
-        check_time = sunset_utc + timedelta(minutes=30)
-        sep, alt = sun_moon_elongation_and_altitude_at(city_cfg, check_time)
-        # thresholds: elongation >= 7-10 deg, altitude >= 3 deg
-        if sep >= 10 and alt >= 3:
+        check_time = _crescent_check_time(cand, city_cfg)
+        sep, alt = sun_moon_elongation_and_altitude_at(city_cfg, check_time, ctx)
+        if _is_crescent_visible(sep, alt):
             # return the local date cand as the month start (Nissan 1 = that evening -> local date)
             return cand
     return None
 
-# ---------------- Month generation ----------------
+def first_crescent_dates(new_moon_dates: list[date], city_cfg: dict, ctx: EphemerisContext | None = None) -> list[date | None]:
+    """Heurística de visibilidade em lote: todas as noites candidatas em uma única chamada Skyfield."""
+    candidates = [nm + timedelta(days=delta)
+                  for nm in new_moon_dates for delta in range(CRESCENT_CANDIDATE_DAYS)]
+    if not candidates:
+        return []
+    ctx = ctx or default_ephemeris_context()
+    _require_kernel(ctx)
+    check_times = [_crescent_check_time(cand, city_cfg) for cand in candidates]
+    # same second-resolution instants as the scalar path, as one Time array
+    t = ctx.ts.utc([ct.year for ct in check_times], [ct.month for ct in check_times],
+               [ct.day for ct in check_times], [ct.hour for ct in check_times],
+               [ct.minute for ct in check_times], [ct.second for ct in check_times])
+    seps, alts = _elongation_and_altitude(city_cfg, t, ctx)
+    out = []
+    for i in range(len(new_moon_dates)):
+        visible = None
+        for j in range(i * CRESCENT_CANDIDATE_DAYS, (i + 1) * CRESCENT_CANDIDATE_DAYS):
+            if _is_crescent_visible(seps[j], alts[j]):
+                visible = candidates[j]
+                break
+        out.append(visible)
+    return out
 
-def generate_biblical_months_dynamic(reference_year: int, use_visibility_heuristic: bool = False) -> tuple[pd.DataFrame, bool, date]:
-    """Gera meses bíblicos dinâmicos para um ano."""
-    equinox = get_march_equinox(reference_year)
-    # find first astronomical new moon on/after equinox
-    nissan_astro = next_new_moon_on_or_after(equinox)
-    # if using heuristic visibility, try to determine visible date for Nissan
-    if use_visibility_heuristic:
-        vis = is_first_crescent_visible_heuristic(nissan_astro, JERUSALEM)
-        if vis is not None:
-            nissan_start = vis
-        else:
-            nissan_start = nissan_astro
-    else:
-        nissan_start = nissan_astro
+# ---------------- Month generation ----------------
 
-    # collect successive astronomical new moons (14+) to detect embolismic
-    new_moons = [nissan_astro]
-    cursor = nissan_astro + timedelta(days=1)
-    for _ in range(14):
-        nm = next_new_moon_on_or_after(cursor)
-        new_moons.append(nm)
-        cursor = nm + timedelta(days=1)
+def build_biblical_months(new_moons: list[date], use_visibility_heuristic: bool = False, ctx: EphemerisContext | None = None,
+                          crescents: dict[date, date | None] | None = None) -> tuple[list[dict], bool]:
+    """Constrói os meses bíblicos a partir da lista ordenada de luas novas.
 
+    ``crescents`` (lua nova -> primeira crescente visível) permite reaproveitar
+    a heurística já calculada em lote para vários anos.
+    """
+    nissan_astro = new_moons[0]
     # count new moons within ~370 days -> embolismic if >=13
     limit = nissan_astro + timedelta(days=370)
     count = sum(1 for nm in new_moons if nm <= limit)
     embolismic = (count >= 13)
 
-    # Now build months using astronomical new moons, but shift start to visible date if heuristic True
+    # Build months using astronomical new moons, but shift start to visible date if heuristic True
+    n_months = 13 if embolismic else 12
+    if use_visibility_heuristic and crescents is not None:
+        visible = [crescents[nm] for nm in new_moons[:n_months]]
+    elif use_visibility_heuristic:
+        # local visible dates for every month, evaluated in one batched call
+        visible = first_crescent_dates(new_moons[:n_months], JERUSALEM, ctx)
     months = []
-    # prepare names sequence
-    if embolismic:
-        # will have 13 months: Nissan..Shevat, Adar I, Adar II
-        for i in range(13):
-            astro_start = new_moons[i]
-            # If using visibility rule, compute local visible date for this astro new moon
-            if use_visibility_heuristic:
-                vis = is_first_crescent_visible_heuristic(astro_start, JERUSALEM)
-                start_date = vis if vis is not None else astro_start
-            else:
-                start_date = astro_start
-            end_date = new_moons[i+1] - timedelta(days=1)
-            # name mapping: 0..10 -> MONTH_NAMES[0..10]; 11->Adar I, 12->Adar II
-            if i < 11:
-                name = MONTH_NAMES[i]
-            elif i == 11:
-                name = "Adar I"
-            else:
-                name = "Adar II"
-            months.append({"index": i+1, "name": name, "start": start_date, "end": end_date, "days": (end_date - start_date).days + 1})
-    else:
-        for i in range(12):
-            astro_start = new_moons[i]
-            if use_visibility_heuristic:
-                vis = is_first_crescent_visible_heuristic(astro_start, JERUSALEM)
-                start_date = vis if vis is not None else astro_start
-            else:
-                start_date = astro_start
-            end_date = new_moons[i+1] - timedelta(days=1)
+    for i in range(n_months):
+        astro_start = new_moons[i]
+        if use_visibility_heuristic:
+            start_date = visible[i] if visible[i] is not None else astro_start
+        else:
+            start_date = astro_start
+        end_date = new_moons[i+1] - timedelta(days=1)
+        # name mapping: 0..10 -> MONTH_NAMES[0..10]; 11->Adar I, 12->Adar II (embolismic only)
+        if not embolismic or i < 11:
             name = MONTH_NAMES[i]
-            months.append({"index": i+1, "name": name, "start": start_date, "end": end_date, "days": (end_date - start_date).days + 1})
+        elif i == 11:
+            name = "Adar I"
+        else:
+            name = "Adar II"
+        months.append({"index": i+1, "name": name, "start": start_date, "end": end_date, "days": (end_date - start_date).days + 1})
+    return months, embolismic
+
+def generate_month_table(reference_year: int, use_visibility_heuristic: bool = False, ctx: EphemerisContext | None = None) -> MonthTable:
+    """Gera os meses bíblicos de um ano como ``MonthTable`` (sem pandas)."""
+    ctx = ctx or default_ephemeris_context()
+    
+    def compute():
+        equinox = get_march_equinox(reference_year, ctx)
+        # all new moons from the first one on/after the equinox, in a single search
+        new_moons = find_lunations(equinox, LUNATIONS_PER_YEAR, ctx)
+        return build_biblical_months(new_moons, use_visibility_heuristic, ctx)
+    
+    months, embolismic = cached("months", reference_year, ctx, compute, visibility=use_visibility_heuristic)
+    return MonthTable.from_months(months, embolismic)
 
-    df = pd.DataFrame(months)
-    # Ensure Nissan start returned is the mapped start (visible or astro)
-    nissan_mapped_start = df.iloc[0]["start"] if not df.empty else nissan_start
-    return df, embolismic, nissan_mapped_start
+def generate_biblical_months_dynamic(reference_year: int, use_visibility_heuristic: bool = False, ctx: EphemerisContext | None = None) -> tuple[pd.DataFrame, bool, date]:
+    """Gera meses bíblicos dinâmicos para um ano."""
+    table = generate_month_table(reference_year, use_visibility_heuristic, ctx)
+    # Nissan start returned is the mapped start (visible or astro)
+    return table.to_dataframe(), table.embolismic, table.nissan_start
+
+def generate_biblical_months_range(start_year: int, end_year: int, use_visibility_heuristic: bool = False, ctx: EphemerisContext | None = None) -> pd.DataFrame:
+    """Gera os meses bíblicos de vários anos com uma única busca de lunações.
+
+    Equinócios e luas novas do intervalo inteiro são resolvidos uma vez e
+    fatiados por ano; a heurística de visibilidade, se ativa, também é avaliada
+    em um único lote. Os meses de cada ano são idênticos aos de
+    ``generate_biblical_months_dynamic``.
+
+    Args:
+        start_year (int): Primeiro ano (inclusivo).
+        end_year (int): Último ano (inclusivo).
+        use_visibility_heuristic (bool): Usa a primeira crescente visível em Jerusalém.
+        ctx (EphemerisContext | None): Efeméride de todos os anos. Padrão: a de
+            ``ephemeris_context(year)`` para cada ano (ver ``ephemeris_runs``),
+            com uma busca por trecho de anos com o mesmo kernel.
+
+    Returns:
+        pd.DataFrame: Uma linha por mês, com as colunas ``year``, ``embolismic``,
+        ``index``, ``name``, ``start``, ``end`` e ``days``.
+    """
+    import pandas as pd
+    if end_year < start_year:
+        raise ValueError("end_year deve ser maior ou igual a start_year")
+    runs = [(ctx, start_year, end_year)] if ctx is not None else ephemeris_runs(start_year, end_year)
+    columns = {"year": [], "embolismic": [], "index": [], "name": [], "start": [], "end": [], "days": []}
+    for run_ctx, first, last in runs:
+        for year, (months, embolismic) in _months_by_year(first, last, use_visibility_heuristic, run_ctx).items():
+            for month in months:
+                columns["year"].append(year)
+                columns["embolismic"].append(embolismic)
+                for key in ("index", "name", "start", "end", "days"):
+                    columns[key].append(month[key])
+    return pd.DataFrame(columns)
+
+def generate_month_tables_range(start_year: int, end_year: int, use_visibility_heuristic: bool = False,
+                                ctx: EphemerisContext | None = None) -> dict[int, MonthTable]:
+    """Gera a ``MonthTable`` de cada ano de um intervalo com uma única busca de lunações.
+
+    Anos já guardados no cache persistente são lidos dele; os que faltam são
+    resolvidos juntos, como em ``generate_biblical_months_range``, e gravados
+    no cache com a mesma chave de ``generate_month_table``.
+
+    Args:
+        start_year (int): Primeiro ano (inclusivo).
+        end_year (int): Último ano (inclusivo).
+        use_visibility_heuristic (bool): Usa a primeira crescente visível em Jerusalém.
+        ctx (EphemerisContext | None): Efeméride de todos os anos. Padrão: a de
+            ``ephemeris_context(year)`` para cada ano (ver ``ephemeris_runs``),
+            com uma busca por trecho de anos com o mesmo kernel.
+
+    Returns:
+        dict[int, MonthTable]: Meses de cada ano, em ordem de ano.
+    """
+    if end_year < start_year:
+        raise ValueError("end_year deve ser maior ou igual a start_year")
+    if ctx is None:
+        tables = {}
+        for run_ctx, first, last in ephemeris_runs(start_year, end_year):
+            tables.update(generate_month_tables_range(first, last, use_visibility_heuristic, run_ctx))
+        return tables
+    found = {}
+    cache = get_calendar_cache()
+    if cache is not None:
+        keys = {year: cache.key("months", year, ctx, visibility=use_visibility_heuristic)
+                for year in range(start_year, end_year + 1)}
+        stored = cache.get_many(keys.values())
+        found = {year: stored[key] for year, key in keys.items() if key in stored}
+    absent = [year for year in range(start_year, end_year + 1) if year not in found]
+    if absent:
+        solved = _months_by_year(absent[0], absent[-1], use_visibility_heuristic, ctx)
+        for year in absent:
+            found[year] = solved[year]
+            if cache is not None:
+                cache.put(keys[year], solved[year])
+    return {year: MonthTable.from_months(*found[year]) for year in range(start_year, end_year + 1)}
+
+def _months_by_year(start_year: int, end_year: int, use_visibility_heuristic: bool,
+                    ctx: EphemerisContext) -> dict[int, tuple[list[dict], bool]]:
+    """Meses e ano embolísmico de cada ano, a partir de uma única busca de lunações."""
+    # equinoxes come from the seasons table (blocks of SEASONS_BLOCK_YEARS), so
+    # they do not depend on the requested range
+    equinoxes = {year: get_march_equinox(year, ctx) for year in range(start_year, end_year + 1)}
+    # same window find_lunations would use for the last year
+    last_day = equinoxes[end_year] + timedelta(days=math.ceil((LUNATIONS_PER_YEAR + 1) * SYNODIC_MONTH_DAYS))
+    new_moons = find_new_moons_window(equinoxes[start_year], last_day, ctx)
+    crescents = None
+    if use_visibility_heuristic:
+        crescents = dict(zip(new_moons, first_crescent_dates(new_moons, JERUSALEM, ctx)))
+
+    out = {}
+    for year, equinox in equinoxes.items():
+        first = bisect.bisect_left(new_moons, equinox)
+        year_moons = new_moons[first:first + LUNATIONS_PER_YEAR]
+        if len(year_moons) < LUNATIONS_PER_YEAR:
+            raise RuntimeError("No new moon found in search window.")
+        out[year] = build_biblical_months(year_moons, use_visibility_heuristic, ctx, crescents)
+    return out
 
 # ---------------- Festival mapping & ICS export ----------------
 
-def map_festivals_to_dates(months_df: pd.DataFrame, festivals_dict: dict) -> list[dict]:
+def map_festivals_to_dates(months_df: MonthTable | pd.DataFrame, festivals_dict: dict) -> list[dict]:
     """Mapeia festivais para datas específicas."""
     out = []
+    if isinstance(months_df, MonthTable):
+        for fname, (midx, day) in festivals_dict.items():
+            start = months_df.start_of(midx)
+            if start is not None:
+                out.append({"name": fname, "date": start + timedelta(days=day-1)})
+        return out
     for fname, (midx, day) in festivals_dict.items():
         row = months_df[months_df["index"] == midx]
         if not row.empty:
@@ -371,6 +651,12 @@ def map_festivals_to_dates(months_df: pd.DataFrame, festivals_dict: dict) -> lis
 
 def export_events_to_ics(event_list: list[dict], filename: str) -> None:
     """Exporta lista de eventos para arquivo ICS."""
+    with open(filename, 'wb') as f:
+        f.write(events_to_ics(event_list))
+
+def events_to_ics(event_list: list[dict]) -> bytes:
+    """Serializa a lista de eventos como calendário ICS."""
+    from icalendar import Calendar, Event
     cal = Calendar()
     cal.add('prodid', '-//Biblical Lunisolar Calendar//')
     cal.add('version', '2.0')
@@ -384,49 +670,87 @@ def export_events_to_ics(event_list: list[dict], filename: str) -> None:
         if ev.get('description'):
             ical.add('description', ev['description'])
         cal.add_component(ical)
-    with open(filename, 'wb') as f:
-        f.write(cal.to_ical())
+    return cal.to_ical()
 
 # ---------------- Seasons & sun events ----------------
 
-def compute_seasons_for_year(year: int) -> list[dict]:
+SEASON_NAMES = {0: "March Equinox", 1: "June Solstice", 2: "September Equinox", 3: "December Solstice"}
+
+# Season in each hemisphere after each astronomical event
+SEASON_HEMISPHERES = {
+    "March Equinox": {"jerusalem": "Primavera", "sao_paulo": "Outono"},
+    "June Solstice": {"jerusalem": "Verão", "sao_paulo": "Inverno"},
+    "September Equinox": {"jerusalem": "Outono", "sao_paulo": "Primavera"},
+    "December Solstice": {"jerusalem": "Inverno", "sao_paulo": "Verão"}
+}
+
+# Years solved together when a year is missing from the seasons table
+SEASONS_BLOCK_YEARS = 10
+
+# Seasons table: (ephemeris file, year) -> seasons of that year, shared by
+# get_march_equinox and compute_seasons_for_year
+_seasons_table: dict[tuple[str, int], list[dict]] = {}
+
+def compute_seasons_for_years(start_year: int, end_year: int, ctx: EphemerisContext | None = None) -> dict[int, list[dict]]:
+    """Calcula equinócios e solstícios de um intervalo de anos com uma única busca."""
+    ctx = ctx or default_ephemeris_context()
+    out = {year: [] for year in range(start_year, end_year + 1)}
+    if is_analytic(ctx):
+        for year, events in analytic.seasons_for_years(start_year, end_year).items():
+            out[year] = [{"event": SEASON_NAMES[ev], "utc": utc} for utc, ev in events]
+    else:
+        from skyfield import almanac
+        t0 = ctx.ts.utc(start_year, 1, 1)
+        t1 = ctx.ts.utc(end_year + 1, 1, 1)
+        times, events = almanac.find_discrete(t0, t1, almanac.seasons(ctx.eph))
+        for ti, ev in zip(times, events):
+            utc = ti.utc_datetime().replace(tzinfo=timezone.utc)
+            out[utc.year].append({"event": SEASON_NAMES[ev], "utc": utc})
+    for year, seasons in out.items():
+        _seasons_table[(ctx.kernel, year)] = seasons
+    return {year: [dict(season) for season in seasons] for year, seasons in out.items()}
+
+def _seasons_of(year: int, ctx: EphemerisContext) -> list[dict]:
+    """Estações do ano pela tabela, resolvendo o bloco de anos na primeira consulta."""
+    key = (ctx.kernel, year)
+    if key not in _seasons_table:
+        block_start = year - year % SEASONS_BLOCK_YEARS
+        try:
+            compute_seasons_for_years(block_start, block_start + SEASONS_BLOCK_YEARS - 1, ctx)
+        except Exception as e:
+            from skyfield.errors import EphemerisRangeError
+            if not isinstance(e, EphemerisRangeError):
+                raise
+            # block crosses the end of the kernel: solve just the requested year
+            compute_seasons_for_years(year, year, ctx)
+    return _seasons_table[key]
+
+def compute_seasons_for_year(year: int, ctx: EphemerisContext | None = None) -> list[dict]:
     """Calcula as estações astronômicas para um ano."""
-    t0 = TS.utc(year, 1, 1)
-    t1 = TS.utc(year, 12, 31)
-    times, events = almanac.find_discrete(t0, t1, almanac.seasons(Eph))
-    mapping = {0: "March Equinox", 1: "June Solstice", 2: "September Equinox", 3: "December Solstice"}
-    out = []
-    for ti, ev in zip(times, events):
-        out.append({"event": mapping[ev], "utc": ti.utc_datetime().replace(tzinfo=timezone.utc)})
-    return out
+    ctx = ctx or default_ephemeris_context()
+    return cached("seasons", year, ctx, lambda: [dict(season) for season in _seasons_of(year, ctx)])
 
 def sunrise_sunset(location_cfg: dict, target_date: date) -> dict:
-    """Calcula nascer e pôr do sol para uma localização e data."""
-    loc = LocationInfo(location_cfg["name"], location_cfg["region"], location_cfg["tz"], location_cfg["lat"], location_cfg["lon"])
-    try:
-        s = sun(loc.observer, date=target_date)
-        return {"sunrise": s["sunrise"].astimezone(pytz.timezone(location_cfg["tz"])),
-                "sunset": s["sunset"].astimezone(pytz.timezone(location_cfg["tz"]))}
-    except Exception:
-        return {"sunrise": None, "sunset": None}
-
-def get_moon_phases_for_year(year: int) -> list[dict]:
-    """Obtém todas as fases da lua para um ano."""
-    t0 = TS.utc(year, 1, 1)
-    t1 = TS.utc(year, 12, 31)
-    f = almanac.moon_phases(Eph)
-    times, phases = almanac.find_discrete(t0, t1, f)
-    phase_names = {0: "🌑", 1: "🌓", 2: "🌕", 3: "🌗"}
-    phase_labels = {0: "Nova", 1: "Crescente", 2: "Cheia", 3: "Minguante"}
-    out = []
-    for ti, ph in zip(times, phases):
-        out.append({
-            "date": ti.utc_datetime().date(),
-            "phase": ph,
-            "icon": phase_names[ph],
-            "name": phase_labels[ph]
-        })
-    return out
+    """Calcula nascer e pôr do sol para uma localização e data (dia local).
+
+    Para todos os dias de um ano ou vários locais, use ``sun_times_for_year``.
+    """
+    from astral.sun import sunrise, sunset
+    observer = observer_context(location_cfg)
+    times = {}
+    for key, func in (("sunrise", sunrise), ("sunset", sunset)):
+        try:
+            times[key] = func(observer.astral, target_date, observer.tz)
+        except ValueError:
+            # polar day or night: the sun does not cross the horizon
+            times[key] = None
+    return times
+
+def get_moon_phases_for_year(year: int, ctx: EphemerisContext | None = None) -> list[dict]:
+    """Obtém todas as fases da lua para um ano (de 1º de janeiro ao ano seguinte)."""
+    ctx = ctx or default_ephemeris_context()
+    return [{"date": utc.date(), "phase": ph, "icon": PHASE_ICONS[ph], "name": PHASE_LABELS[ph]}
+            for utc, ph in _phases_of(year, ctx)]
 
 # ---------------- Core Calendar Class ----------------
 
@@ -435,102 +759,111 @@ class BiblicalCalendarCore:
     
     def __init__(self):
         """Inicializa o calendário core."""
-        self.months_df = None
+        self.months = None
         self.embolismic = False
         self.nissan_start = None
-        self.current_ephemeris_name = CURRENT_EPHEMERIS
+        self.current_ephemeris_name = None
         self.seasons = []
         self.moon_phases = []
+        # per-year indexes built by generate_calendar
+        self._events_by_day: dict[int, list[dict]] = {}
+        self._season_starts: list[int] = []
     
     def generate_calendar(self, year: int, use_visibility_heuristic: bool = False, force_academic: bool = False) -> dict:
         """Gera calendário completo para um ano."""
-        # Load optimal ephemeris
+        # Ephemeris context for this calendar only
         try:
-            eph, eph_name = load_optimal_ephemeris(year, force_academic=force_academic)
-            self.current_ephemeris_name = eph_name
+            ctx = ephemeris_context(year, force_academic=force_academic)
+            self.current_ephemeris_name = ctx.name
         except Exception as e:
             raise RuntimeError(f"Falha ao carregar efeméride: {e}")
         
         # Generate months
-        df, embol, nissan = generate_biblical_months_dynamic(year, use_visibility_heuristic)
-        self.months_df = df
-        self.embolismic = embol
-        self.nissan_start = nissan
+        table = generate_month_table(year, use_visibility_heuristic, ctx)
+        self.months = table
+        self.embolismic = embol = table.embolismic
+        self.nissan_start = nissan = table.nissan_start
         
         # Generate festivals
-        combined = FESTIVALS_DEF.copy()
-        combined.update(YESHUA_EVENTS_DEF)
-        festivals = map_festivals_to_dates(df, combined)
+        festivals = cached("festivals", year, ctx, lambda: map_festivals_to_dates(table, ALL_EVENTS_DEF),
+                           visibility=use_visibility_heuristic)
         
         # Generate seasons
-        self.seasons = compute_seasons_for_year(year)
+        self.seasons = compute_seasons_for_year(year, ctx)
         
         # Generate moon phases
-        self.moon_phases = get_moon_phases_for_year(year)
+        self.moon_phases = get_moon_phases_for_year(year, ctx)
+        
+        self._build_day_index()
         
         return {
-            "months": df.to_dict('records'),
+            "months": table.to_records(),
             "festivals": festivals,
             "seasons": self.seasons,
             "moon_phases": self.moon_phases,
             "embolismic": embol,
             "nissan_start": nissan.isoformat(),
-            "ephemeris": eph_name,
+            "ephemeris": ctx.name,
             "year": year
         }
     
+    def _build_day_index(self) -> None:
+        """Indexa eventos por dia ordinal e os inícios das estações do ano gerado."""
+        events_by_day = {}
+        
+        # Festivals: only days that really are (month, day) in the table
+        for fname, (midx, fday) in ALL_EVENTS_DEF.items():
+            start = self.months.start_of(midx)
+            if start is None:
+                continue
+            ordinal = start.toordinal() + fday - 1
+            if self.months.position_for_ordinal(ordinal) != midx - 1:
+                continue
+            portuguese_name = FESTIVAL_TRANSLATIONS.get(fname, fname)
+            events_by_day.setdefault(ordinal, []).append({
+                "type": "festival",
+                "name": f"{fname} ({portuguese_name})",
+                "description": FESTIVAL_DESCRIPTIONS.get(fname, "")
+            })
+        
+        # Moon phases
+        for phase in self.moon_phases:
+            events_by_day.setdefault(phase["date"].toordinal(), []).append({
+                "type": "moon_phase",
+                "name": f"{phase['icon']} Lua {phase['name']}",
+                "description": FESTIVAL_DESCRIPTIONS.get(f"Lua {phase['name']}", "")
+            })
+        
+        # Seasons
+        for season in self.seasons:
+            events_by_day.setdefault(season["utc"].date().toordinal(), []).append({
+                "type": "season",
+                "name": f"🌍 {season['event']}",
+                "description": ""
+            })
+        
+        self._events_by_day = events_by_day
+        # season starts are chronological, so the current season is found by bisection
+        self._season_starts = [season["utc"].date().toordinal() for season in self.seasons]
+    
+    @property
+    def months_df(self) -> pd.DataFrame | None:
+        """Meses do calendário gerado como DataFrame (criado sob demanda)."""
+        return self.months.to_dataframe() if self.months is not None else None
+    
     def get_day_events(self, target_date: date) -> dict:
         """Obtém eventos para um dia específico."""
-        if self.months_df is None:
+        if self.months is None:
             return {"events": [], "season": None, "chronologies": {}}
         
         # Find month and day
-        month_info = None
-        day_in_month = None
-        
-        for _, row in self.months_df.iterrows():
-            if row["start"] <= target_date <= row["end"]:
-                month_info = row
-                day_in_month = (target_date - row["start"]).days + 1
-                break
-        
-        if not month_info:
+        found = self.months.month_for_date(target_date)
+        if found is None:
             return {"events": [], "season": None, "chronologies": {}}
+        month_info, day_in_month = found
         
-        events = []
-        
-        # Check festivals
-        combined = FESTIVALS_DEF.copy()
-        combined.update(YESHUA_EVENTS_DEF)
-        
-        for fname, (midx, fday) in combined.items():
-            if midx == month_info["index"] and fday == day_in_month:
-                portuguese_name = FESTIVAL_TRANSLATIONS.get(fname, fname)
-                description = FESTIVAL_DESCRIPTIONS.get(fname, "")
-                events.append({
-                    "type": "festival",
-                    "name": f"{fname} ({portuguese_name})",
-                    "description": description
-                })
-        
-        # Check moon phases
-        for phase in self.moon_phases:
-            if phase["date"] == target_date:
-                description = FESTIVAL_DESCRIPTIONS.get(f"Lua {phase['name']}", "")
-                events.append({
-                    "type": "moon_phase",
-                    "name": f"{phase['icon']} Lua {phase['name']}",
-                    "description": description
-                })
-        
-        # Check seasons
-        for season in self.seasons:
-            if season["utc"].date() == target_date:
-                events.append({
-                    "type": "season",
-                    "name": f"🌍 {season['event']}",
-                    "description": ""
-                })
+        # Festivals, moon phases and seasons of the day
+        events = [dict(event) for event in self._events_by_day.get(target_date.toordinal(), ())]
         
         # Current season
         season_info = self._get_current_season(target_date)
@@ -548,7 +881,7 @@ class BiblicalCalendarCore:
             "season": season_info,
             "chronologies": chronologies,
             "month_info": {
-                "name": month_info["name"] if month_info else "",
+                "name": month_info.name,
                 "day": day_in_month
             }
         }
@@ -558,29 +891,7 @@ class BiblicalCalendarCore:
         if not self.seasons:
             return None
         
-        current_season = None
-        for i, season in enumerate(self.seasons):
-            season_date = season['utc'].date()
-            if i < len(self.seasons) - 1:
-                next_season_date = self.seasons[i + 1]['utc'].date()
-                if season_date <= target_date < next_season_date:
-                    current_season = season['event']
-                    break
-            else:
-                if season_date <= target_date:
-                    current_season = season['event']
-                    break
-        
-        if not current_season and self.seasons:
-            current_season = "December Solstice"
-        
-        if current_season:
-            season_map = {
-                "March Equinox": {"jerusalem": "Primavera", "sao_paulo": "Outono"},
-                "June Solstice": {"jerusalem": "Verão", "sao_paulo": "Inverno"},
-                "September Equinox": {"jerusalem": "Outono", "sao_paulo": "Primavera"},
-                "December Solstice": {"jerusalem": "Inverno", "sao_paulo": "Verão"}
-            }
-            return season_map.get(current_season, {"jerusalem": "N/A", "sao_paulo": "N/A"})
-        
-        return None
\ No newline at end of file
+        i = bisect.bisect_right(self._season_starts, target_date.toordinal()) - 1
+        # before the March equinox it is still the previous December solstice
+        current_season = self.seasons[i]["event"] if i >= 0 else "December Solstice"
+        return SEASON_HEMISPHERES.get(current_season, {"jerusalem": "N/A", "sao_paulo": "N/A"})
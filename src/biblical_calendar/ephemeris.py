@@ -0,0 +1,211 @@
+"""Ephemeris Registry - Registro thread-safe de efemérides.
+
+Carrega cada kernel JPL uma única vez e entrega contextos imutáveis por
+requisição (``EphemerisContext``), em vez de reatribuir variáveis globais do
+módulo. Um orçamento de memória configurável limita os kernels mantidos em
+cache, descartando os menos usados recentemente (DE440 ocupa ~128 MB).
+
+Exemplo:
+    >>> ctx = get_registry().context(2025)
+    >>> ctx.name
+    'DE421 (Padrão)'
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import os
+import threading
+import weakref
+
+# Environment variable with the kernel cache budget in megabytes
+EPHEMERIS_BUDGET_ENV = "BIBLICAL_CALENDAR_EPHEMERIS_BUDGET_MB"
+DEFAULT_BUDGET_MB = 256
+
+# Approximate kernel sizes, used when the file size is not available
+KERNEL_SIZES_MB = {"de421.bsp": 17, "de430.bsp": 128, "de440.bsp": 128}
+
+
+@dataclass(frozen=True)
+class EphemerisContext:
+    """Contexto imutável de efeméride usado por uma requisição.
+
+    Attributes:
+        name (str): Nome de exibição (ex.: "DE421 (Padrão)").
+        kernel (str): Arquivo do kernel JPL (ex.: "de421.bsp").
+        eph (object): Kernel Skyfield carregado.
+        ts (object): Timescale Skyfield compartilhado.
+    """
+
+    name: str
+    kernel: str
+    eph: object
+    ts: object
+
+
+def select_kernels(year: int, force_academic: bool = False) -> tuple[list[tuple[str, str]], str]:
+    """Kernels candidatos (em ordem de preferência) para o ano.
+
+    Args:
+        year (int): Ano para o qual calcular.
+        force_academic (bool): Se True, força uso de DE440 para máxima precisão.
+
+    Returns:
+        tuple[list[tuple[str, str]], str]: Pares (kernel, nome) e a mensagem de
+        erro usada se nenhum deles puder ser carregado.
+    """
+    # Modo acadêmico sempre usa DE440
+    if force_academic:
+        return ([("de440.bsp", "DE440 (Modo Acadêmico)"), ("de430.bsp", "DE430 (Fallback Acadêmico)")],
+                "Modo acadêmico requer DE440/DE430")
+    # DE421 para anos "normais" (1900-2050)
+    if year <= 2050:
+        return ([("de421.bsp", "DE421 (Padrão)"), ("de440.bsp", "DE440 (Fallback)")],
+                "Não foi possível carregar efeméride adequada")
+    # DE440 para anos > 2050
+    return ([("de440.bsp", "DE440 (Ano > 2050)"), ("de430.bsp", "DE430 (Fallback)")],
+            "Anos > 2050 requerem DE440/DE430")
+
+
+class EphemerisRegistry:
+    """Registro de kernels carregados com orçamento de memória e descarte LRU.
+
+    Kernels descartados continuam válidos para os contextos que ainda os usam;
+    o registro apenas deixa de mantê-los vivos. Se um kernel descartado ainda
+    estiver em uso quando for pedido de novo, a mesma instância é reaproveitada.
+
+    Attributes:
+        budget_bytes (int): Orçamento de memória para kernels em cache.
+    """
+
+    def __init__(self, budget_mb: float | None = None, loader: object = None):
+        """Inicializa o registro.
+
+        Args:
+            budget_mb (float | None): Orçamento em MB. Padrão: variável de
+                ambiente ``BIBLICAL_CALENDAR_EPHEMERIS_BUDGET_MB`` ou 256.
+            loader (object): Carregador Skyfield (padrão: ``skyfield.api.load``).
+        """
+        if budget_mb is None:
+            budget_mb = float(os.environ.get(EPHEMERIS_BUDGET_ENV, DEFAULT_BUDGET_MB))
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        if loader is None:
+            # skyfield is imported here so that importing this module stays cheap
+            from skyfield import api
+            loader = api.load
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._kernels: OrderedDict[str, object] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._live = weakref.WeakValueDictionary()
+        self._ts = None
+
+    @property
+    def ts(self) -> object:
+        """Timescale compartilhado, criado na primeira chamada."""
+        if self._ts is None:
+            with self._lock:
+                if self._ts is None:
+                    self._ts = self._loader.timescale()
+        return self._ts
+
+    def loaded(self) -> list[str]:
+        """Kernels atualmente mantidos em cache (do menos ao mais recente)."""
+        with self._lock:
+            return list(self._kernels)
+
+    def get(self, kernel: str) -> object:
+        """Retorna o kernel, carregando-o uma única vez.
+
+        Args:
+            kernel (str): Nome do arquivo (ex.: "de440.bsp").
+
+        Returns:
+            object: Kernel Skyfield.
+        """
+        with self._lock:
+            eph = self._touch(kernel)
+            if eph is not None:
+                return eph
+            load_lock = self._load_locks.setdefault(kernel, threading.Lock())
+        # load outside the registry lock so other kernels stay available
+        with load_lock:
+            with self._lock:
+                eph = self._touch(kernel)
+                if eph is not None:
+                    return eph
+            eph = self._loader(kernel)
+            with self._lock:
+                self._store(kernel, eph)
+            return eph
+
+    def context(self, year: int, force_academic: bool = False) -> EphemerisContext:
+        """Contexto com a efeméride mais adequada para o ano.
+
+        Args:
+            year (int): Ano para o qual calcular.
+            force_academic (bool): Se True, força uso de DE440 para máxima precisão.
+
+        Returns:
+            EphemerisContext: Contexto imutável para a requisição.
+
+        Raises:
+            RuntimeError: Se nenhuma efeméride adequada puder ser carregada.
+        """
+        candidates, message = select_kernels(year, force_academic)
+        first_error = None
+        for kernel, name in candidates:
+            try:
+                return self.context_for(kernel, name)
+            except Exception as e:
+                first_error = first_error or e
+        raise RuntimeError(f"{message}. Erro: {first_error}")
+
+    def context_for(self, kernel: str, name: str | None = None) -> EphemerisContext:
+        """Contexto para um kernel específico."""
+        return EphemerisContext(name or kernel, kernel, self.get(kernel), self.ts)
+
+    def _touch(self, kernel: str) -> object | None:
+        """Kernel em cache (marcado como recente) ou ainda vivo em algum contexto."""
+        if kernel in self._kernels:
+            self._kernels.move_to_end(kernel)
+            return self._kernels[kernel]
+        eph = self._live.get(kernel)
+        if eph is not None:
+            self._store(kernel, eph)
+        return eph
+
+    def _store(self, kernel: str, eph: object) -> None:
+        """Guarda o kernel como mais recente e aplica o orçamento de memória."""
+        self._kernels[kernel] = eph
+        self._kernels.move_to_end(kernel)
+        self._live[kernel] = eph
+        self._sizes[kernel] = self._kernel_size(kernel, eph)
+        # evict least recently used kernels, always keeping the newest one
+        while len(self._kernels) > 1 and sum(self._sizes[k] for k in self._kernels) > self.budget_bytes:
+            self._kernels.popitem(last=False)
+
+    @staticmethod
+    def _kernel_size(kernel: str, eph: object) -> int:
+        """Tamanho do kernel em bytes (arquivo em disco ou estimativa)."""
+        try:
+            return os.path.getsize(eph.path)
+        except (AttributeError, OSError, TypeError):
+            return KERNEL_SIZES_MB.get(kernel, 128) * 1024 * 1024
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> EphemerisRegistry:
+    """Registro global do processo, criado na primeira chamada."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = EphemerisRegistry()
+    return _registry
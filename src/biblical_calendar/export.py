@@ -0,0 +1,267 @@
+"""Export - Exportação em fluxo de intervalos de anos.
+
+Gera o CSV e o ICS (RFC 5545) de um intervalo arbitrário de anos bíblicos ano a
+ano, por meio de geradores: a memória usada não depende do tamanho do intervalo
+e a saída pode ir direto para uma resposta HTTP ou um arquivo, sem arquivos
+temporários.
+
+O ICS é escrito diretamente como texto (sem montar objetos ``icalendar``), com
+UIDs estáveis, escape de texto e dobra de linhas em 75 octetos.
+
+Cada ano usa a mesma efeméride e o mesmo cache da geração anual, então as
+linhas de um ano são idênticas às de uma exportação só daquele ano.
+
+Exemplo:
+    >>> with open("calendario.csv", "w", newline="") as f:
+    ...     f.writelines(iter_calendar_csv(2000, 2100, include_phases=True))
+    >>> with open("festivais.ics", "w", newline="", encoding="utf-8") as f:
+    ...     f.writelines(iter_calendar_ics(2000, 2100))
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from __future__ import annotations
+
+import csv
+from datetime import datetime, timedelta, timezone
+import io
+import re
+import typing
+import unicodedata
+
+from .calendar_core import (
+    ALL_EVENTS_DEF,
+    ephemeris_context,
+    generate_month_table,
+    get_moon_phases_for_year,
+    map_festivals_to_dates,
+)
+from .month_table import MonthTable
+
+# Columns of the range CSV; month_index/day give the biblical date of each row
+CSV_COLUMNS = ("year", "type", "name", "month_index", "day", "start", "end", "days")
+
+# Same PRODID as events_to_ics; UIDs are "<id>@ICS_UID_DOMAIN"
+ICS_PRODID = "-//Biblical Lunisolar Calendar//"
+ICS_UID_DOMAIN = "biblical-calendar"
+
+# RFC 5545 3.1: content lines longer than 75 octets are folded
+ICS_LINE_OCTETS = 75
+
+
+def _year_rows(year: int, table: MonthTable, festivals_dict: dict,
+               phases: list[dict] | None) -> typing.Iterator[tuple]:
+    """Linhas de um ano bíblico: meses, festivais e (opcionalmente) fases da lua."""
+    for month in table:
+        yield (year, "month", month.name, month.index, "", month.start.isoformat(),
+               month.end.isoformat(), month.days)
+    for fname, (midx, day) in festivals_dict.items():
+        month = table.by_index(midx)
+        if month is not None:
+            iso = (month.start + timedelta(days=day - 1)).isoformat()
+            yield (year, "festival", fname, midx, day, iso, iso, 1)
+    if phases is None:
+        return
+    for phase in phases:
+        found = table.month_for_date(phase["date"])
+        if found is not None:
+            month, day = found
+            iso = phase["date"].isoformat()
+            yield (year, "moon_phase", phase["name"], month.index, day, iso, iso, "")
+
+
+def iter_calendar_csv(start_year: int, end_year: int, use_visibility_heuristic: bool = False,
+                      include_phases: bool = False, force_academic: bool = False,
+                      festivals_dict: dict | None = None) -> typing.Iterator[str]:
+    """Gera o CSV de um intervalo de anos, um bloco de texto por ano.
+
+    Args:
+        start_year (int): Primeiro ano (inclusivo).
+        end_year (int): Último ano (inclusivo).
+        use_visibility_heuristic (bool): Usa a primeira crescente visível em Jerusalém.
+        include_phases (bool): Inclui as fases da lua de cada ano bíblico.
+        force_academic (bool): Se True, força uso de DE440 para máxima precisão.
+        festivals_dict (dict | None): Festivais a exportar (padrão: festivais
+            e eventos de Yeshua).
+
+    Yields:
+        str: O cabeçalho (``CSV_COLUMNS``) e, em seguida, as linhas de cada
+        ano (meses, festivais e fases, nessa ordem).
+
+    Raises:
+        ValueError: Se ``end_year`` for menor que ``start_year``.
+    """
+    if end_year < start_year:
+        raise ValueError("end_year deve ser maior ou igual a start_year")
+    if festivals_dict is None:
+        festivals_dict = ALL_EVENTS_DEF
+    return _iter_calendar_csv(start_year, end_year, use_visibility_heuristic,
+                              include_phases, force_academic, festivals_dict)
+
+
+def _iter_calendar_csv(start_year: int, end_year: int, use_visibility_heuristic: bool,
+                       include_phases: bool, force_academic: bool,
+                       festivals_dict: dict) -> typing.Iterator[str]:
+    """Corpo do gerador de ``iter_calendar_csv`` (validação feita antes do primeiro ``next``)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    def flush() -> str:
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    writer.writerow(CSV_COLUMNS)
+    yield flush()
+    for year in range(start_year, end_year + 1):
+        ctx = ephemeris_context(year, force_academic=force_academic)
+        table = generate_month_table(year, use_visibility_heuristic, ctx)
+        phases = None
+        if include_phases:
+            # a biblical year spans two Gregorian years, both already solved
+            # by the phase engine for the month table
+            phases = get_moon_phases_for_year(year, ctx) + get_moon_phases_for_year(year + 1, ctx)
+        writer.writerows(_year_rows(year, table, festivals_dict, phases))
+        yield flush()
+
+
+def _ics_text(value: str) -> str:
+    """Escapa um valor TEXT (RFC 5545 3.3.11)."""
+    return (value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _ics_line(line: str) -> str:
+    """Linha de conteúdo terminada em CRLF, dobrada em 75 octetos sem partir caracteres UTF-8."""
+    data = line.encode("utf-8")
+    if len(data) <= ICS_LINE_OCTETS:
+        return line + "\r\n"
+    parts = []
+    start = 0
+    limit = ICS_LINE_OCTETS
+    while start < len(data):
+        end = min(start + limit, len(data))
+        # back off to the first byte of a multi-byte character
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode("utf-8"))
+        start = end
+        # continuation lines start with a space, which counts towards the limit
+        limit = ICS_LINE_OCTETS - 1
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _slug(name: str) -> str:
+    """Identificador ASCII do nome (ex.: "Rosh Hashaná" -> "rosh-hashana")."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", ascii_name.lower()).strip("-")
+
+
+def event_uid(name: str, key: object) -> str:
+    """UID estável de um evento: o mesmo nome e chave sempre geram o mesmo UID.
+
+    Args:
+        name (str): Nome do evento.
+        key (object): O que distingue as ocorrências do evento (ex.: o ano
+            bíblico, ``"2025"``, ou ``"2025-visibility"``).
+    """
+    return f"{key}-{_slug(name)}@{ICS_UID_DOMAIN}"
+
+
+def _vevent(event: dict, dtstamp: str | None) -> str:
+    """Bloco VEVENT de dia inteiro."""
+    day = event["date"]
+    if isinstance(day, datetime):
+        day = day.date()
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event.get('uid') or event_uid(event['name'], day.strftime('%Y%m%d'))}",
+        # without an explicit stamp use the event date, keeping the output deterministic
+        f"DTSTAMP:{dtstamp or day.strftime('%Y%m%dT000000Z')}",
+        f"DTSTART;VALUE=DATE:{day.strftime('%Y%m%d')}",
+        f"DTEND;VALUE=DATE:{(day + timedelta(days=1)).strftime('%Y%m%d')}",
+        f"SUMMARY:{_ics_text(event['name'])}",
+    ]
+    if event.get("description"):
+        lines.append(f"DESCRIPTION:{_ics_text(event['description'])}")
+    lines.append("END:VEVENT")
+    return "".join(_ics_line(line) for line in lines)
+
+
+def iter_ics(events: typing.Iterable[dict], dtstamp: datetime | None = None) -> typing.Iterator[str]:
+    """Escreve um VCALENDAR em fluxo, um VEVENT de dia inteiro por evento.
+
+    Args:
+        events (Iterable[dict]): Eventos com ``name``, ``date`` e, opcionalmente,
+            ``description`` e ``uid`` (padrão: ``event_uid(name, data)``).
+            Pode ser um gerador; cada evento é escrito assim que é produzido.
+        dtstamp (datetime | None): DTSTAMP de todos os eventos (ex.: data de
+            geração dos dados). Padrão: meia-noite UTC da data de cada evento,
+            para que a mesma entrada gere sempre a mesma saída.
+
+    Yields:
+        str: Cabeçalho, um bloco por evento e o fechamento, com linhas CRLF.
+    """
+    stamp = None
+    if dtstamp is not None:
+        stamp = dtstamp.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield "".join(_ics_line(line) for line in ("BEGIN:VCALENDAR", f"PRODID:{ICS_PRODID}", "VERSION:2.0"))
+    for event in events:
+        yield _vevent(event, stamp)
+    yield _ics_line("END:VCALENDAR")
+
+
+def _festival_events(start_year: int, end_year: int, use_visibility_heuristic: bool,
+                     force_academic: bool, festivals_dict: dict,
+                     description: str | None) -> typing.Iterator[dict]:
+    """Festivais de cada ano do intervalo, calculados ano a ano."""
+    suffix = "-visibility" if use_visibility_heuristic else ""
+    for year in range(start_year, end_year + 1):
+        ctx = ephemeris_context(year, force_academic=force_academic)
+        table = generate_month_table(year, use_visibility_heuristic, ctx)
+        text = f"Calendário bíblico lunissolar - {ctx.name}" if description is None else description
+        for fest in map_festivals_to_dates(table, festivals_dict):
+            yield {
+                "name": fest["name"],
+                "date": fest["date"],
+                "description": text,
+                "uid": event_uid(fest["name"], f"{year}{suffix}"),
+            }
+
+
+def iter_calendar_ics(start_year: int, end_year: int, use_visibility_heuristic: bool = False,
+                      force_academic: bool = False, festivals_dict: dict | None = None,
+                      description: str | None = None,
+                      dtstamp: datetime | None = None) -> typing.Iterator[str]:
+    """Gera o ICS dos festivais de um intervalo de anos, um VEVENT por vez.
+
+    Os UIDs dependem só do ano bíblico, do festival e da heurística de
+    visibilidade, então um calendário assinado atualiza os eventos em vez
+    de duplicá-los.
+
+    Args:
+        start_year (int): Primeiro ano (inclusivo).
+        end_year (int): Último ano (inclusivo).
+        use_visibility_heuristic (bool): Usa a primeira crescente visível em Jerusalém.
+        force_academic (bool): Se True, força uso de DE440 para máxima precisão.
+        festivals_dict (dict | None): Festivais a exportar (padrão: festivais
+            e eventos de Yeshua).
+        description (str | None): Descrição dos eventos (padrão: nome da
+            efeméride usada em cada ano; ``""`` omite).
+        dtstamp (datetime | None): DTSTAMP dos eventos (ver ``iter_ics``).
+
+    Yields:
+        str: Texto ICS (linhas CRLF); grave com ``newline=""``.
+
+    Raises:
+        ValueError: Se ``end_year`` for menor que ``start_year``.
+    """
+    if end_year < start_year:
+        raise ValueError("end_year deve ser maior ou igual a start_year")
+    if festivals_dict is None:
+        festivals_dict = ALL_EVENTS_DEF
+    events = _festival_events(start_year, end_year, use_visibility_heuristic,
+                              force_academic, festivals_dict, description)
+    return iter_ics(events, dtstamp)
@@ -0,0 +1,247 @@
+"""Lunation Index - Índice pré-calculado de luas novas.
+
+Tabela compacta em disco com os instantes das luas novas astronômicas para um
+intervalo de anos (por exemplo 1600-2400). O arquivo é mapeado em memória
+(somente leitura), de modo que vários processos compartilham as mesmas páginas,
+e as consultas são resolvidas por busca binária, sem nenhum cálculo de efeméride.
+
+Formato (little-endian):
+    - Cabeçalho fixo (``HEADER``): magic, versão, época, mês sinódico médio,
+      anos cobertos, quantidade de entradas e nome da efeméride de origem.
+    - ``count`` entradas int32: desvio, em segundos, de cada lua nova em relação
+      à previsão pelo mês sinódico médio (``epoch + k * mean_synodic``). É a soma
+      acumulada dos deltas entre lunações consecutivas, o que permite decodificar
+      qualquer entrada em O(1).
+
+Os instantes são segundos UTC truncados, o que preserva a data UTC de cada
+conjunção exatamente como ``Time.utc_datetime().date()``.
+
+Exemplo:
+    $ python -m biblical_calendar.lunation_index lunations.bin 1600 2400 de440.bsp
+    $ export BIBLICAL_CALENDAR_LUNATION_INDEX=lunations.bin
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from datetime import datetime, date, timedelta, timezone
+import os
+import struct
+import sys
+import warnings
+
+# Environment variable with the path of the index used by calendar_core
+LUNATION_INDEX_ENV = "BIBLICAL_CALENDAR_LUNATION_INDEX"
+
+MAGIC = b"BCLUNIDX"
+VERSION = 1
+# magic, version, epoch (unix s), mean synodic month (s), first year, last year, count, ephemeris
+HEADER = struct.Struct("<8sHqiiiI16s")
+
+# Mean synodic month rounded to whole seconds (29.530588 days)
+MEAN_SYNODIC_SECONDS = 2551443
+
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _date_to_seconds(d: date) -> int:
+    """Segundos UTC (época Unix) da meia-noite da data."""
+    return (d - UNIX_EPOCH.date()).days * 86400
+
+
+def _seconds_to_date(seconds: int) -> date:
+    """Data UTC de um instante em segundos (época Unix)."""
+    return (UNIX_EPOCH + timedelta(seconds=seconds)).date()
+
+
+class LunationIndex:
+    """Índice de luas novas mapeado em memória com consultas O(log n).
+
+    Attributes:
+        path (str): Caminho do arquivo do índice.
+        first_year (int): Primeiro ano coberto (a partir de 1º de janeiro).
+        last_year (int): Último ano coberto (até 31 de dezembro).
+        ephemeris (str): Efeméride usada para gerar o índice.
+        checksum (str): SHA-256 do arquivo, usado nas chaves do cache.
+    """
+
+    def __init__(self, path: str):
+        """Abre o índice em modo somente leitura.
+
+        Args:
+            path (str): Caminho do arquivo gerado por ``build_lunation_index``.
+
+        Raises:
+            ValueError: Se o arquivo não for um índice de lunações válido.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"Índice de lunações inválido: {path}")
+        magic, version, epoch, mean, first_year, last_year, count, eph = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Índice de lunações inválido ou versão incompatível: {path}")
+        self.epoch = epoch
+        self.mean_synodic = mean
+        self.first_year = first_year
+        self.last_year = last_year
+        self.ephemeris = eph.rstrip(b"\0").decode("ascii")
+        from .calendar_cache import file_checksum
+        self.checksum = file_checksum(path)
+        import numpy as np
+        self._residuals = np.memmap(path, dtype="<i4", mode="r", offset=HEADER.size, shape=(count,))
+        self._start = _date_to_seconds(date(first_year, 1, 1))
+        self._end = _date_to_seconds(date(last_year + 1, 1, 1))
+
+    def __len__(self) -> int:
+        return len(self._residuals)
+
+    def instant(self, k: int) -> int:
+        """Instante UTC (segundos Unix) da k-ésima lua nova do índice."""
+        return self.epoch + k * self.mean_synodic + int(self._residuals[k])
+
+    def _bisect(self, seconds: int) -> int:
+        """Índice da primeira lua nova em ou após o instante."""
+        lo, hi = 0, len(self._residuals)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.instant(mid) < seconds:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def covers(self, start_date: date, end_date: date) -> bool:
+        """Indica se o intervalo [start_date, end_date] está dentro do índice."""
+        return (_date_to_seconds(start_date) >= self._start
+                and _date_to_seconds(end_date) + 86400 <= self._end)
+
+    def new_moons_between(self, start_date: date, end_date: date) -> list[date]:
+        """Datas UTC das luas novas no intervalo (ambas as datas inclusivas)."""
+        stop = _date_to_seconds(end_date) + 86400
+        out = []
+        k = self._bisect(_date_to_seconds(start_date))
+        while k < len(self._residuals):
+            t = self.instant(k)
+            if t >= stop:
+                break
+            out.append(_seconds_to_date(t))
+            k += 1
+        return out
+
+    def next_new_moon_on_or_after(self, start_date: date) -> date | None:
+        """Primeira lua nova em ou após a data, ou None se fora do índice."""
+        seconds = _date_to_seconds(start_date)
+        if seconds < self._start:
+            return None
+        k = self._bisect(seconds)
+        if k >= len(self._residuals) or self.instant(k) >= self._end:
+            return None
+        return _seconds_to_date(self.instant(k))
+
+
+def build_lunation_index(path: str, first_year: int, last_year: int,
+                         eph: object = None, ts: object = None) -> LunationIndex:
+    """Calcula as luas novas do intervalo e grava o índice em disco.
+
+    A busca é feita com uma única chamada a ``almanac.find_discrete`` e o
+    arquivo é escrito de forma atômica (arquivo temporário + rename).
+
+    Args:
+        path (str): Caminho do arquivo de saída.
+        first_year (int): Primeiro ano (inclusivo).
+        last_year (int): Último ano (inclusivo).
+        eph (object): Efeméride Skyfield. Padrão: efeméride atual do core.
+        ts (object): Timescale Skyfield. Padrão: timescale do core.
+
+    Returns:
+        LunationIndex: Índice recém-criado, já aberto.
+    """
+    import numpy as np
+    from skyfield import almanac
+    from . import calendar_core
+
+    default = calendar_core.default_ephemeris_context()
+    eph = eph if eph is not None else default.eph
+    ts = ts if ts is not None else default.ts
+    t0 = ts.utc(first_year, 1, 1)
+    t1 = ts.utc(last_year + 1, 1, 1)
+    times, phases = almanac.find_discrete(t0, t1, almanac.moon_phases(eph))
+    instants = []
+    for ti, ph in zip(times, phases):
+        if ph == 0:
+            # whole days + seconds drops the microseconds, i.e. floors the instant
+            delta = ti.utc_datetime() - UNIX_EPOCH
+            instants.append(delta.days * 86400 + delta.seconds)
+    if not instants:
+        raise RuntimeError("No new moon found in search window.")
+
+    epoch = instants[0]
+    residuals = np.array([t - (epoch + k * MEAN_SYNODIC_SECONDS) for k, t in enumerate(instants)],
+                         dtype="<i4")
+    eph_name = os.path.basename(getattr(eph, "filename", "") or "unknown")
+    header = HEADER.pack(MAGIC, VERSION, epoch, MEAN_SYNODIC_SECONDS, first_year, last_year,
+                         len(instants), eph_name.encode("ascii")[:16])
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(residuals.tobytes())
+    os.replace(tmp_path, path)
+    return LunationIndex(path)
+
+
+# Active index used by calendar_core; False means "not resolved yet"
+_active_index = False
+
+
+def get_lunation_index() -> LunationIndex | None:
+    """Índice ativo, aberto na primeira chamada a partir de ``LUNATION_INDEX_ENV``."""
+    global _active_index
+    if _active_index is False:
+        path = os.environ.get(LUNATION_INDEX_ENV)
+        _active_index = None
+        if path:
+            try:
+                _active_index = LunationIndex(path)
+            except (OSError, ValueError) as e:
+                warnings.warn(f"Índice de lunações ignorado: {e}")
+    return _active_index
+
+
+def lunation_index_for(kernel: str) -> LunationIndex | None:
+    """Índice ativo, se ele foi gerado com o kernel indicado (ex.: "de421.bsp").
+
+    Outros kernels e o motor analítico não usam o índice: suas luas novas podem
+    cair em outra data perto da meia-noite UTC.
+    """
+    index = get_lunation_index()
+    if index is not None and index.ephemeris == kernel:
+        return index
+    return None
+
+
+def set_lunation_index(index: "LunationIndex | str | None") -> LunationIndex | None:
+    """Define o índice ativo (objeto, caminho ou None para desativar)."""
+    global _active_index
+    _active_index = LunationIndex(index) if isinstance(index, str) else index
+    return _active_index
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Gera um índice: ``lunation_index <arquivo> <ano_inicial> <ano_final> [efeméride]``."""
+    from skyfield import api
+
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) not in (3, 4):
+        print("Uso: python -m biblical_calendar.lunation_index <arquivo> <ano_inicial> <ano_final> [efeméride.bsp]")
+        sys.exit(2)
+    path, first_year, last_year = args[0], int(args[1]), int(args[2])
+    eph = api.load(args[3]) if len(args) == 4 else None
+    index = build_lunation_index(path, first_year, last_year, eph=eph)
+    print(f"{len(index)} luas novas ({first_year}-{last_year}, {index.ephemeris}) gravadas em {path}")
+
+
+if __name__ == "__main__":
+    main()
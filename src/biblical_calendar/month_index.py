@@ -0,0 +1,313 @@
+"""Month Index - Conversão entre datas gregorianas e bíblicas.
+
+Índice ordenado com o primeiro dia (ordinal de ``date.toordinal()``) de todos
+os meses bíblicos de um intervalo de séculos. Uma conversão é uma busca
+binária nesse ``array``, O(log n) e sem nenhum cálculo de efeméride; só a
+construção do índice usa o gerador de meses (uma busca de lunações por
+intervalo de anos com a mesma efeméride, reaproveitando o cache persistente).
+
+Cada dia pertence ao último mês iniciado até ele, e o ano bíblico vai de
+Nissan até a véspera do Nissan seguinte. Por isso datas de janeiro a março
+costumam pertencer ao ano bíblico anterior. Quando a tabela de um ano traz um
+13º mês que começa no Nissan seguinte, ele é deixado de fora (esses dias são
+Nissan do ano novo). Com a heurística de visibilidade, os dias entre o fim
+astronômico de um mês e a crescente visível do seguinte contam como fim do
+mês anterior.
+
+Para muitas datas de uma vez, ``to_biblical_array`` faz a mesma busca em
+NumPy (``searchsorted``) sobre um array ``datetime64[D]`` ou de ordinais:
+milhões de datas por segundo.
+
+Exemplo:
+    >>> to_biblical(date(2025, 9, 3))
+    BiblicalDate(year=2025, month=6, name='Elul', day=12)
+    >>> from_biblical(2025, 6, 12)
+    datetime.date(2025, 9, 3)
+    >>> to_biblical_array(np.array(["2025-09-03", "2025-01-15"], dtype="datetime64[D]")).month
+    array([ 6, 10], dtype=int8)
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from __future__ import annotations
+
+from array import array
+import bisect
+from datetime import date
+import os
+import threading
+import typing
+
+from .calendar_core import MONTH_NAMES, ephemeris_runs, generate_month_tables_range
+from .month_table import Month
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    from .month_table import MonthTable
+
+# Environment variable with the years covered by the process-wide index ("1600-2400")
+MONTH_INDEX_YEARS_ENV = "BIBLICAL_CALENDAR_MONTH_INDEX_YEARS"
+# Biblical years covered by default: the span of DE421, the default kernel
+DEFAULT_MONTH_INDEX_YEARS = (1900, 2049)
+
+# Month names by code, as returned by to_biblical_array
+MONTH_NAME_CODES = (*MONTH_NAMES, "Adar I", "Adar II")
+
+# date.toordinal() of 1970-01-01, the epoch of datetime64
+UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class BiblicalDate(typing.NamedTuple):
+    """Data bíblica: ano (gregoriano em que começa Nissan), mês (1 = Nissan) e dia."""
+
+    year: int
+    month: int
+    name: str
+    day: int
+
+
+class BiblicalDates(typing.NamedTuple):
+    """Datas bíblicas em arrays paralelos; ``month == 0`` marca datas fora do índice."""
+
+    year: np.ndarray
+    month: np.ndarray
+    name_code: np.ndarray
+    day: np.ndarray
+
+
+class MonthIndex:
+    """Inícios dos meses bíblicos de vários anos, em ordem, para busca binária.
+
+    Attributes:
+        first_year (int): Primeiro ano bíblico coberto.
+        last_year (int): Último ano bíblico coberto.
+        starts (array): Ordinal do primeiro dia de cada mês, mais o Nissan
+            seguinte ao último ano (fim do índice).
+        years (array): Ano bíblico de cada mês.
+        months (array): Índice bíblico (1 = Nissan) de cada mês.
+        names (tuple[str, ...]): Nome de cada mês.
+    """
+
+    __slots__ = ("first_year", "last_year", "starts", "years", "months", "names", "_year_starts", "_arrays")
+
+    def __init__(self, tables: typing.Mapping[int, MonthTable]):
+        """Monta o índice a partir das tabelas de anos consecutivos.
+
+        Args:
+            tables (Mapping[int, MonthTable]): Meses de cada ano; o último ano
+                só delimita o fim do penúltimo (seu Nissan).
+
+        Raises:
+            ValueError: Se os anos não forem consecutivos ou os meses não
+                estiverem em ordem.
+        """
+        years = sorted(tables)
+        if len(years) < 2 or years != list(range(years[0], years[-1] + 1)):
+            raise ValueError("MonthIndex requer pelo menos dois anos consecutivos")
+        self.first_year, self.last_year = years[0], years[-2]
+        starts, owners, months, names = [], [], [], []
+        year_starts = []
+        for year in years[:-1]:
+            table = tables[year]
+            next_nissan = tables[year + 1].starts[0]
+            year_starts.append(len(starts))
+            for pos, start in enumerate(table.starts):
+                if start >= next_nissan:
+                    break
+                starts.append(start)
+                owners.append(year)
+                months.append(pos + 1)
+                names.append(table.names[pos])
+        # sentinel: the next Nissan closes the last month
+        starts.append(tables[years[-1]].starts[0])
+        year_starts.append(len(starts) - 1)
+        if any(later <= earlier for earlier, later in zip(starts, starts[1:])):
+            raise ValueError("MonthIndex requer meses em ordem crescente")
+        self.starts = array("i", starts)
+        self.years = array("i", owners)
+        self.months = array("b", months)
+        self.names = tuple(names)
+        self._year_starts = array("i", year_starts)
+        self._arrays = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def covers(self, target_date: date) -> bool:
+        """Indica se a data está dentro do índice."""
+        return self.starts[0] <= target_date.toordinal() < self.starts[-1]
+
+    def to_biblical(self, target_date: date) -> BiblicalDate:
+        """Data bíblica de uma data gregoriana (dia civil).
+
+        Raises:
+            ValueError: Se a data estiver fora do índice.
+        """
+        ordinal = target_date.toordinal()
+        pos = bisect.bisect_right(self.starts, ordinal) - 1
+        if not 0 <= pos < len(self.names):
+            raise ValueError(f"{target_date.isoformat()} fora do índice de meses "
+                             f"({self.first_year}-{self.last_year})")
+        return BiblicalDate(self.years[pos], self.months[pos], self.names[pos], ordinal - self.starts[pos] + 1)
+
+    def to_biblical_array(self, dates) -> BiblicalDates:
+        """Datas bíblicas de muitas datas de uma vez (``searchsorted``).
+
+        Args:
+            dates: Array (ou sequência) ``datetime64`` (qualquer unidade; a
+                hora é descartada) ou de ordinais de ``date.toordinal()``;
+                um escalar vira um array de um elemento.
+
+        Returns:
+            BiblicalDates: ``year`` (int32), ``month`` (int8, 1 = Nissan),
+            ``name_code`` (int8, posição em ``MONTH_NAME_CODES``) e ``day``
+            (int16). Datas fora do índice e ``NaT`` recebem 0 (e código -1).
+
+        Raises:
+            TypeError: Se o array não for de datas nem de inteiros.
+        """
+        import numpy as np
+        values = np.atleast_1d(np.asarray(dates))
+        if np.issubdtype(values.dtype, np.datetime64):
+            days = values.astype("datetime64[D]")
+            # NaT is the smallest int64: map it to ordinal 0, before the first month
+            ordinals = np.where(np.isnat(days), 0, days.astype(np.int64) + UNIX_EPOCH_ORDINAL)
+        elif np.issubdtype(values.dtype, np.integer):
+            ordinals = values.astype(np.int64)
+        else:
+            raise TypeError(f"datas devem ser datetime64 ou ordinais, não {values.dtype}")
+        starts, years, months, codes = self._numpy_arrays()
+        pos = np.searchsorted(starts, ordinals, side="right") - 1
+        valid = (pos >= 0) & (pos < len(self.names))
+        pos = np.where(valid, pos, 0)
+        day = ordinals - starts[pos] + 1
+        return BiblicalDates(np.where(valid, years[pos], 0).astype(np.int32),
+                             np.where(valid, months[pos], 0).astype(np.int8),
+                             np.where(valid, codes[pos], -1).astype(np.int8),
+                             np.where(valid, day, 0).astype(np.int16))
+
+    def _numpy_arrays(self) -> tuple:
+        """Inícios, anos, meses e códigos dos nomes como arrays NumPy (criados uma vez)."""
+        if self._arrays is None:
+            import numpy as np
+            self._arrays = (np.array(self.starts, dtype=np.int64),
+                            np.array(self.years, dtype=np.int32),
+                            np.array(self.months, dtype=np.int8),
+                            np.array([MONTH_NAME_CODES.index(name) for name in self.names], dtype=np.int8))
+        return self._arrays
+
+    def _position(self, year: int, month: int) -> int:
+        """Posição do mês no índice.
+
+        Raises:
+            ValueError: Se o ano estiver fora do índice ou o mês não existir.
+        """
+        if not self.first_year <= year <= self.last_year:
+            raise ValueError(f"ano {year} fora do índice de meses ({self.first_year}-{self.last_year})")
+        first = self._year_starts[year - self.first_year]
+        count = self._year_starts[year - self.first_year + 1] - first
+        if not 1 <= month <= count:
+            raise ValueError(f"o ano {year} tem {count} meses")
+        return first + month - 1
+
+    def month(self, year: int, month: int) -> Month:
+        """Mês bíblico com início, fim (véspera do mês seguinte) e duração."""
+        pos = self._position(year, month)
+        start, end = self.starts[pos], self.starts[pos + 1] - 1
+        return Month(month, self.names[pos], date.fromordinal(start), date.fromordinal(end), end - start + 1)
+
+    def from_biblical(self, year: int, month: int, day: int) -> date:
+        """Data gregoriana de uma data bíblica.
+
+        Args:
+            year (int): Ano bíblico (gregoriano em que começa Nissan).
+            month (int): Índice do mês (1 = Nissan).
+            day (int): Dia do mês (1-based).
+
+        Raises:
+            ValueError: Se o ano estiver fora do índice, ou o mês ou o dia não existirem.
+        """
+        pos = self._position(year, month)
+        length = self.starts[pos + 1] - self.starts[pos]
+        if not 1 <= day <= length:
+            raise ValueError(f"o mês {month} de {year} tem {length} dias")
+        return date.fromordinal(self.starts[pos] + day - 1)
+
+
+def month_index_years() -> tuple[int, int]:
+    """Anos do índice do processo: ``MONTH_INDEX_YEARS_ENV`` ("1600-2400") ou o padrão."""
+    value = os.environ.get(MONTH_INDEX_YEARS_ENV, "").strip()
+    if not value:
+        return DEFAULT_MONTH_INDEX_YEARS
+    first, _, last = value.partition("-")
+    first_year, last_year = int(first), int(last)
+    if last_year < first_year:
+        raise ValueError(f"{MONTH_INDEX_YEARS_ENV} inválido: {value}")
+    return first_year, last_year
+
+
+def build_month_index(first_year: int, last_year: int, use_visibility_heuristic: bool = False,
+                      force_academic: bool = False) -> MonthIndex:
+    """Gera os meses do intervalo e monta o índice.
+
+    Cada ano usa a efeméride de ``ephemeris_context(year)``, como o gerador
+    anual; anos consecutivos com a mesma efeméride compartilham uma única
+    busca de lunações (``generate_month_tables_range``).
+
+    Args:
+        first_year (int): Primeiro ano bíblico (inclusivo).
+        last_year (int): Último ano bíblico (inclusivo).
+        use_visibility_heuristic (bool): Usa a primeira crescente visível em Jerusalém.
+        force_academic (bool): Força DE440.
+    """
+    if last_year < first_year:
+        raise ValueError("last_year deve ser maior ou igual a first_year")
+    tables = {}
+    # one extra year: its Nissan closes the last month
+    for ctx, start_year, end_year in ephemeris_runs(first_year, last_year + 1, force_academic):
+        tables.update(generate_month_tables_range(start_year, end_year, use_visibility_heuristic, ctx))
+    return MonthIndex(tables)
+
+
+# Process-wide indexes, keyed by the visibility flag; built on first use
+_indexes: dict[bool, MonthIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_month_index(use_visibility_heuristic: bool = False) -> MonthIndex:
+    """Índice do processo (anos de ``month_index_years()``), montado no primeiro uso."""
+    index = _indexes.get(use_visibility_heuristic)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(use_visibility_heuristic)
+            if index is None:
+                index = _indexes[use_visibility_heuristic] = build_month_index(
+                    *month_index_years(), use_visibility_heuristic=use_visibility_heuristic)
+    return index
+
+
+def to_biblical(target_date: date, use_visibility_heuristic: bool = False) -> BiblicalDate:
+    """Data bíblica de uma data gregoriana, pelo índice do processo.
+
+    Raises:
+        ValueError: Se a data estiver fora do índice.
+    """
+    return get_month_index(use_visibility_heuristic).to_biblical(target_date)
+
+
+def from_biblical(year: int, month: int, day: int, use_visibility_heuristic: bool = False) -> date:
+    """Data gregoriana de uma data bíblica, pelo índice do processo.
+
+    Raises:
+        ValueError: Se o ano estiver fora do índice, ou o mês ou o dia não existirem.
+    """
+    return get_month_index(use_visibility_heuristic).from_biblical(year, month, day)
+
+
+def to_biblical_array(dates, use_visibility_heuristic: bool = False) -> BiblicalDates:
+    """Datas bíblicas de um array de datas, pelo índice do processo.
+
+    Veja ``MonthIndex.to_biblical_array``.
+    """
+    return get_month_index(use_visibility_heuristic).to_biblical_array(dates)
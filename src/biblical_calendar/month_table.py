@@ -0,0 +1,134 @@
+"""Month Table - Tabela compacta dos meses bíblicos de um ano.
+
+Substitui o ``pd.DataFrame`` de 12-13 linhas no caminho crítico: os limites dos
+meses são guardados como números ordinais de dia (``date.toordinal()``) em
+``array``, o acesso por índice é O(1) e a busca do mês de uma data também,
+por meio de uma tabela dia -> mês que cobre o ano inteiro (~385 bytes).
+O DataFrame só é criado quando pedido (exportação CSV, GUI).
+
+Exemplo:
+    >>> table = generate_month_table(2025)
+    >>> table.month_for_date(date(2025, 4, 12))
+    (Month(index=1, name='Nissan', ...), 14)
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date
+import typing
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+
+class Month(typing.NamedTuple):
+    """Mês bíblico (mesmos campos das linhas do DataFrame de meses)."""
+
+    index: int
+    name: str
+    start: date
+    end: date
+    days: int
+
+
+class MonthTable:
+    """Meses de um ano bíblico em arrays de ordinais.
+
+    Attributes:
+        names (tuple[str, ...]): Nomes dos meses, em ordem.
+        starts (array): Ordinal do primeiro dia de cada mês.
+        ends (array): Ordinal do último dia de cada mês.
+        embolismic (bool): Se o ano tem 13 meses.
+    """
+
+    __slots__ = ("names", "starts", "ends", "embolismic", "_month_of_day", "_df")
+
+    def __init__(self, names: typing.Sequence[str], starts: typing.Sequence[int],
+                 ends: typing.Sequence[int], embolismic: bool = False):
+        """Cria a tabela a partir dos ordinais de início e fim de cada mês.
+
+        Raises:
+            ValueError: Se a tabela estiver vazia ou os tamanhos divergirem.
+        """
+        if not names or not len(names) == len(starts) == len(ends):
+            raise ValueError("MonthTable requer nomes, inícios e fins do mesmo tamanho")
+        self.names = tuple(names)
+        self.starts = array("i", starts)
+        self.ends = array("i", ends)
+        self.embolismic = embolismic
+        # day offset (from the first start) -> month position, -1 for days
+        # outside every month (gaps left by the visibility heuristic)
+        month_of_day = array("b", [-1]) * (max(self.ends) - self.starts[0] + 1)
+        for pos, (start, end) in enumerate(zip(self.starts, self.ends)):
+            for offset in range(start - self.starts[0], end - self.starts[0] + 1):
+                month_of_day[offset] = pos
+        self._month_of_day = month_of_day
+        self._df = None
+
+    @classmethod
+    def from_months(cls, months: list[dict], embolismic: bool = False) -> MonthTable:
+        """Cria a tabela a partir da lista de dicts de ``build_biblical_months``."""
+        return cls([m["name"] for m in months],
+                   [m["start"].toordinal() for m in months],
+                   [m["end"].toordinal() for m in months],
+                   embolismic)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, pos: int) -> Month:
+        """Mês na posição ``pos`` (0 = Nissan)."""
+        start, end = self.starts[pos], self.ends[pos]
+        if pos < 0:
+            pos += len(self.names)
+        return Month(pos + 1, self.names[pos], date.fromordinal(start), date.fromordinal(end), end - start + 1)
+
+    def __iter__(self) -> typing.Iterator[Month]:
+        return (self[pos] for pos in range(len(self.names)))
+
+    @property
+    def nissan_start(self) -> date:
+        """Primeiro dia do ano (início de Nissan)."""
+        return date.fromordinal(self.starts[0])
+
+    def by_index(self, month_index: int) -> Month | None:
+        """Mês pelo índice bíblico (1 = Nissan), ou None se não existir."""
+        if 1 <= month_index <= len(self.names):
+            return self[month_index - 1]
+        return None
+
+    def start_of(self, month_index: int) -> date | None:
+        """Primeiro dia do mês pelo índice bíblico, ou None se não existir."""
+        if 1 <= month_index <= len(self.names):
+            return date.fromordinal(self.starts[month_index - 1])
+        return None
+
+    def position_for_ordinal(self, ordinal: int) -> int:
+        """Posição do mês que contém o dia ordinal, ou -1."""
+        offset = ordinal - self.starts[0]
+        if 0 <= offset < len(self._month_of_day):
+            return self._month_of_day[offset]
+        return -1
+
+    def month_for_date(self, target_date: date) -> tuple[Month, int] | None:
+        """Mês e dia do mês (1-based) que contêm a data, ou None."""
+        ordinal = target_date.toordinal()
+        pos = self.position_for_ordinal(ordinal)
+        if pos < 0:
+            return None
+        return self[pos], ordinal - self.starts[pos] + 1
+
+    def to_records(self) -> list[dict]:
+        """Meses como lista de dicts (mesmo formato de ``DataFrame.to_dict('records')``)."""
+        return [month._asdict() for month in self]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame dos meses, criado na primeira chamada."""
+        if self._df is None:
+            import pandas as pd
+            self._df = pd.DataFrame(self.to_records(), columns=list(Month._fields))
+        return self._df
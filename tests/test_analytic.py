@@ -0,0 +1,89 @@
+"""Testes para o motor analítico (séries de Meeus).
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import subprocess
+import sys
+from datetime import date
+
+import pytest
+
+from biblical_calendar import analytic
+from biblical_calendar.analytic import analytic_context, delta_t_seconds
+from biblical_calendar.calendar_core import (
+    _solve_moon_phases,
+    compute_seasons_for_years,
+    ephemeris_context,
+    first_crescent_dates,
+    generate_biblical_months_dynamic,
+    generate_month_table,
+    get_moon_phases_for_year,
+    JERUSALEM,
+)
+
+# Documented bounds (minutes) against DE421, with some margin
+MAX_PHASE_ERROR_MIN = 1.1
+MAX_SEASON_ERROR_MIN = 1.5
+
+
+class TestAnalyticEngine:
+    """Testes das séries analíticas contra DE421."""
+    
+    def test_moon_phases_match_de421(self):
+        """Testa a sequência e o erro das fases da lua em 2015-2034."""
+        start, end = date(2015, 1, 1), date(2035, 1, 1)
+        reference = _solve_moon_phases(start, end, ephemeris_context(2025))
+        phases = analytic.moon_phases_between(start, end)
+        
+        assert [p for _, p in phases] == [p for _, p in reference]
+        errors = [abs((a - r).total_seconds()) / 60 for (a, _), (r, _) in zip(phases, reference)]
+        assert max(errors) < MAX_PHASE_ERROR_MIN
+    
+    def test_seasons_match_de421(self):
+        """Testa o erro de equinócios e solstícios em 2015-2034."""
+        reference = compute_seasons_for_years(2015, 2034, ephemeris_context(2025))
+        seasons = analytic.seasons_for_years(2015, 2034)
+        
+        for year, events in seasons.items():
+            assert [ev for _, ev in events] == [0, 1, 2, 3]
+            for (utc, _), ref in zip(events, reference[year]):
+                assert abs((utc - ref["utc"]).total_seconds()) / 60 < MAX_SEASON_ERROR_MIN
+    
+    @pytest.mark.parametrize("year", [1901, 1950, 2024, 2025, 2049])
+    def test_months_match_de421(self, year):
+        """Testa se os meses (resolução de um dia) são os mesmos do DE421."""
+        expected = generate_month_table(year, ctx=ephemeris_context(year))
+        months = generate_month_table(year, ctx=analytic_context())
+        
+        assert months.to_records() == expected.to_records()
+        assert months.embolismic == expected.embolismic
+    
+    def test_engine_option(self):
+        """Testa o contexto analítico nas funções de meses e fases."""
+        df, embolismic, nissan = generate_biblical_months_dynamic(2025, ctx=analytic_context())
+        phases = get_moon_phases_for_year(2025, analytic_context())
+        
+        assert nissan == df.iloc[0]["start"]
+        assert phases[0]["date"].year == phases[-1]["date"].year == 2025
+        assert analytic_context().eph is None
+    
+    def test_visibility_requires_kernel(self):
+        """Testa se a heurística de visibilidade recusa o motor analítico."""
+        with pytest.raises(ValueError):
+            first_crescent_dates([date(2025, 3, 29)], JERUSALEM, analytic_context())
+    
+    def test_delta_t(self):
+        """Testa ΔT em anos de referência (segundos)."""
+        assert delta_t_seconds(2000) == pytest.approx(63.86, abs=0.01)
+        assert 60 < delta_t_seconds(2025) < 80
+        assert delta_t_seconds(1900) == pytest.approx(-2.79, abs=0.01)
+    
+    def test_no_kernel_or_skyfield(self, tmp_path):
+        """Testa se um ano inteiro sai sem importar o Skyfield."""
+        code = ("import sys; from biblical_calendar import analytic_context, generate_month_table; "
+                "generate_month_table(2025, ctx=analytic_context()); print('skyfield' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        
+        assert result.stdout.strip() == "False"
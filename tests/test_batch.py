@@ -0,0 +1,65 @@
+"""Testes para a geração paralela em lotes.
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import pytest
+import threading
+from concurrent.futures import CancelledError
+
+import pandas as pd
+
+from biblical_calendar.calendar_core import generate_biblical_months_range
+from biblical_calendar.batch import generate_biblical_months_parallel, year_chunks
+
+
+class TestBatchGeneration:
+    """Testes do executor de lotes."""
+    
+    def test_year_chunks(self):
+        """Testa a divisão do intervalo em blocos."""
+        assert year_chunks(2000, 2024, 10) == [(2000, 2009), (2010, 2019), (2020, 2024)]
+        assert year_chunks(2000, 2000, 10) == [(2000, 2000)]
+        with pytest.raises(ValueError):
+            year_chunks(2000, 2010, 0)
+    
+    def test_parallel_matches_range_in_order(self):
+        """Testa se os blocos são reunidos em ordem e iguais ao cálculo serial."""
+        calls = []
+        df = generate_biblical_months_parallel(2020, 2025, max_workers=2, chunk_years=2,
+                                               progress=lambda done, total: calls.append((done, total)))
+        
+        pd.testing.assert_frame_equal(df, generate_biblical_months_range(2020, 2025))
+        assert [done for done, _ in calls] == [2, 4, 6]
+        assert all(total == 6 for _, total in calls)
+    
+    def test_parallel_crosses_kernels(self):
+        """Testa um intervalo que passa do fim do DE421 (2053)."""
+        df = generate_biblical_months_parallel(2048, 2056, max_workers=2, chunk_years=3)
+        
+        pd.testing.assert_frame_equal(df, generate_biblical_months_range(2048, 2056))
+        assert sorted(df["year"].unique()) == list(range(2048, 2057))
+    
+    def test_cancellation(self):
+        """Testa o cancelamento antes e durante a geração."""
+        cancel = threading.Event()
+        cancel.set()
+        with pytest.raises(CancelledError):
+            generate_biblical_months_parallel(2020, 2021, cancel_event=cancel)
+        
+        cancel = threading.Event()
+        with pytest.raises(CancelledError):
+            # cancel as soon as the first block finishes
+            generate_biblical_months_parallel(2020, 2025, max_workers=1, chunk_years=1,
+                                              progress=lambda done, total: cancel.set(),
+                                              cancel_event=cancel)
+    
+    def test_invalid_range(self):
+        """Testa intervalo inválido."""
+        with pytest.raises(ValueError):
+            generate_biblical_months_parallel(2025, 2020)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -8,16 +8,40 @@ Autor:
 """
 
 import pytest
-from datetime import date
+import os
+import subprocess
+import sys
+from datetime import date, datetime, timedelta, timezone
 import pandas as pd
 
 from biblical_calendar.calendar import (
     get_march_equinox,
+    next_new_moon_on_or_after,
+    find_lunations,
     generate_biblical_months_dynamic,
     map_festivals_to_dates,
     FESTIVALS_DEF,
     MONTH_NAMES
 )
+from biblical_calendar import calendar_core
+from biblical_calendar.ephemeris import get_registry
+from biblical_calendar.calendar_core import (
+    BiblicalCalendarCore,
+    compute_seasons_for_year,
+    compute_seasons_for_years,
+    ephemeris_context,
+    ephemeris_runs,
+    find_new_moons_window,
+    generate_biblical_months_range,
+    generate_month_table,
+    generate_month_tables_range,
+    get_moon_phases_for_year,
+    is_first_crescent_visible_heuristic,
+    first_crescent_dates,
+    sun_moon_elongation_and_altitude_at,
+    visibility_interpolant,
+    JERUSALEM,
+)
 
 
 class TestCalendarFunctions:
@@ -31,6 +55,33 @@ class TestCalendarFunctions:
         assert equinox.month == 3
         assert 19 <= equinox.day <= 21  # Equinócio sempre entre 19-21 de março
     
+    def test_compute_seasons_for_years(self):
+        """Testa a tabela de estações para um intervalo de anos."""
+        table = compute_seasons_for_years(2024, 2026)
+        
+        assert sorted(table) == [2024, 2025, 2026]
+        for year, seasons in table.items():
+            assert [s["event"] for s in seasons] == [
+                "March Equinox", "June Solstice", "September Equinox", "December Solstice"
+            ]
+            assert all(s["utc"].year == year for s in seasons)
+            assert seasons == compute_seasons_for_year(year)
+            assert get_march_equinox(year) == seasons[0]["utc"].date()
+    
+    def test_find_lunations_matches_sequential_search(self):
+        """Testa se a busca única de lunações equivale à busca lua a lua."""
+        start = date(2025, 3, 20)
+        lunations = find_lunations(start, 4)
+        
+        expected = []
+        cursor = start
+        for _ in range(4):
+            nm = next_new_moon_on_or_after(cursor)
+            expected.append(nm)
+            cursor = nm + timedelta(days=1)
+        
+        assert lunations == expected
+    
     def test_generate_biblical_months_basic(self):
         """Testa geração básica de meses bíblicos."""
         df, embolismic, nissan_start = generate_biblical_months_dynamic(2024)
@@ -153,6 +204,221 @@ class TestCalendarEdgeCases:
         # Podem ter datas de início diferentes (heurística pode ajustar)
         # Mas estrutura deve ser similar
         assert len(df1) == len(df2)  # Mesmo número de meses
+    
+    def test_batched_visibility_matches_scalar(self):
+        """Testa se a heurística vetorizada reproduz a escalar."""
+        new_moons = find_lunations(get_march_equinox(2024), 13)
+        
+        scalar = [is_first_crescent_visible_heuristic(nm, JERUSALEM) for nm in new_moons]
+        batched = first_crescent_dates(new_moons, JERUSALEM)
+        
+        assert batched == scalar
+        assert first_crescent_dates([], JERUSALEM) == []
+    
+    def test_scalar_visibility_uses_skyfield(self, monkeypatch):
+        """Testa se a heurística escalar não ajusta interpolantes e concorda com o lote na virada do ano."""
+        monkeypatch.setattr(calendar_core, "_interpolants_table", {})
+        monkeypatch.setattr(calendar_core, "_fit_visibility_interpolant", None)
+        new_moons = find_lunations(date(2025, 11, 1), 4)
+        
+        scalar = [is_first_crescent_visible_heuristic(nm, JERUSALEM) for nm in new_moons]
+        
+        assert scalar == first_crescent_dates(new_moons, JERUSALEM)
+        assert calendar_core._interpolants_table == {}
+    
+    @pytest.mark.parametrize("use_visibility", [False, True])
+    def test_months_range_matches_single_year(self, use_visibility):
+        """Testa se o intervalo de anos reproduz o gerador anual."""
+        df = generate_biblical_months_range(2023, 2025, use_visibility_heuristic=use_visibility)
+        
+        assert sorted(df["year"].unique()) == [2023, 2024, 2025]
+        for year in (2023, 2024, 2025):
+            single_df, embolismic, _ = generate_biblical_months_dynamic(year, use_visibility_heuristic=use_visibility)
+            year_df = df[df["year"] == year]
+            
+            assert (year_df["embolismic"] == embolismic).all()
+            pd.testing.assert_frame_equal(
+                year_df.drop(columns=["year", "embolismic"]).reset_index(drop=True), single_df)
+    
+    def test_month_tables_range_matches_single_year(self):
+        """Testa se as MonthTable do intervalo reproduzem o gerador anual."""
+        tables = generate_month_tables_range(2023, 2025, use_visibility_heuristic=True)
+        
+        assert list(tables) == [2023, 2024, 2025]
+        for year, table in tables.items():
+            single = generate_month_table(year, use_visibility_heuristic=True)
+            assert table.embolismic == single.embolismic
+            assert table.to_records() == single.to_records()
+        with pytest.raises(ValueError):
+            generate_month_tables_range(2025, 2024)
+    
+    def test_range_uses_ephemeris_of_each_year(self):
+        """Testa se os intervalos usam, por padrão, a efeméride de cada ano."""
+        runs = ephemeris_runs(2049, 2055)
+        tables = generate_month_tables_range(2049, 2055)
+        df = generate_biblical_months_range(2049, 2055)
+        
+        assert [(ctx.kernel, first, last) for ctx, first, last in runs] == [
+            ("de421.bsp", 2049, 2050), (ephemeris_context(2051).kernel, 2051, 2055)]
+        assert list(tables) == list(range(2049, 2056))
+        assert sorted(df["year"].unique()) == list(range(2049, 2056))
+        for year in (2050, 2055):
+            single = generate_month_table(year, ctx=ephemeris_context(year))
+            assert tables[year].to_records() == single.to_records()
+
+
+class TestCalendarCore:
+    """Testes da classe BiblicalCalendarCore."""
+    
+    def test_get_day_events(self):
+        """Testa eventos do dia a partir dos índices do ano gerado."""
+        core = BiblicalCalendarCore()
+        assert core.get_day_events(date(2025, 4, 1))["events"] == []
+        
+        data = core.generate_calendar(2025)
+        nissan = date.fromisoformat(data["nissan_start"])
+        
+        pessach = core.get_day_events(nissan + timedelta(days=14))
+        assert pessach["month_info"] == {"name": "Nissan", "day": 15}
+        names = [e["name"] for e in pessach["events"] if e["type"] == "festival"]
+        assert names[0] == "Pessach (Páscoa)"
+        assert any(name.startswith("Leidat Yeshua (Nissan)") for name in names)
+        
+        for phase in core.moon_phases:
+            if core.months.month_for_date(phase["date"]) is not None:
+                events = core.get_day_events(phase["date"])["events"]
+                assert any(e["type"] == "moon_phase" for e in events)
+        
+        # returned events are copies
+        pessach["events"].clear()
+        assert core.get_day_events(nissan + timedelta(days=14))["events"]
+    
+    def test_current_season(self):
+        """Testa a estação atual por busca binária nos inícios das estações."""
+        core = BiblicalCalendarCore()
+        core.generate_calendar(2025)
+        equinox = core.seasons[0]["utc"].date()
+        
+        assert core._get_current_season(equinox)["jerusalem"] == "Primavera"
+        assert core._get_current_season(equinox - timedelta(days=1))["jerusalem"] == "Inverno"
+        assert core._get_current_season(date(2025, 7, 1))["sao_paulo"] == "Inverno"
+        assert core._get_current_season(date(2025, 12, 31))["jerusalem"] == "Inverno"
+
+
+class TestMoonPhaseEngine:
+    """Testes do motor único de fases da lua."""
+    
+    def test_each_lunation_solved_once(self, monkeypatch):
+        """Testa se meses e fases de anos consecutivos resolvem cada ano uma única vez."""
+        from skyfield import almanac
+        solved = []
+        original = almanac.find_discrete
+        
+        def counting(t0, t1, f, *args, **kwargs):
+            if f.__name__ == "moon_phase_at":
+                solved.append((t0.utc_datetime().date(), t1.utc_datetime().date()))
+            return original(t0, t1, f, *args, **kwargs)
+        
+        monkeypatch.setattr(almanac, "find_discrete", counting)
+        monkeypatch.setattr(calendar_core, "_phases_table", {})
+        monkeypatch.setattr(calendar_core, "lunation_index_for", lambda kernel: None)
+        
+        # months of 2031 run from Nissan 2031 into 2032: both years in one solve
+        generate_month_table(2031)
+        BiblicalCalendarCore().generate_calendar(2031)
+        get_moon_phases_for_year(2032)
+        generate_month_table(2032)
+        
+        assert solved == [(date(2031, 1, 1), date(2033, 1, 1)), (date(2033, 1, 1), date(2034, 1, 1))]
+    
+    def test_phases_cover_whole_year(self):
+        """Testa se as fases vão de 1º de janeiro até o fim de 31 de dezembro."""
+        phases = get_moon_phases_for_year(2030)
+        new_moons = [p["date"] for p in phases if p["phase"] == 0]
+        
+        assert phases[-1]["date"] == date(2030, 12, 31)
+        assert all(p["date"].year == 2030 for p in phases)
+        assert new_moons == find_new_moons_window(date(2030, 1, 1), date(2030, 12, 31))
+        assert {p["name"] for p in phases[:4]} == {"Nova", "Crescente", "Cheia", "Minguante"}
+
+
+class TestVisibilityInterpolant:
+    """Testes dos interpolantes de Chebyshev de elongação e altitude."""
+    
+    def test_matches_skyfield(self):
+        """Testa o erro do interpolante contra o Skyfield ao longo do ano."""
+        interp = visibility_interpolant(JERUSALEM, 2026)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        
+        for hours in range(0, 365 * 24, 24 * 7 + 5):
+            when = start + timedelta(hours=hours, minutes=17)
+            sep, alt = sun_moon_elongation_and_altitude_at(JERUSALEM, when, exact=True)
+            got_sep, got_alt = interp.evaluate(when)
+            assert got_sep == pytest.approx(sep, abs=1e-3)
+            assert got_alt == pytest.approx(alt, abs=1e-3)
+    
+    def test_fitted_once_per_year_and_observer(self, monkeypatch):
+        """Testa se cada ano e observador é ajustado uma única vez."""
+        fits = []
+        original = calendar_core._fit_visibility_interpolant
+        monkeypatch.setattr(calendar_core, "_interpolants_table", {})
+        monkeypatch.setattr(calendar_core, "_fit_visibility_interpolant",
+                            lambda city, year, ctx: fits.append((city["name"], year)) or original(city, year, ctx))
+        other = {**JERUSALEM, "name": "Elsewhere", "lat": 0.0}
+        
+        when = datetime(2026, 3, 19, 16, 0, tzinfo=timezone.utc)
+        first = sun_moon_elongation_and_altitude_at(JERUSALEM, when, exact=False)
+        assert sun_moon_elongation_and_altitude_at(JERUSALEM, when + timedelta(days=30), exact=False) != first
+        sun_moon_elongation_and_altitude_at(other, when, exact=False)
+        
+        assert fits == [("Jerusalem", 2026), ("Elsewhere", 2026)]
+    
+    def test_year_past_kernel_end_is_not_refitted(self, monkeypatch):
+        """Testa se um ano que passa do fim do kernel cai no cálculo exato sem novo ajuste."""
+        fits = []
+        original = calendar_core._fit_visibility_interpolant
+        monkeypatch.setattr(calendar_core, "_interpolants_table", {})
+        monkeypatch.setattr(calendar_core, "_interpolant_failures", {})
+        monkeypatch.setattr(calendar_core, "_fit_visibility_interpolant",
+                            lambda city, year, ctx: fits.append(year) or original(city, year, ctx))
+        ctx = get_registry().context_for("de421.bsp")  # ends in 2053-10
+        
+        when = datetime(2053, 6, 1, 18, 0, tzinfo=timezone.utc)
+        exact = sun_moon_elongation_and_altitude_at(JERUSALEM, when, ctx, exact=True)
+        assert sun_moon_elongation_and_altitude_at(JERUSALEM, when, ctx, exact=False) == exact
+        assert sun_moon_elongation_and_altitude_at(JERUSALEM, when, ctx, exact=False) == exact
+        
+        assert fits == [2053]
+    
+    def test_outside_year(self):
+        """Testa consulta fora do ano do interpolante."""
+        with pytest.raises(ValueError):
+            visibility_interpolant(JERUSALEM, 2026).evaluate(datetime(2027, 1, 1, tzinfo=timezone.utc))
+
+class TestLazyImport:
+    """Testes de importação sem I/O."""
+    
+    def test_core_import_is_lazy(self):
+        """Testa se importar o core não carrega efeméride nem dependências pesadas."""
+        code = (
+            "import sys, biblical_calendar, biblical_calendar.calendar_core as core\n"
+            "heavy = [m for m in ('skyfield', 'pandas', 'astral', 'icalendar', 'tkinter') if m in sys.modules]\n"
+            "assert not heavy, heavy\n"
+            "assert core._default_context is None\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        
+        assert result.returncode == 0, result.stderr
+    
+    def test_compat_attributes_resolve_on_demand(self):
+        """Testa os atributos de compatibilidade resolvidos sob demanda."""
+        import biblical_calendar.calendar_core as core
+        
+        assert core.CURRENT_EPHEMERIS == core.default_ephemeris_context().name
+        assert core.Eph is core.default_ephemeris_context().eph
+        with pytest.raises(AttributeError):
+            core.does_not_exist
 
 
 if __name__ == "__main__":
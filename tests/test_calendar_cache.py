@@ -0,0 +1,193 @@
+"""Testes para o cache persistente de calendários.
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import pytest
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from biblical_calendar import calendar_cache
+from biblical_calendar.calendar_cache import CalendarCache, set_calendar_cache
+from biblical_calendar import calendar_core
+from biblical_calendar.calendar_core import (
+    JERUSALEM,
+    BiblicalCalendarCore,
+    generate_month_table,
+    generate_month_tables_range,
+    get_moon_phases_for_year,
+    visibility_interpolant,
+)
+
+
+def fake_ctx(tmp_path, name="DE421 (Padrão)", content=b"kernel"):
+    """Contexto com um 'kernel' em disco, suficiente para montar chaves."""
+    kernel = tmp_path / "kernel.bsp"
+    kernel.write_bytes(content)
+    return SimpleNamespace(name=name, kernel="kernel.bsp", eph=SimpleNamespace(path=str(kernel), filename="kernel.bsp"))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache em um arquivo temporário."""
+    cache = CalendarCache(str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+class TestCalendarCache:
+    """Testes do cache SQLite."""
+    
+    def test_get_or_compute_once(self, cache, tmp_path):
+        """Testa se o valor é calculado uma única vez por chave."""
+        ctx = fake_ctx(tmp_path)
+        calls = []
+        compute = lambda: calls.append(1) or {"months": [1, 2, 3]}
+        
+        first = cache.get_or_compute("months", 2025, ctx, compute, visibility=False)
+        second = cache.get_or_compute("months", 2025, ctx, compute, visibility=False)
+        cache.get_or_compute("months", 2025, ctx, compute, visibility=True)
+        
+        assert first == second == {"months": [1, 2, 3]}
+        assert len(calls) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+    
+    def test_key_identity(self, cache, tmp_path, monkeypatch):
+        """Testa os componentes da chave: parâmetros, efeméride, kernel e versão."""
+        ctx = fake_ctx(tmp_path)
+        key = cache.key("months", 2025, ctx, visibility=False)
+        
+        assert key == cache.key("months", 2025, ctx, visibility=False)
+        assert key != cache.key("months", 2026, ctx, visibility=False)
+        assert key != cache.key("seasons", 2025, ctx, visibility=False)
+        assert key != cache.key("months", 2025, ctx, visibility=True)
+        assert key != cache.key("months", 2025, fake_ctx(tmp_path, name="DE440 (Fallback)"))
+        assert key != cache.key("months", 2025, fake_ctx(tmp_path, content=b"other kernel"), visibility=False)
+        monkeypatch.setattr(calendar_cache, "CACHE_DATA_VERSION", calendar_cache.CACHE_DATA_VERSION + 1)
+        assert key != cache.key("months", 2025, ctx, visibility=False)
+        monkeypatch.undo()
+        monkeypatch.setattr(calendar_cache, "_library_version", lambda: "9.9.9")
+        assert key != cache.key("months", 2025, ctx, visibility=False)
+    
+    def test_persists_across_reopen(self, tmp_path):
+        """Testa se os valores sobrevivem a um novo processo/conexão."""
+        path = str(tmp_path / "cache.sqlite")
+        cache = CalendarCache(path)
+        cache.put("k", [1, 2])
+        cache.close()
+        
+        reopened = CalendarCache(path)
+        assert reopened.get("k") == [1, 2]
+        assert reopened.get("missing", "default") == "default"
+        reopened.close()
+    
+    def test_size_bounded_eviction(self, tmp_path):
+        """Testa o descarte das entradas usadas há mais tempo."""
+        cache = CalendarCache(str(tmp_path / "cache.sqlite"), max_mb=0.01)
+        payload = os.urandom(4000)  # incompressible, ~4 KB per entry
+        cache.put("a", payload)
+        cache.put("b", payload)
+        cache.get("a")  # "a" becomes more recent than "b"
+        cache.put("c", payload)
+        
+        assert cache.total_bytes() <= cache.max_bytes
+        assert cache.get("b") is None
+        assert cache.get("a") == payload
+        assert cache.get("c") == payload
+        cache.close()
+    
+    def test_unreadable_entry_is_a_miss(self, cache):
+        """Testa se uma entrada corrompida é tratada como ausente."""
+        cache._db.execute("INSERT INTO entries VALUES ('bad', x'00', 1, 0)")
+        
+        assert cache.get("bad", "default") == "default"
+        assert cache.misses == 1
+    
+    def test_get_many_counts(self, cache):
+        """Testa se a leitura em lote conta acertos e faltas."""
+        cache.put("a", 1)
+        cache.put("b", 2)
+        
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+        assert (cache.hits, cache.misses) == (2, 1)
+
+
+class TestCachedCalendar:
+    """Testes do cache aplicado ao core."""
+    
+    def test_core_uses_cache(self, tmp_path):
+        """Testa se o calendário em cache é igual ao calculado."""
+        expected = BiblicalCalendarCore().generate_calendar(2025)
+        cache = set_calendar_cache(str(tmp_path / "cache.sqlite"))
+        try:
+            first = BiblicalCalendarCore().generate_calendar(2025)
+            second = BiblicalCalendarCore().generate_calendar(2025)
+            table = generate_month_table(2025)
+            
+            assert first == second == expected
+            assert table.to_records() == expected["months"]
+            # moon phases are served by the in-process phase table
+            assert cache.misses == 3  # months, festivals, seasons
+            assert cache.hits == 4
+        finally:
+            set_calendar_cache(None)
+            cache.close()
+    
+    def test_moon_phases_persisted(self, tmp_path, monkeypatch):
+        """Testa se as fases resolvidas são reaproveitadas por um novo processo."""
+        expected = get_moon_phases_for_year(2025)
+        cache = set_calendar_cache(str(tmp_path / "cache.sqlite"))
+        try:
+            monkeypatch.setattr(calendar_core, "_phases_table", {})
+            assert get_moon_phases_for_year(2025) == expected
+            assert cache.misses == 1
+            
+            # a new process: empty phase table, nothing solved again
+            monkeypatch.setattr(calendar_core, "_phases_table", {})
+            monkeypatch.setattr(calendar_core, "_solve_moon_phases", None)
+            assert get_moon_phases_for_year(2025) == expected
+            assert cache.hits == 1
+        finally:
+            set_calendar_cache(None)
+            cache.close()
+    
+    def test_visibility_interpolant_persisted(self, tmp_path, monkeypatch):
+        """Testa se o interpolante ajustado é reaproveitado por um novo processo."""
+        when = datetime(2026, 3, 19, 16, 0, tzinfo=timezone.utc)
+        cache = set_calendar_cache(str(tmp_path / "cache.sqlite"))
+        try:
+            monkeypatch.setattr(calendar_core, "_interpolants_table", {})
+            expected = visibility_interpolant(JERUSALEM, 2026).evaluate(when)
+            assert cache.misses == 1
+            
+            monkeypatch.setattr(calendar_core, "_interpolants_table", {})
+            monkeypatch.setattr(calendar_core, "_fit_visibility_interpolant", None)
+            assert visibility_interpolant(JERUSALEM, 2026).evaluate(when) == expected
+            assert cache.hits == 1
+        finally:
+            set_calendar_cache(None)
+            cache.close()
+    
+    def test_month_tables_range_shares_entries(self, tmp_path, monkeypatch):
+        """Testa se o intervalo lê e grava as mesmas entradas do gerador anual."""
+        cache = set_calendar_cache(str(tmp_path / "cache.sqlite"))
+        try:
+            single = generate_month_table(2025)
+            tables = generate_month_tables_range(2024, 2026)
+            assert (cache.hits, cache.misses) == (1, 3)
+            
+            # every year is now cached: no lunation search at all
+            monkeypatch.setattr(calendar_core, "_months_by_year", None)
+            cached_tables = generate_month_tables_range(2024, 2026)
+            assert [t.to_records() for t in cached_tables.values()] == [t.to_records() for t in tables.values()]
+            assert generate_month_table(2024).to_records() == tables[2024].to_records()
+            assert tables[2025].to_records() == single.to_records()
+        finally:
+            set_calendar_cache(None)
+            cache.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,102 @@
+"""Testes para o registro thread-safe de efemérides.
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import threading
+import time
+
+import pytest
+
+from biblical_calendar.ephemeris import EphemerisContext, EphemerisRegistry
+
+
+class FakeKernel:
+    """Kernel falso (sem arquivo) para testes sem download."""
+    
+    def __init__(self, name):
+        self.filename = name
+
+
+class FakeLoader:
+    """Carregador falso que conta quantas vezes cada kernel foi carregado."""
+    
+    def __init__(self, missing=()):
+        self.calls = []
+        self.missing = set(missing)
+    
+    def __call__(self, kernel):
+        time.sleep(0.01)
+        self.calls.append(kernel)
+        if kernel in self.missing:
+            raise OSError(f"cannot download {kernel}")
+        return FakeKernel(kernel)
+    
+    def timescale(self):
+        return "ts"
+
+
+class TestEphemerisRegistry:
+    """Testes do registro de efemérides."""
+    
+    def test_loads_each_kernel_once(self):
+        """Testa carregamento único mesmo com requisições concorrentes."""
+        loader = FakeLoader()
+        registry = EphemerisRegistry(budget_mb=1024, loader=loader)
+        
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get("de421.bsp")))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert loader.calls == ["de421.bsp"]
+        assert all(r is results[0] for r in results)
+    
+    def test_context_selection_and_fallback(self):
+        """Testa seleção por ano, modo acadêmico e fallback."""
+        registry = EphemerisRegistry(budget_mb=1024, loader=FakeLoader(missing={"de440.bsp"}))
+        
+        ctx = registry.context(2025)
+        assert isinstance(ctx, EphemerisContext)
+        assert (ctx.name, ctx.kernel, ctx.ts) == ("DE421 (Padrão)", "de421.bsp", "ts")
+        assert registry.context(2025, force_academic=True).name == "DE430 (Fallback Acadêmico)"
+        assert registry.context(2100).kernel == "de430.bsp"
+        
+        with pytest.raises(AttributeError):
+            ctx.name = "outro"
+    
+    def test_context_raises_when_no_kernel_available(self):
+        """Testa erro quando nenhum kernel candidato pode ser carregado."""
+        registry = EphemerisRegistry(loader=FakeLoader(missing={"de440.bsp", "de430.bsp"}))
+        
+        with pytest.raises(RuntimeError, match="Modo acadêmico requer DE440/DE430"):
+            registry.context(2025, force_academic=True)
+    
+    def test_lru_eviction_within_budget(self):
+        """Testa descarte do kernel menos usado ao exceder o orçamento."""
+        loader = FakeLoader()
+        registry = EphemerisRegistry(budget_mb=150, loader=loader)
+        
+        registry.get("de421.bsp")
+        registry.get("de440.bsp")
+        assert registry.loaded() == ["de421.bsp", "de440.bsp"]
+        
+        registry.get("de421.bsp")
+        registry.get("de430.bsp")  # 17 + 128 + 128 MB > 150 MB
+        assert registry.loaded() == ["de421.bsp", "de430.bsp"]
+    
+    def test_evicted_kernel_in_use_is_reused(self):
+        """Testa reaproveitamento de kernel descartado ainda em uso."""
+        loader = FakeLoader()
+        registry = EphemerisRegistry(budget_mb=150, loader=loader)
+        
+        in_use = registry.context_for("de440.bsp")
+        registry.get("de430.bsp")
+        assert "de440.bsp" not in registry.loaded()
+        
+        assert registry.get("de440.bsp") is in_use.eph
+        assert loader.calls.count("de440.bsp") == 1
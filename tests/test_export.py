@@ -0,0 +1,138 @@
+"""Testes para a exportação em fluxo.
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import csv
+from datetime import date, datetime, timezone
+import io
+
+import pytest
+
+from biblical_calendar import export
+from biblical_calendar.calendar_core import (
+    ALL_EVENTS_DEF,
+    ephemeris_context,
+    generate_month_table,
+    map_festivals_to_dates,
+)
+from biblical_calendar.export import CSV_COLUMNS, event_uid, iter_calendar_csv, iter_calendar_ics, iter_ics
+
+
+def read_rows(chunks):
+    """Linhas do CSV como dicts."""
+    return list(csv.DictReader(io.StringIO("".join(chunks))))
+
+
+class TestCalendarCsv:
+    """Testes do gerador de CSV por intervalo de anos."""
+
+    def test_rows_match_yearly_generation(self):
+        """Testa se meses e festivais de cada ano batem com a geração anual."""
+        rows = read_rows(iter_calendar_csv(2024, 2025))
+
+        for year in (2024, 2025):
+            table = generate_month_table(year, ctx=ephemeris_context(year))
+            months = [r for r in rows if r["year"] == str(year) and r["type"] == "month"]
+            festivals = [r for r in rows if r["year"] == str(year) and r["type"] == "festival"]
+
+            assert [(m["name"], m["start"], m["end"], int(m["days"])) for m in months] == \
+                [(m.name, m.start.isoformat(), m.end.isoformat(), m.days) for m in table]
+            assert [(f["name"], f["start"]) for f in festivals] == \
+                [(f["name"], f["date"].isoformat()) for f in map_festivals_to_dates(table, ALL_EVENTS_DEF)]
+
+    def test_phases_cover_biblical_year(self):
+        """Testa se as fases ficam dentro dos meses do ano, com dia bíblico."""
+        rows = read_rows(iter_calendar_csv(2025, 2025, include_phases=True))
+        table = generate_month_table(2025, ctx=ephemeris_context(2025))
+        phases = [r for r in rows if r["type"] == "moon_phase"]
+
+        # about 4 phases per lunation, including those after January 1st
+        assert len(phases) >= 4 * len(table) - 2
+        assert any(p["start"] > "2026-01-01" for p in phases)
+        for p in phases:
+            month, day = table.month_for_date(date.fromisoformat(p["start"]))
+            assert (int(p["month_index"]), int(p["day"])) == (month.index, day)
+
+    def test_streams_one_year_at_a_time(self, monkeypatch):
+        """Testa se cada ano só é calculado quando o bloco é consumido."""
+        calls = []
+        original = export.generate_month_table
+        monkeypatch.setattr(export, "generate_month_table",
+                            lambda year, *args: calls.append(year) or original(year, *args))
+
+        chunks = iter_calendar_csv(2024, 2026)
+        assert next(chunks) == ",".join(CSV_COLUMNS) + "\n"
+        assert calls == []
+        next(chunks)
+        assert calls == [2024]
+        assert len(list(chunks)) == 2
+        assert calls == [2024, 2025, 2026]
+
+    def test_invalid_range(self):
+        """Testa intervalo invertido (erro antes de iterar)."""
+        with pytest.raises(ValueError):
+            iter_calendar_csv(2025, 2024)
+
+
+class TestCalendarIcs:
+    """Testes do escritor ICS em fluxo."""
+
+    def test_valid_ics(self):
+        """Testa se o parser do icalendar aceita a saída e os eventos batem com os festivais."""
+        icalendar = pytest.importorskip("icalendar")
+        text = "".join(iter_calendar_ics(2024, 2025))
+        cal = icalendar.Calendar.from_ical(text)
+        events = cal.walk("VEVENT")
+
+        expected = []
+        for year in (2024, 2025):
+            table = generate_month_table(year, ctx=ephemeris_context(year))
+            expected += [(f["name"], f["date"]) for f in map_festivals_to_dates(table, ALL_EVENTS_DEF)]
+        assert [(str(e["SUMMARY"]), e.decoded("DTSTART")) for e in events] == expected
+        assert all("DTSTAMP" in e and "DTEND" in e for e in events)
+        assert str(cal["VERSION"]) == "2.0"
+        assert len({str(e["UID"]) for e in events}) == len(events)
+
+    def test_stable_uids(self):
+        """Testa se os UIDs dependem só do ano, festival e heurística."""
+        icalendar = pytest.importorskip("icalendar")
+        first = icalendar.Calendar.from_ical("".join(iter_calendar_ics(2025, 2025)))
+        again = icalendar.Calendar.from_ical("".join(iter_calendar_ics(2024, 2025)))
+        visibility = icalendar.Calendar.from_ical("".join(iter_calendar_ics(2025, 2025, True)))
+
+        uids = [str(e["UID"]) for e in first.walk("VEVENT")]
+        assert uids[0] == event_uid("Pessach", 2025) == "2025-pessach@biblical-calendar"
+        assert set(uids) <= {str(e["UID"]) for e in again.walk("VEVENT")}
+        assert not set(uids) & {str(e["UID"]) for e in visibility.walk("VEVENT")}
+
+    def test_escaping_and_folding(self):
+        """Testa escape de texto, CRLF e dobra de linhas longas sem partir UTF-8."""
+        icalendar = pytest.importorskip("icalendar")
+        description = "Lua nova; primeira crescente, Jerusalém\nsegunda linha " + "é" * 80
+        stamp = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        text = "".join(iter_ics([{"name": "Rosh Hashaná", "date": date(2025, 9, 23),
+                                  "description": description}], dtstamp=stamp))
+
+        lines = text.split("\r\n")
+        assert lines[-1] == ""
+        assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+        assert "\n" not in text.replace("\r\n", "")
+        event = icalendar.Calendar.from_ical(text).walk("VEVENT")[0]
+        assert str(event["DESCRIPTION"]) == description
+        assert str(event["UID"]) == "20250923-rosh-hashana@biblical-calendar"
+        assert event.decoded("DTSTAMP") == stamp
+
+    def test_streams_one_year_at_a_time(self, monkeypatch):
+        """Testa se cada ano só é calculado quando seus eventos são consumidos."""
+        calls = []
+        original = export.generate_month_table
+        monkeypatch.setattr(export, "generate_month_table",
+                            lambda year, *args: calls.append(year) or original(year, *args))
+
+        chunks = iter_calendar_ics(2024, 2030)
+        assert next(chunks).startswith("BEGIN:VCALENDAR")
+        assert calls == []
+        next(chunks)
+        assert calls == [2024]
@@ -0,0 +1,132 @@
+"""Testes para o registro de observadores e o nascer/pôr do sol em lote.
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from datetime import date
+
+import pytest
+
+from biblical_calendar.calendar_core import sunrise_sunset
+from biblical_calendar.locations import (
+    JERUSALEM,
+    SAOPAULO,
+    LocationRegistry,
+    make_location,
+    observer_context,
+    sun_times_for_year,
+)
+
+
+@pytest.fixture
+def registry():
+    """Registro com os locais padrão e cidades com horário de verão, altitude e noite polar."""
+    registry = LocationRegistry()
+    registry.register("Lisboa", 38.7223, -9.1393, "Europe/Lisbon", elevation=50)
+    registry.register("Tóquio", 35.6762, 139.6503, "Asia/Tokyo")
+    registry.register("Tromsø", 69.6492, 18.9553, "Europe/Oslo")
+    registry.register("Auckland", -36.8485, 174.7633, "Pacific/Auckland", elevation=200)
+    return registry
+
+
+class TestLocationRegistry:
+    """Testes do registro de observadores."""
+
+    def test_defaults_and_lookup(self, registry):
+        """Testa os locais padrão e a busca por nome sem acentos nem maiúsculas."""
+        assert registry.get("jerusalem") is JERUSALEM
+        assert registry.get("SAO PAULO") is SAOPAULO
+        assert registry.get("Tromsø")["elevation"] == 0.0
+        assert "Tromsø" in registry and len(registry) == 6
+        with pytest.raises(KeyError):
+            registry.get("Atlantis")
+
+    def test_register_replaces(self, registry):
+        """Testa se registrar o mesmo nome substitui o local."""
+        registry.register("lisboa", 38.7, -9.1, "Europe/Lisbon")
+        assert registry.get("Lisboa")["elevation"] == 0.0
+        assert len(registry) == 6
+
+    @pytest.mark.parametrize("args", [
+        ("", 0, 0, "UTC"),
+        ("X", 91, 0, "UTC"),
+        ("X", 0, -181, "UTC"),
+        ("X", 0, 0, "Mars/Base"),
+        ("X", 0, 0, "UTC", float("nan")),
+    ])
+    def test_invalid_location(self, args):
+        """Testa nome, coordenadas, fuso e altitude inválidos."""
+        with pytest.raises(ValueError):
+            make_location(*args)
+
+
+class TestObserverContext:
+    """Testes dos objetos reutilizados por observador."""
+
+    def test_reused_per_location(self):
+        """Testa se o mesmo local reaproveita Topos, Observer e fuso."""
+        context = observer_context(JERUSALEM)
+
+        assert observer_context(dict(JERUSALEM)) is context
+        assert context.topos is observer_context(JERUSALEM).topos
+        assert context.astral.elevation == 0.0
+        assert context.tz.zone == "Asia/Jerusalem"
+        assert observer_context({**JERUSALEM, "elevation": 754.0}) is not context
+
+    def test_check_time_builds_nothing(self, monkeypatch):
+        """Testa se a heurística não recria objetos astral/Skyfield a cada noite."""
+        import astral
+        import skyfield.api
+        from biblical_calendar.calendar_core import _crescent_check_time
+        observer_context(JERUSALEM).topos
+        monkeypatch.setattr(astral, "LocationInfo", None)
+        monkeypatch.setattr(skyfield.api, "Topos", None)
+
+        assert _crescent_check_time(date(2025, 3, 30), JERUSALEM).date() == date(2025, 3, 30)
+
+
+class TestSunTimes:
+    """Testes do nascer/pôr do sol em lote."""
+
+    @pytest.mark.parametrize("year", [2024, 2025])
+    def test_matches_scalar(self, registry, year):
+        """Testa se cada dia e local é igual ao cálculo escalar (astral)."""
+        names = [loc["name"] for loc in registry]
+        table = sun_times_for_year(names, year, registry)
+
+        assert table.sunrise.shape == (len(names), 366 if year == 2024 else 365)
+        for name in names:
+            for day in table.dates[::5]:
+                assert table.day(name, day) == sunrise_sunset(registry.get(name), day)
+
+    def test_polar_night(self, registry):
+        """Testa dias sem nascer/pôr do sol e os dias vizinhos."""
+        table = sun_times_for_year(["Tromsø"], 2025, registry)
+
+        assert table.day("Tromsø", date(2025, 12, 21)) == {"sunrise": None, "sunset": None}
+        assert table.day("Tromsø", date(2025, 6, 21)) == {"sunrise": None, "sunset": None}
+        assert table.day("Tromsø", date(2025, 3, 1))["sunset"] is not None
+
+    def test_local_isoformat(self, registry):
+        """Testa os horários locais ISO 8601 de um ano inteiro."""
+        times = sun_times_for_year([JERUSALEM, "Tromsø"], 2025, registry)
+
+        assert times.local_isoformat("Jerusalem")["sunrise"][170] == "2025-06-20T05:34:13+03:00"
+        assert times.local_isoformat(1)["sunset"][354] is None
+
+    def test_outside_year(self, registry):
+        """Testa consulta fora do ano da tabela."""
+        with pytest.raises(ValueError):
+            sun_times_for_year(["Jerusalem"], 2025, registry).day("Jerusalem", date(2026, 1, 1))
+
+    @pytest.mark.parametrize("year", [1, 9999])
+    def test_year_out_of_range(self, registry, year):
+        """Testa anos cujos dias vizinhos não cabem em ``datetime``."""
+        with pytest.raises(ValueError):
+            sun_times_for_year(["Jerusalem"], year, registry)
+
+    def test_year_bounds(self, registry):
+        """Testa os anos extremos aceitos."""
+        assert len(sun_times_for_year(["Jerusalem"], 2, registry).dates) == 365
+        assert len(sun_times_for_year(["Jerusalem"], 9998, registry).dates) == 365
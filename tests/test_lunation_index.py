@@ -0,0 +1,102 @@
+"""Testes para o índice pré-calculado de luas novas.
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import pytest
+from datetime import date
+
+from biblical_calendar import calendar_core
+from biblical_calendar.analytic import analytic_context
+from biblical_calendar.calendar_cache import content_key
+from biblical_calendar.lunation_index import (
+    LunationIndex,
+    build_lunation_index,
+    lunation_index_for,
+    set_lunation_index,
+)
+
+
+@pytest.fixture(scope="module")
+def index_path(tmp_path_factory):
+    """Gera um índice pequeno (2020-2030) com a efeméride padrão."""
+    path = str(tmp_path_factory.mktemp("lunations") / "lunations.bin")
+    build_lunation_index(path, 2020, 2030)
+    return path
+
+
+class TestLunationIndex:
+    """Testes do índice de lunações."""
+    
+    def test_header_and_coverage(self, index_path):
+        """Testa leitura do cabeçalho e limites de cobertura."""
+        index = LunationIndex(index_path)
+        
+        assert index.first_year == 2020
+        assert index.last_year == 2030
+        assert 130 <= len(index) <= 138  # ~12.37 lunações por ano
+        assert index.covers(date(2020, 1, 1), date(2030, 12, 31))
+        assert not index.covers(date(2019, 12, 31), date(2021, 1, 1))
+        assert not index.covers(date(2025, 1, 1), date(2031, 1, 1))
+    
+    def test_matches_ephemeris_search(self, index_path):
+        """Testa se o índice reproduz as datas calculadas pela efeméride."""
+        index = LunationIndex(index_path)
+        set_lunation_index(None)
+        
+        start, end = date(2024, 3, 1), date(2026, 5, 31)
+        assert index.new_moons_between(start, end) == calendar_core.find_new_moons_window(start, end)
+        assert index.next_new_moon_on_or_after(date(2025, 3, 20)) == \
+            calendar_core.next_new_moon_on_or_after(date(2025, 3, 20))
+        assert index.next_new_moon_on_or_after(date(2019, 6, 1)) is None
+    
+    def test_core_uses_active_index(self, index_path):
+        """Testa se o core responde pelo índice quando ele está ativo."""
+        expected, _, _ = calendar_core.generate_biblical_months_dynamic(2025)
+        set_lunation_index(index_path)
+        try:
+            df, _, _ = calendar_core.generate_biblical_months_dynamic(2025)
+        finally:
+            set_lunation_index(None)
+        
+        assert df.equals(expected)
+    
+    def test_only_used_for_its_kernel(self, index_path, monkeypatch):
+        """Testa se o índice só responde pelo kernel que o gerou."""
+        ctx = calendar_core.default_ephemeris_context()
+        start, end = date(2025, 1, 1), date(2025, 12, 31)
+        analytic = calendar_core.find_new_moons_window(start, end, analytic_context())
+        index = set_lunation_index(index_path)
+        try:
+            assert index.ephemeris == ctx.kernel
+            assert lunation_index_for(ctx.kernel) is index
+            assert lunation_index_for("de440.bsp") is None
+            assert calendar_core.find_new_moons_window(start, end, analytic_context()) == analytic
+            
+            monkeypatch.setattr(calendar_core, "_new_moons_from_table", None)
+            assert calendar_core.find_new_moons_window(start, end, ctx) == index.new_moons_between(start, end)
+        finally:
+            set_lunation_index(None)
+    
+    def test_content_key_includes_index(self, index_path):
+        """Testa se as chaves do cache mudam com o índice em uso pelo kernel."""
+        ctx = calendar_core.default_ephemeris_context()
+        analytic = analytic_context()
+        without = content_key("months", 2025, ctx), content_key("months", 2025, analytic)
+        set_lunation_index(index_path)
+        try:
+            with_index = content_key("months", 2025, ctx), content_key("months", 2025, analytic)
+        finally:
+            set_lunation_index(None)
+        
+        assert with_index[0] != without[0]
+        assert with_index[1] == without[1]
+    
+    def test_rejects_invalid_file(self, tmp_path):
+        """Testa rejeição de arquivos que não são índices."""
+        path = tmp_path / "invalid.bin"
+        path.write_bytes(b"not an index" * 10)
+        
+        with pytest.raises(ValueError):
+            LunationIndex(str(path))
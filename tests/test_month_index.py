@@ -0,0 +1,180 @@
+"""Testes para a conversão entre datas gregorianas e bíblicas.
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import pytest
+from datetime import date, timedelta
+
+import numpy as np
+
+from biblical_calendar import month_index
+from biblical_calendar.calendar_core import generate_month_table
+from biblical_calendar.month_index import (
+    MONTH_NAME_CODES,
+    BiblicalDate,
+    MonthIndex,
+    build_month_index,
+    from_biblical,
+    get_month_index,
+    to_biblical,
+    to_biblical_array,
+)
+from biblical_calendar.month_table import MonthTable
+
+
+def make_tables():
+    """Dois anos fictícios: o 13º mês do primeiro começa no Nissan do segundo."""
+    first = MonthTable.from_months([
+        {"name": "Nissan", "start": date(2025, 3, 1), "end": date(2025, 3, 30)},
+        {"name": "Iyar", "start": date(2025, 3, 31), "end": date(2025, 4, 29)},
+        {"name": "Adar II", "start": date(2025, 5, 1), "end": date(2025, 5, 30)},
+    ], embolismic=True)
+    second = MonthTable.from_months([
+        {"name": "Nissan", "start": date(2025, 5, 1), "end": date(2025, 5, 30)},
+    ])
+    return {2025: first, 2026: second}
+
+
+@pytest.fixture(scope="module")
+def index():
+    """Índice real de 2023 a 2026."""
+    return build_month_index(2023, 2026)
+
+
+class TestMonthIndex:
+    """Testes do MonthIndex."""
+
+    def test_duplicate_thirteenth_month_is_dropped(self):
+        """Testa se o 13º mês que coincide com o Nissan seguinte fica de fora."""
+        index = MonthIndex(make_tables())
+
+        assert (index.first_year, index.last_year, len(index)) == (2025, 2025, 2)
+        assert index.to_biblical(date(2025, 4, 30)) == BiblicalDate(2025, 2, "Iyar", 31)
+        assert index.month(2025, 2).end == date(2025, 4, 30)
+        assert not index.covers(date(2025, 5, 1))
+        with pytest.raises(ValueError):
+            index.to_biblical(date(2025, 5, 1))
+        with pytest.raises(ValueError):
+            index.from_biblical(2025, 3, 1)
+
+    def test_requires_consecutive_years(self):
+        """Testa a validação dos anos."""
+        tables = make_tables()
+        with pytest.raises(ValueError):
+            MonthIndex({2025: tables[2025]})
+        with pytest.raises(ValueError):
+            MonthIndex({2025: tables[2025], 2027: tables[2026]})
+
+    def test_matches_month_tables(self, index):
+        """Testa se cada mês começa onde a tabela do ano indica."""
+        for year in range(2023, 2027):
+            next_nissan = generate_month_table(year + 1).nissan_start
+            for month in generate_month_table(year):
+                if month.start >= next_nissan:
+                    assert month.start == next_nissan
+                else:
+                    assert index.to_biblical(month.start) == BiblicalDate(year, month.index, month.name, 1)
+
+        # January to March belong to the previous biblical year
+        assert index.to_biblical(date(2025, 1, 15)).year == 2024
+        assert index.to_biblical(date(2025, 9, 3)) == BiblicalDate(2025, 6, "Elul", 12)
+
+    def test_round_trip(self, index):
+        """Testa ida e volta em todos os dias do índice."""
+        day = date.fromordinal(index.starts[0])
+        while index.covers(day):
+            biblical = index.to_biblical(day)
+            assert index.from_biblical(biblical.year, biblical.month, biblical.day) == day
+            assert biblical.day <= index.month(biblical.year, biblical.month).days
+            day += timedelta(days=1)
+
+    def test_invalid_dates(self, index):
+        """Testa datas fora do índice e meses e dias inexistentes."""
+        with pytest.raises(ValueError):
+            index.to_biblical(date(2000, 1, 1))
+        with pytest.raises(ValueError):
+            index.from_biblical(2030, 1, 1)
+        with pytest.raises(ValueError):
+            index.from_biblical(2025, 14, 1)
+        with pytest.raises(ValueError):
+            index.from_biblical(2025, 1, 31)
+
+    def test_visibility_gaps_extend_previous_month(self):
+        """Testa se os dias até a crescente visível contam no mês anterior."""
+        index = build_month_index(2024, 2025, use_visibility_heuristic=True)
+        table = generate_month_table(2025, use_visibility_heuristic=True)
+
+        for month in table:
+            assert index.to_biblical(month.start) == BiblicalDate(2025, month.index, month.name, 1)
+        elul = index.month(2025, 6)
+        assert elul.start == table.by_index(6).start
+        assert elul.end == table.by_index(7).start - timedelta(days=1)
+
+    def test_process_index_uses_configured_years(self, monkeypatch):
+        """Testa o índice do processo com os anos da variável de ambiente."""
+        monkeypatch.setenv(month_index.MONTH_INDEX_YEARS_ENV, "2024-2025")
+        monkeypatch.setattr(month_index, "_indexes", {})
+
+        assert get_month_index() is get_month_index()
+        assert (get_month_index().first_year, get_month_index().last_year) == (2024, 2025)
+        assert to_biblical(date(2025, 9, 3)).month == 6
+        assert from_biblical(2025, 6, 12) == date(2025, 9, 3)
+        with pytest.raises(ValueError):
+            to_biblical(date(2030, 1, 1))
+
+
+class TestBulkConversion:
+    """Testes da conversão vetorizada."""
+
+    def test_matches_scalar_conversion(self, index):
+        """Testa se cada dia (e os vizinhos do índice) bate com ``to_biblical``."""
+        ordinals = np.arange(index.starts[0] - 3, index.starts[-1] + 3)
+        result = index.to_biblical_array(ordinals)
+
+        for i, ordinal in enumerate(ordinals.tolist()):
+            day = date.fromordinal(ordinal)
+            row = (result.year[i], result.month[i], result.name_code[i], result.day[i])
+            if index.covers(day):
+                biblical = index.to_biblical(day)
+                assert row == (biblical.year, biblical.month, MONTH_NAME_CODES.index(biblical.name), biblical.day)
+            else:
+                assert row == (0, 0, -1, 0)
+
+    def test_datetime64_input(self, index):
+        """Testa datetime64 de outras unidades, NaT e tipos inválidos."""
+        stamps = np.array(["2025-09-03T23:59", "NaT", "2025-01-15T00:00"], dtype="datetime64[m]")
+        result = index.to_biblical_array(stamps)
+
+        assert result.month.tolist() == [6, 0, 10]
+        assert result.day.tolist() == [12, 0, 17]
+        assert [MONTH_NAME_CODES[code] for code in result.name_code if code >= 0] == ["Elul", "Tevet"]
+        assert (result.year.dtype, result.month.dtype, result.day.dtype) == (np.int32, np.int8, np.int16)
+        with pytest.raises(TypeError):
+            index.to_biblical_array(["2025-09-03"])
+
+    def test_scalar_and_nat_input(self, index):
+        """Testa escalares (datetime64, NaT e ordinal) como arrays de um elemento."""
+        result = index.to_biblical_array(np.datetime64("2025-09-03"))
+        assert (result.year.tolist(), result.month.tolist(), result.day.tolist()) == ([2025], [6], [12])
+
+        result = index.to_biblical_array(np.datetime64("NaT"))
+        assert (result.year.tolist(), result.name_code.tolist(), result.day.tolist()) == ([0], [-1], [0])
+
+        result = index.to_biblical_array(np.array(["NaT", "NaT"], dtype="datetime64[s]"))
+        assert result.month.tolist() == [0, 0]
+
+        assert index.to_biblical_array(date(2025, 9, 3).toordinal()).day.tolist() == [12]
+
+    def test_process_index(self, monkeypatch):
+        """Testa ``to_biblical_array`` pelo índice do processo."""
+        monkeypatch.setenv(month_index.MONTH_INDEX_YEARS_ENV, "2024-2025")
+        monkeypatch.setattr(month_index, "_indexes", {})
+
+        result = to_biblical_array(np.array(["2025-09-03"], dtype="datetime64[D]"))
+        assert (result.year[0], result.month[0], result.day[0]) == (2025, 6, 12)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
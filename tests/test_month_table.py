@@ -0,0 +1,94 @@
+"""Testes para a tabela compacta de meses.
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import pytest
+from datetime import date, timedelta
+
+import pandas as pd
+
+from biblical_calendar.calendar_core import (
+    generate_month_table,
+    generate_biblical_months_dynamic,
+    map_festivals_to_dates,
+    FESTIVALS_DEF,
+    YESHUA_EVENTS_DEF,
+)
+from biblical_calendar.month_table import Month, MonthTable
+
+
+def make_table():
+    """Tabela de 3 meses com um intervalo (dia 31/01) fora de qualquer mês."""
+    months = [
+        {"name": "Nissan", "start": date(2025, 1, 1), "end": date(2025, 1, 30)},
+        {"name": "Iyar", "start": date(2025, 2, 1), "end": date(2025, 3, 1)},
+        {"name": "Sivan", "start": date(2025, 3, 2), "end": date(2025, 3, 31)},
+    ]
+    return MonthTable.from_months(months, embolismic=False)
+
+
+class TestMonthTable:
+    """Testes da MonthTable."""
+    
+    def test_index_access(self):
+        """Testa acesso por posição e por índice bíblico."""
+        table = make_table()
+        
+        assert len(table) == 3
+        assert table[0] == Month(1, "Nissan", date(2025, 1, 1), date(2025, 1, 30), 30)
+        assert table[-1].name == "Sivan"
+        assert table.by_index(2).start == date(2025, 2, 1)
+        assert table.by_index(4) is None
+        assert table.start_of(3) == date(2025, 3, 2)
+        assert table.nissan_start == date(2025, 1, 1)
+        with pytest.raises(IndexError):
+            table[3]
+    
+    def test_month_for_date(self):
+        """Testa a busca do mês de uma data, incluindo dias fora da tabela."""
+        table = make_table()
+        
+        month, day = table.month_for_date(date(2025, 2, 10))
+        assert (month.name, day) == ("Iyar", 10)
+        assert table.month_for_date(date(2025, 3, 31))[1] == 30
+        assert table.month_for_date(date(2025, 1, 31)) is None
+        assert table.month_for_date(date(2024, 12, 31)) is None
+        assert table.month_for_date(date(2025, 4, 1)) is None
+    
+    def test_invalid_table(self):
+        """Testa validação dos arrays."""
+        with pytest.raises(ValueError):
+            MonthTable([], [], [])
+        with pytest.raises(ValueError):
+            MonthTable(["Nissan"], [1, 2], [3])
+    
+    @pytest.mark.parametrize("use_visibility", [False, True])
+    def test_matches_dataframe_path(self, use_visibility):
+        """Testa se a tabela equivale ao DataFrame do gerador anual."""
+        table = generate_month_table(2024, use_visibility_heuristic=use_visibility)
+        df, embolismic, nissan = generate_biblical_months_dynamic(2024, use_visibility_heuristic=use_visibility)
+        
+        pd.testing.assert_frame_equal(table.to_dataframe(), df)
+        assert table.to_dataframe() is table.to_dataframe()
+        assert table.to_records() == df.to_dict("records")
+        assert (table.embolismic, table.nissan_start) == (embolismic, nissan)
+        
+        combined = {**FESTIVALS_DEF, **YESHUA_EVENTS_DEF}
+        assert map_festivals_to_dates(table, combined) == map_festivals_to_dates(df, combined)
+        
+        d = table.nissan_start
+        while d <= table[-1].end:
+            rows = df[(df["start"] <= d) & (df["end"] >= d)]
+            found = table.month_for_date(d)
+            if rows.empty:
+                assert found is None
+            else:
+                assert found[0].index == rows.iloc[0]["index"]
+                assert found[1] == (d - rows.iloc[0]["start"]).days + 1
+            d += timedelta(days=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,467 @@
+"""Testes para a API web (Flask).
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("flask")
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..', 'web', 'backend')
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+import app as backend  # noqa: E402
+from biblical_calendar import month_index  # noqa: E402
+from response_cache import ResponseCache  # noqa: E402
+from single_flight import SingleFlight  # noqa: E402
+from warmup import WarmUp, warmup_years  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    """Cliente de teste com o cache de respostas vazio."""
+    backend.calendar_cache.clear()
+    return backend.app.test_client()
+
+
+class TestResponseCache:
+    """Testes do cache LRU de respostas."""
+    
+    def test_lru_and_counters(self):
+        """Testa descarte LRU e contadores de acerto/falta."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        assert cache.get("a") == b"1"
+        cache.put("c", b"3")
+        
+        assert "b" not in cache
+        assert cache.get("b") is None
+        assert cache.stats() == {'size': 2, 'max_size': 2, 'hits': 1, 'misses': 1}
+        
+        # peek neither counts nor refreshes the entry
+        assert cache.peek("a") == b"1"
+        assert cache.peek("b") is None
+        cache.put("d", b"4")
+        assert "a" not in cache
+        assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+    
+    def test_disabled(self):
+        """Testa tamanho zero (cache desativado)."""
+        cache = ResponseCache(max_entries=0)
+        cache.put("a", b"1")
+        
+        assert len(cache) == 0
+
+
+class TestSingleFlight:
+    """Testes da coalescência de cálculos simultâneos."""
+    
+    def test_concurrent_calls_share_one_computation(self):
+        """Testa se chamadas simultâneas da mesma chave executam um único cálculo."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(10)
+            return "valor"
+        
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", compute)))
+        leader.start()
+        started.wait(10)
+        followers = [threading.Thread(target=lambda: results.append(flight.do("k", compute))) for _ in range(5)]
+        for thread in followers:
+            thread.start()
+        while flight.stats()['shared'] < 5:
+            release.wait(0.01)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(10)
+        
+        assert len(calls) == 1
+        assert sorted(results) == [("valor", False)] + [("valor", True)] * 5
+        assert flight.stats() == {'in_flight': 0, 'leaders': 1, 'shared': 5}
+        assert flight.do("k", lambda: "novo") == ("novo", False)
+    
+    def test_error_reaches_every_waiter(self):
+        """Testa se a exceção do cálculo chega a todas as chamadas que esperavam."""
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+        
+        def compute():
+            release.wait(10)
+            raise RuntimeError("falhou")
+        
+        def call():
+            try:
+                flight.do("k", compute)
+            except RuntimeError as e:
+                errors.append(str(e))
+        
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while flight.stats()['leaders'] + flight.stats()['shared'] < 3:
+            release.wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(10)
+        
+        assert errors == ["falhou"] * 3
+        assert len(flight) == 0
+    
+    def test_concurrent_requests_run_pipeline_once(self, client, monkeypatch):
+        """Testa se N requisições simultâneas do mesmo calendário executam o pipeline uma vez."""
+        requests = 8
+        barrier = threading.Barrier(requests)
+        calls = []
+        
+        def slow_payload(year, use_visibility, academic_mode):
+            calls.append((year, use_visibility, academic_mode))
+            threading.Event().wait(0.3)
+            return {'year': year, 'months': []}
+        
+        def fetch():
+            local_client = backend.app.test_client()
+            barrier.wait(10)
+            response = local_client.get('/api/calendar/2025')
+            responses.append((response.status_code, response.data))
+        
+        monkeypatch.setattr(backend, 'build_calendar_payload', slow_payload)
+        responses = []
+        try:
+            threads = [threading.Thread(target=fetch) for _ in range(requests)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(30)
+        finally:
+            backend.calendar_cache.clear()
+        
+        assert calls == [(2025, False, False)]
+        assert len(responses) == requests
+        assert len(set(responses)) == 1
+        assert responses[0][0] == 200
+
+
+class TestCalendarEndpoint:
+    """Testes do endpoint /api/calendar."""
+    
+    def test_cached_response(self, client):
+        """Testa se a segunda requisição vem do cache com o mesmo conteúdo."""
+        first = client.get('/api/calendar/2025')
+        second = client.get('/api/calendar/2025')
+        other = client.get('/api/calendar/2025?visibility=true')
+        
+        assert first.status_code == second.status_code == 200
+        assert first.headers['X-Calendar-Cache'] == 'MISS'
+        assert second.headers['X-Calendar-Cache'] == 'HIT'
+        assert other.headers['X-Calendar-Cache'] == 'MISS'
+        assert first.get_json() == second.get_json()
+        assert len(first.get_json()['months']) in (12, 13)
+        stats = client.get('/api/health').get_json()['calendar_cache']
+        assert (stats['hits'], stats['misses']) == (1, 2)
+    
+    def test_conditional_requests(self, client):
+        """Testa ETag forte, Cache-Control e 304 nos endpoints cacheáveis."""
+        for url in ('/api/calendar/2025', '/api/export/csv/2025', '/api/export/ics/2025?visibility=true'):
+            first = client.get(url)
+            etag = first.headers['ETag']
+            
+            assert first.status_code == 200
+            assert not etag.startswith('W/')
+            assert first.headers['Last-Modified']
+            assert 'max-age=' in first.headers['Cache-Control']
+            
+            cached = client.get(url, headers={'If-None-Match': etag})
+            assert cached.status_code == 304
+            assert cached.data == b''
+            assert cached.headers['ETag'] == etag
+            
+            assert client.get(url, headers={'If-None-Match': '"stale"'}).status_code == 200
+        
+        calendar = client.get('/api/calendar/2025').headers['ETag']
+        assert client.get('/api/calendar/2025?visibility=true').headers['ETag'] != calendar
+        assert client.get('/api/calendar/2024').headers['ETag'] != calendar
+    
+    def test_calendar_has_no_today_fields(self, client):
+        """Testa se a resposta do calendário não depende da data atual."""
+        assert 'current_season' not in client.get('/api/calendar/2025').get_json()
+
+
+class TestCalendarsEndpoint:
+    """Testes do endpoint /api/calendars (vários anos)."""
+    
+    def test_range_matches_single_years(self, client):
+        """Testa se o lote reproduz /api/calendar de cada ano."""
+        # 2024 comes from the response cache, 2023 and 2025-2026 are computed
+        client.get('/api/calendar/2024?visibility=true')
+        response = client.get('/api/calendars?from=2023&to=2026&visibility=true')
+        data = response.get_json()
+        # batch responses do not fill the single-year cache nor touch its counters
+        assert (2025, True, False) not in backend.calendar_cache
+        stats = client.get('/api/health').get_json()['calendar_cache']
+        assert (stats['hits'], stats['misses']) == (0, 1)
+        singles = [client.get(f'/api/calendar/{year}?visibility=true').get_json()
+                   for year in range(2023, 2027)]
+        
+        assert response.status_code == 200
+        assert data['years'] == [2023, 2024, 2025, 2026]
+        assert data['calendars'] == singles
+    
+    def test_year_list_and_etag(self, client):
+        """Testa a forma em lista (ordenada, sem repetição) e o 304."""
+        response = client.get('/api/calendars?years=2025,2020&years=2025')
+        etag = response.headers['ETag']
+        
+        assert [cal['year'] for cal in response.get_json()['calendars']] == [2020, 2025]
+        assert client.get('/api/calendars?years=2020,2025', headers={'If-None-Match': etag}).status_code == 304
+        assert client.get('/api/calendars?years=2020,2026').headers['ETag'] != etag
+    
+    def test_invalid_years(self, client):
+        """Testa parâmetros inválidos e o limite de anos."""
+        for query in ('', 'years=x', 'years=,', 'from=2030&to=2020', 'from=2000&to=2200'):
+            response = client.get(f'/api/calendars?{query}')
+            assert response.status_code == 400
+            assert 'error' in response.get_json()
+
+
+class TestCurrentSeasonEndpoint:
+    """Testes do endpoint /api/season/current."""
+    
+    def test_current_season(self, client):
+        """Testa a estação de uma data e a ausência de cache HTTP."""
+        response = client.get('/api/season/current?date=2025-07-01')
+        
+        assert response.get_json() == {'date': '2025-07-01', 'jerusalem': 'Verão', 'sao_paulo': 'Inverno'}
+        assert 'no-cache' in response.headers['Cache-Control']
+        assert client.get('/api/season/current').status_code == 200
+        assert client.get('/api/season/current?date=invalid').status_code == 400
+
+
+class TestSunEndpoint:
+    """Testes dos endpoints /api/locations e /api/sun."""
+    
+    def test_registered_and_custom_locations(self, client):
+        """Testa locais registrados e um local informado por coordenadas."""
+        names = [loc['name'] for loc in client.get('/api/locations').get_json()['locations']]
+        response = client.get('/api/sun/2025?location=jerusalem&lat=38.7223&lon=-9.1393&tz=Europe/Lisbon&name=Lisboa')
+        data = response.get_json()
+        
+        assert names[:2] == ['Jerusalem', 'São Paulo']
+        assert len(data['dates']) == 365
+        assert [loc['name'] for loc in data['locations']] == ['Jerusalem', 'Lisboa']
+        assert data['locations'][0]['sunrise'][170] == '2025-06-20T05:34:13+03:00'
+        assert data['locations'][1]['sunset'][0].startswith('2025-01-01T17:')
+        assert 'public' in response.headers['Cache-Control']
+    
+    def test_invalid_locations(self, client):
+        """Testa local desconhecido, coordenadas e fuso inválidos."""
+        assert client.get('/api/sun/2025?location=atlantis').status_code == 404
+        assert client.get('/api/sun/2025?lat=91&lon=0').status_code == 400
+        assert client.get('/api/sun/2025?lat=x&lon=0').status_code == 400
+        assert client.get('/api/sun/2025?lat=0&lon=0&tz=Mars/Base').status_code == 400
+    
+    def test_year_bounds(self, client):
+        """Testa os anos extremos do endpoint."""
+        assert client.get('/api/sun/1?location=jerusalem').status_code == 400
+        assert client.get('/api/sun/2?location=jerusalem').status_code == 200
+        assert client.get('/api/sun/9999?location=jerusalem').status_code == 400
+
+
+class TestDateEndpoint:
+    """Testes da conversão de datas (/api/date)."""
+    
+    @pytest.fixture(autouse=True)
+    def small_index(self, monkeypatch):
+        """Índice de meses de 2024 a 2025 só para estes testes."""
+        monkeypatch.setenv(month_index.MONTH_INDEX_YEARS_ENV, "2024-2025")
+        monkeypatch.setattr(month_index, "_indexes", {})
+    
+    def test_gregorian_to_biblical(self, client):
+        """Testa a data bíblica de uma data gregoriana."""
+        response = client.get('/api/date/2025-09-03')
+        data = response.get_json()
+        
+        assert response.status_code == 200
+        assert (data['year'], data['month'], data['name'], data['day']) == (2025, 6, 'Elul', 12)
+        assert data['month_start'] == '2025-08-23'
+        assert 'max-age=' in response.headers['Cache-Control']
+        assert client.get('/api/date/2025-01-15').get_json()['year'] == 2024
+    
+    def test_biblical_to_gregorian(self, client):
+        """Testa a data gregoriana de uma data bíblica, com e sem visibilidade."""
+        assert client.get('/api/date?year=2025&month=6&day=12').get_json()['date'] == '2025-09-03'
+        visible = client.get('/api/date?year=2025&month=6&day=1&visibility=true').get_json()
+        assert visible['use_visibility'] and visible['date'] >= '2025-08-23'
+    
+    def test_invalid_dates(self, client):
+        """Testa datas inválidas, fora do índice e inexistentes."""
+        for url in ('/api/date/2025-13-01', '/api/date/1999-01-01', '/api/date?year=2025',
+                    '/api/date?year=2025&month=14&day=1', '/api/date?year=2025&month=1&day=31'):
+            response = client.get(url)
+            assert response.status_code == 400
+            assert 'error' in response.get_json()
+
+
+class TestDateConvertEndpoint:
+    """Testes da conversão em lote (POST /api/date/convert)."""
+    
+    @pytest.fixture(autouse=True)
+    def small_index(self, monkeypatch):
+        """Índice de 2024 a 2025 e lotes de 2 linhas, para cruzar os limites dos blocos."""
+        monkeypatch.setenv(month_index.MONTH_INDEX_YEARS_ENV, "2024-2025")
+        monkeypatch.setattr(month_index, "_indexes", {})
+        monkeypatch.setattr(backend, "CONVERT_CHUNK_ROWS", 2)
+    
+    def test_json_array(self, client):
+        """Testa um array JSON com datas, timestamps e valores inválidos."""
+        response = client.post('/api/date/convert',
+                               json=['2025-09-03', '2025-01-15T23:10:00Z', 'x', '2025', '1999-01-01'])
+        rows = response.get_json()
+        
+        assert response.status_code == 200
+        assert rows[0] == {'date': '2025-09-03', 'year': 2025, 'month': 6, 'name': 'Elul', 'day': 12}
+        assert (rows[1]['year'], rows[1]['name'], rows[1]['day']) == (2024, 'Tevet', 17)
+        assert [row['date'] for row in rows] == ['2025-09-03', '2025-01-15T23:10:00Z', 'x', '2025', '1999-01-01']
+        assert all(row['month'] is None for row in rows[2:])
+        assert client.post('/api/date/convert', json=[]).get_json() == []
+    
+    def test_csv_stream(self, client):
+        """Testa CSV com cabeçalho, linhas vazias e saída em JSON."""
+        body = 'timestamp,value\n2025-09-03T10:00,1\n\n"2025-09-04",2\nxx,3\n'
+        response = client.post('/api/date/convert', data=body, content_type='text/csv')
+        
+        assert response.mimetype == 'text/csv'
+        assert response.get_data(as_text=True).splitlines() == [
+            'date,year,month,name,day',
+            '2025-09-03T10:00,2025,6,Elul,12',
+            '2025-09-04,2025,6,Elul,13',
+            'xx,,,,',
+        ]
+        as_json = client.post('/api/date/convert?format=json', data='2025-09-03\n', content_type='text/csv')
+        assert as_json.get_json() == [{'date': '2025-09-03', 'year': 2025, 'month': 6, 'name': 'Elul', 'day': 12}]
+    
+    def test_invalid_requests(self, client):
+        """Testa corpo e formato inválidos."""
+        assert client.post('/api/date/convert', data='x', content_type='application/xml').status_code == 400
+        assert client.post('/api/date/convert', json={'dates': []}).status_code == 400
+        assert client.post('/api/date/convert?format=xml', json=[]).status_code == 400
+
+
+class TestExportEndpoints:
+    """Testes das exportações."""
+    
+    def test_csv_range_streams(self, client):
+        """Testa o CSV de um intervalo de anos, enviado em fluxo."""
+        response = client.get('/api/export/csv?from=2024&to=2025&phases=true')
+        lines = response.get_data(as_text=True).splitlines()
+        
+        assert response.status_code == 200
+        assert 'Content-Length' not in response.headers
+        assert response.mimetype == 'text/csv'
+        assert 'biblical_calendar_2024-2025.csv' in response.headers['Content-Disposition']
+        assert lines[0] == 'year,type,name,month_index,day,start,end,days'
+        assert {line.split(',')[0] for line in lines[1:]} == {'2024', '2025'}
+        assert any(',moon_phase,' in line for line in lines)
+    
+    def test_csv_range_invalid(self, client):
+        """Testa parâmetros inválidos do intervalo."""
+        assert client.get('/api/export/csv').status_code == 400
+        assert client.get('/api/export/csv?from=2025&to=x').status_code == 400
+        assert client.get('/api/export/csv?from=2025&to=2024').status_code == 400
+        assert client.get('/api/export/csv?from=1&to=5000').status_code == 400
+    def test_ics_range_streams(self, client):
+        """Testa o ICS de um intervalo de anos, enviado em fluxo."""
+        response = client.get('/api/export/ics?from=2024&to=2025')
+        text = response.get_data(as_text=True)
+        
+        assert response.status_code == 200
+        assert 'Content-Length' not in response.headers
+        assert response.mimetype == 'text/calendar'
+        assert 'biblical_festivals_2024-2025.ics' in response.headers['Content-Disposition']
+        assert text.startswith('BEGIN:VCALENDAR\r\n') and text.endswith('END:VCALENDAR\r\n')
+        assert 'UID:2024-pessach@biblical-calendar' in text
+        assert 'UID:2025-pessach@biblical-calendar' in text
+        assert client.get('/api/export/ics?from=2025&to=2024').status_code == 400
+    
+    def test_single_year_ics_matches_range(self, client):
+        """Testa se a exportação anual usa o mesmo escritor (mesmos UIDs)."""
+        single = client.get('/api/export/ics/2025').get_data(as_text=True)
+        ranged = client.get('/api/export/ics?from=2025&to=2025').get_data(as_text=True)
+        
+        assert single == ranged
+
+class TestWarmUp:
+    """Testes do pré-cálculo e do endpoint /api/ready."""
+    
+    def test_warmup_years(self):
+        """Testa a ordem da janela: ano central primeiro, depois para fora."""
+        assert warmup_years(2025, 2) == [2025, 2026, 2024, 2027, 2023]
+        assert warmup_years(2025, 0) == [2025]
+    
+    def test_readiness_progress(self, client, monkeypatch):
+        """Testa 503 com progresso durante o pré-cálculo e 200 ao final."""
+        release = threading.Event()
+        jobs_run = []
+        
+        def job(year):
+            jobs_run.append(year)
+            if year == 2:
+                release.wait(10)
+            if year == 3:
+                raise RuntimeError("falhou")
+        
+        warmup = WarmUp([(1,), (2,), (3,)], job)
+        monkeypatch.setattr(backend, 'warmup', warmup)
+        assert client.get('/api/ready').get_json()['state'] == 'pending'
+        warmup.start()
+        while len(jobs_run) < 2:
+            release.wait(0.01)
+        
+        response = client.get('/api/ready')
+        status = response.get_json()
+        assert response.status_code == 503
+        assert (status['done'], status['total'], status['current']) == (1, 3, [2])
+        assert 'no-cache' in response.headers['Cache-Control']
+        
+        release.set()
+        assert warmup.wait(10)
+        response = client.get('/api/ready')
+        status = response.get_json()
+        assert response.status_code == 200
+        assert status['ready'] and status['progress'] == 1.0
+        assert status['errors'] == [{'job': [3], 'error': 'falhou'}]
+    
+    def test_start_warmup_fills_cache(self, client, monkeypatch):
+        """Testa se o pré-cálculo deixa as respostas e os índices de meses prontos."""
+        monkeypatch.setattr(backend, 'warmup', None)
+        monkeypatch.setenv(month_index.MONTH_INDEX_YEARS_ENV, "2024-2025")
+        monkeypatch.setattr(month_index, "_indexes", {})
+        assert client.get('/api/ready').get_json() == {'state': 'disabled', 'ready': True}
+        
+        warmup = backend.start_warmup(radius=0, center_year=2025)
+        assert backend.start_warmup() is warmup
+        assert warmup.wait(120)
+        
+        assert warmup.status()['errors'] == []
+        assert (2025, False, False) in backend.calendar_cache
+        assert (2025, True, False) in backend.calendar_cache
+        assert client.get('/api/calendar/2025?visibility=true').headers['X-Calendar-Cache'] == 'HIT'
+        assert set(month_index._indexes) == {False, True}
+        assert client.get('/api/ready').status_code == 200
+
+if __name__ == "__main__":
+    pytest.main([__file__])
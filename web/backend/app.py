@@ -10,13 +10,15 @@ Versão:
     1.0.0
 """
 
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
-from datetime import datetime, date
+from datetime import datetime, date, timezone
+import csv
+import hashlib
+import io
+import json
 import sys
 import os
-import tempfile
-import io
 
 # Add src to path for imports
 src_path = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
@@ -25,19 +27,25 @@ if src_path not in sys.path:
 
 from biblical_calendar.calendar_core import (
     BiblicalCalendarCore,
-    generate_biblical_months_dynamic,
+    generate_month_table,
+    generate_month_tables_range,
     map_festivals_to_dates,
-    export_events_to_ics,
     compute_seasons_for_year,
-    load_optimal_ephemeris,
-    FESTIVALS_DEF,
-    YESHUA_EVENTS_DEF,
+    get_moon_phases_for_year,
+    ephemeris_context,
+    ALL_EVENTS_DEF,
     FESTIVAL_TRANSLATIONS,
-    FESTIVAL_DESCRIPTIONS,
-    CURRENT_EPHEMERIS
+    FESTIVAL_DESCRIPTIONS
 )
-from skyfield.api import load
-from skyfield.almanac import find_discrete, moon_phases
+from biblical_calendar import calendar_core
+from biblical_calendar.calendar_core import preload
+from biblical_calendar.calendar_cache import content_key
+from biblical_calendar.export import iter_calendar_csv, iter_calendar_ics
+from biblical_calendar.locations import get_location_registry, make_location, sun_times_for_year
+from biblical_calendar.month_index import MONTH_NAME_CODES, get_month_index
+from response_cache import ResponseCache, RESPONSE_CACHE_SIZE_ENV, DEFAULT_RESPONSE_CACHE_SIZE
+from single_flight import SingleFlight
+from warmup import WarmUp, warmup_radius, warmup_years
 
 def get_current_season_for_date(target_date, seasons):
     """Obtém a estação astronômica atual para ambas as localidades."""
@@ -74,132 +82,360 @@ def get_current_season_for_date(target_date, seasons):
 app = Flask(__name__)
 CORS(app)
 
+# Serialized /api/calendar responses keyed by (year, visibility, academic)
+calendar_cache = ResponseCache(int(os.environ.get(RESPONSE_CACHE_SIZE_ENV, DEFAULT_RESPONSE_CACHE_SIZE)))
+
+# Concurrent cache misses for the same calendar share one pipeline run
+calendar_flight = SingleFlight()
+
+# Background pre-computation of the hot set of years, set by start_warmup()
+warmup = None
+
+# Calendar and export responses never change for a given ETag; clients and
+# proxies may keep them this long (seconds) before revalidating
+HTTP_MAX_AGE_ENV = 'CALENDAR_HTTP_MAX_AGE'
+HTTP_MAX_AGE = int(os.environ.get(HTTP_MAX_AGE_ENV, 7 * 24 * 3600))
+
+# Largest year range accepted by the streaming exports
+EXPORT_MAX_YEARS = 1000
+
+# Largest number of years per /api/calendars request
+CALENDARS_MAX_YEARS = 100
+
+# Dates converted per vectorized batch (and streamed chunk) by /api/date/convert
+CONVERT_CHUNK_ROWS = 65536
+
+# Columns of the /api/date/convert answer; 'date' echoes the input value
+CONVERT_COLUMNS = ('date', 'year', 'month', 'name', 'day')
+
+# Largest number of locations per /api/sun request
+SUN_MAX_LOCATIONS = 50
+
+# Bumped when the format of a cacheable response changes
+RESPONSE_FORMAT_VERSION = 3
+
+# Code that shapes the responses; used for Last-Modified together with the kernel
+SOURCE_MTIME = max(os.path.getmtime(__file__), os.path.getmtime(calendar_core.__file__))
+
+def response_etag(kind, year, use_visibility, academic_mode):
+    """Strong ETag of a cacheable response, derived from its content key.
+    
+    The key covers the parameters, the ephemeris (name and kernel checksum)
+    and the library version, so it is known before computing anything.
+    """
+    ctx = ephemeris_context(year, force_academic=academic_mode)
+    key = content_key(kind, year, ctx, visibility=use_visibility, format=RESPONSE_FORMAT_VERSION)
+    return key, ctx
+
+def last_modified(ctx):
+    """Last-Modified of a cacheable response: newest of the kernel and the code."""
+    try:
+        kernel_mtime = os.path.getmtime(ctx.eph.path)
+    except (AttributeError, OSError, TypeError):
+        kernel_mtime = 0
+    return datetime.fromtimestamp(max(SOURCE_MTIME, kernel_mtime), tz=timezone.utc)
+
+def cacheable(response, etag, ctx, download_name=None):
+    """Add ETag, Last-Modified and Cache-Control and answer conditional requests."""
+    response.set_etag(etag)
+    response.last_modified = last_modified(ctx)
+    response.cache_control.public = True
+    response.cache_control.max_age = HTTP_MAX_AGE
+    if download_name:
+        response.headers['Content-Disposition'] = f'attachment; filename={download_name}'
+    return response.make_conditional(request)
+
+def not_modified(etag, ctx):
+    """304 response when the client already has this ETag, else None."""
+    if etag in request.if_none_match:
+        return cacheable(Response(status=304), etag, ctx)
+    return None
+
+def request_flags():
+    """visibility and academic query parameters."""
+    use_visibility = request.args.get('visibility', 'false').lower() == 'true'
+    academic_mode = request.args.get('academic', 'false').lower() == 'true'
+    return use_visibility, academic_mode
+
+def request_year_range(max_years=EXPORT_MAX_YEARS):
+    """from and to query parameters; raises ValueError when invalid."""
+    try:
+        start_year = int(request.args['from'])
+        end_year = int(request.args.get('to', start_year))
+    except (KeyError, ValueError):
+        raise ValueError("'from' and 'to' must be integer years")
+    if end_year < start_year:
+        raise ValueError("'to' must be greater than or equal to 'from'")
+    if end_year - start_year + 1 > max_years:
+        raise ValueError(f"at most {max_years} years per request")
+    return start_year, end_year
+
+def request_years():
+    """Sorted years of ``?years=`` (repeated or comma-separated) or of ``?from=&to=``.
+    
+    Raises ValueError when invalid.
+    """
+    if 'years' not in request.args:
+        start_year, end_year = request_year_range(CALENDARS_MAX_YEARS)
+        return list(range(start_year, end_year + 1))
+    try:
+        years = {int(value) for values in request.args.getlist('years')
+                 for value in values.split(',') if value.strip()}
+    except ValueError:
+        raise ValueError("'years' must be integer years")
+    if not years:
+        raise ValueError("'years' must list at least one year")
+    if len(years) > CALENDARS_MAX_YEARS:
+        raise ValueError(f"at most {CALENDARS_MAX_YEARS} years per request")
+    return sorted(years)
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
     return jsonify({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
-        'version': '1.0.0'
+        'version': '1.0.0',
+        'calendar_cache': calendar_cache.stats(),
+        'calendar_flight': calendar_flight.stats(),
+        'warmup': warmup.state if warmup is not None else 'disabled'
     })
 
+@app.route('/api/ready', methods=['GET'])
+def readiness_check():
+    """Readiness endpoint: 503 until the warm-up has filled the cache."""
+    if warmup is None:
+        status = {'state': 'disabled', 'ready': True}
+    else:
+        status = warmup.status()
+    response = jsonify(status)
+    response.status_code = 200 if status['ready'] else 503
+    response.cache_control.no_cache = True
+    return response
+
+def build_calendar_payload(year, use_visibility, academic_mode):
+    """Run the astronomical pipeline for a calendar response.
+    
+    The payload only depends on the parameters and the ephemeris; what
+    depends on today's date is served by ``/api/season/current``.
+    """
+    # Ephemeris context for this request only
+    ctx = ephemeris_context(year, force_academic=academic_mode)
+    
+    # Generate months
+    month_table = generate_month_table(
+        year, use_visibility_heuristic=use_visibility, ctx=ctx
+    )
+    
+    return calendar_payload(year, ctx, month_table, use_visibility, academic_mode)
+
+def calendar_payload(year, ctx, month_table, use_visibility, academic_mode):
+    """Calendar response of one year from its already generated months."""
+    embolismic = month_table.embolismic
+    nissan_start = month_table.nissan_start
+    
+    months = [
+        {
+            'index': month.index,
+            'name': month.name,
+            'start': month.start.isoformat(),
+            'end': month.end.isoformat(),
+            'days': month.days
+        }
+        for month in month_table
+    ]
+    
+    # Get festivals
+    festivals = map_festivals_to_dates(month_table, ALL_EVENTS_DEF)
+    
+    festivals_data = []
+    for fest in festivals:
+        hebrew_name = fest['name']
+        portuguese_name = FESTIVAL_TRANSLATIONS.get(hebrew_name, hebrew_name)
+        description = FESTIVAL_DESCRIPTIONS.get(hebrew_name, '')
+        
+        # Ensure date is properly serialized
+        fest_date = fest['date']
+        if hasattr(fest_date, 'date'):
+            fest_date = fest_date.date()
+        
+        festivals_data.append({
+            'name': hebrew_name,
+            'portuguese_name': portuguese_name,
+            'date': fest_date.isoformat(),
+            'description': description
+        })
+    
+    # Get seasons
+    seasons = compute_seasons_for_year(year, ctx)
+    seasons_data = []
+    for season in seasons:
+        seasons_data.append({
+            'event': season['event'],
+            'utc': season['utc'].isoformat()
+        })
+    
+    # Moon phases from the shared phase engine (same solve as the months)
+    moon_phases_data = [
+        {
+            'date': phase['date'].isoformat(),
+            'phase': phase['phase'],
+            'icon': phase['icon'],
+            'name': f"Lua {phase['name']}"
+        }
+        for phase in get_moon_phases_for_year(year, ctx)
+    ]
+    
+    payload = {
+        'year': year,
+        'ephemeris': ctx.name,
+        'embolismic': embolismic,
+        'nissan_start': nissan_start.date().isoformat() if hasattr(nissan_start, 'date') else nissan_start.isoformat(),
+        'months': months,
+        'festivals': festivals_data,
+        'seasons': seasons_data,
+        'moon_phases': moon_phases_data,
+        'use_visibility': use_visibility,
+        'academic_mode': academic_mode
+    }
+    return payload
+
+def calendar_body(year, use_visibility, academic_mode):
+    """Serialized /api/calendar response and whether it came from the cache."""
+    key = (year, use_visibility, academic_mode)
+    body = calendar_cache.get(key)
+    if body is not None:
+        return body, True
+    
+    def compute():
+        # A flight that finished between the lookup above and joining counts too
+        cached_body = calendar_cache.peek(key)
+        if cached_body is not None:
+            return cached_body
+        new_body = app.json.dumps(build_calendar_payload(year, use_visibility, academic_mode)).encode('utf-8')
+        calendar_cache.put(key, new_body)
+        return new_body
+    
+    body, _ = calendar_flight.do(key, compute)
+    return body, False
+
+def calendar_bodies(years, use_visibility, academic_mode):
+    """Serialized calendars of several years, in order.
+    
+    Years already in the response cache are reused as they are. The others
+    are grouped into runs of consecutive years with the same ephemeris, and
+    each run resolves its equinoxes, new moons and moon phases in one pass.
+    Batch results are not added to the response cache, and the lookups
+    neither refresh entries nor count as hits or misses, so a long range
+    does not evict the hot single-year responses or skew the cache stats.
+    """
+    bodies = {}
+    runs = []
+    for year in years:
+        body = calendar_cache.peek((year, use_visibility, academic_mode))
+        if body is not None:
+            bodies[year] = body
+            continue
+        ctx = ephemeris_context(year, force_academic=academic_mode)
+        if runs and runs[-1][0].kernel == ctx.kernel and runs[-1][2] == year - 1:
+            runs[-1][2] = year
+        else:
+            runs.append([ctx, year, year])
+    for ctx, start_year, end_year in runs:
+        tables = generate_month_tables_range(start_year, end_year, use_visibility, ctx)
+        calendar_core.compute_moon_phases_for_years(start_year, end_year, ctx)
+        for year, month_table in tables.items():
+            payload = calendar_payload(year, ctx, month_table, use_visibility, academic_mode)
+            bodies[year] = app.json.dumps(payload).encode('utf-8')
+    return [bodies[year] for year in years]
+
+def warm_calendar(year, use_visibility):
+    """Warm-up job: fill the caches for one calendar and its ETag."""
+    response_etag('calendar', year, use_visibility, False)
+    calendar_body(year, use_visibility, False)
+
+def warm_job(kind, *args):
+    """Warm-up job: ``('calendar', year, visibility)`` or ``('month_index', visibility)``."""
+    if kind == 'calendar':
+        warm_calendar(*args)
+    else:
+        get_month_index(*args)
+
+def start_warmup(radius=None, center_year=None):
+    """Start precomputing the calendars around the current year in the background.
+    
+    Covers ``center_year ± radius`` (default: ``CALENDAR_WARMUP_YEARS``),
+    with and without the visibility heuristic, then builds the month indexes
+    used by ``/api/date``. Returns the running ``WarmUp`` or None when
+    disabled; later calls return the same one.
+    """
+    global warmup
+    if warmup is not None:
+        return warmup
+    if radius is None:
+        radius = warmup_radius()
+        if radius is None:
+            return None
+    center_year = center_year or datetime.now().year
+    jobs = [('calendar', year, use_visibility)
+            for year in warmup_years(center_year, radius)
+            for use_visibility in (False, True)]
+    if len(jobs) > calendar_cache.max_entries:
+        app.logger.warning("warm-up of %d calendars exceeds %s=%d",
+                           len(jobs), RESPONSE_CACHE_SIZE_ENV, calendar_cache.max_entries)
+    jobs += [('month_index', use_visibility) for use_visibility in (False, True)]
+    warmup = WarmUp(jobs, warm_job, before=preload).start()
+    return warmup
+
 @app.route('/api/calendar/<int:year>', methods=['GET'])
 def get_calendar(year):
     """Get biblical calendar for a specific year."""
     try:
-        use_visibility = request.args.get('visibility', 'false').lower() == 'true'
-        academic_mode = request.args.get('academic', 'false').lower() == 'true'
-        
-        print(f"DEBUG: Generating calendar for {year}, visibility={use_visibility}")
-        
-        # Load optimal ephemeris
-        eph, eph_name = load_optimal_ephemeris(year, force_academic=academic_mode)
-        
-        # Generate months
-        months_df, embolismic, nissan_start = generate_biblical_months_dynamic(
-            year, use_visibility_heuristic=use_visibility
-        )
-        
-        # Debug: print Elul date
-        elul_row = months_df[months_df['index'] == 6].iloc[0]
-        print(f"DEBUG: Elul starts on {elul_row['start']} (type: {type(elul_row['start'])})")
-        
-        # Convert DataFrame to dict - force date serialization
-        months = []
-        for _, row in months_df.iterrows():
-            # Ensure dates are properly serialized
-            start_date = row['start']
-            end_date = row['end']
-            
-            # Convert to date if datetime
-            if hasattr(start_date, 'date'):
-                start_date = start_date.date()
-            if hasattr(end_date, 'date'):
-                end_date = end_date.date()
-            
-            month_data = {
-                'index': int(row['index']),
-                'name': row['name'],
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat(),
-                'days': int(row['days'])
-            }
-            
-            if row['name'] == 'Elul':
-                print(f"DEBUG: Serializing Elul - start_date={start_date}, isoformat={start_date.isoformat()}")
-            
-            months.append(month_data)
+        use_visibility, academic_mode = request_flags()
+        etag, ctx = response_etag('calendar', year, use_visibility, academic_mode)
+        response = not_modified(etag, ctx)
+        if response is not None:
+            return response
         
-        # Get festivals
-        combined = FESTIVALS_DEF.copy()
-        combined.update(YESHUA_EVENTS_DEF)
-        festivals = map_festivals_to_dates(months_df, combined)
+        body, hit = calendar_body(year, use_visibility, academic_mode)
+        response = Response(body, mimetype='application/json')
+        response.headers['X-Calendar-Cache'] = 'HIT' if hit else 'MISS'
+        return cacheable(response, etag, ctx)
         
-        festivals_data = []
-        for fest in festivals:
-            hebrew_name = fest['name']
-            portuguese_name = FESTIVAL_TRANSLATIONS.get(hebrew_name, hebrew_name)
-            description = FESTIVAL_DESCRIPTIONS.get(hebrew_name, '')
-            
-            # Ensure date is properly serialized
-            fest_date = fest['date']
-            if hasattr(fest_date, 'date'):
-                fest_date = fest_date.date()
-            
-            festivals_data.append({
-                'name': hebrew_name,
-                'portuguese_name': portuguese_name,
-                'date': fest_date.isoformat(),
-                'description': description
-            })
-        
-        # Get seasons
-        seasons = compute_seasons_for_year(year)
-        seasons_data = []
-        for season in seasons:
-            seasons_data.append({
-                'event': season['event'],
-                'utc': season['utc'].isoformat()
-            })
-        
-        # Get moon phases for the year
-        ts = load.timescale()
-        t0 = ts.utc(year, 1, 1)
-        t1 = ts.utc(year + 1, 1, 1)
-        
-        times, phases = find_discrete(t0, t1, moon_phases(eph))
-        
-        moon_phases_data = []
-        phase_names = ['🌑', '🌓', '🌕', '🌗']  # New, First Quarter, Full, Last Quarter
-        
-        for t, phase in zip(times, phases):
-            moon_phases_data.append({
-                'date': t.utc_datetime().date().isoformat(),
-                'phase': int(phase),
-                'icon': phase_names[phase],
-                'name': ['Lua Nova', 'Lua Crescente', 'Lua Cheia', 'Lua Minguante'][phase]
-            })
-        
-        # Get current season for today
-        current_season = get_current_season_for_date(datetime.now().date(), seasons)
-        current_season_data = {
-            'jerusalem': current_season['jerusalem'] if current_season else 'N/A',
-            'sao_paulo': current_season['sao_paulo'] if current_season else 'N/A'
+    except Exception as e:
+        import traceback
+        error_details = {
+            'error': str(e),
+            'type': type(e).__name__,
+            'traceback': traceback.format_exc()
         }
+        print(f"ERROR in get_calendar: {error_details}")
+        return jsonify(error_details), 500
+
+@app.route('/api/calendars', methods=['GET'])
+def get_calendars():
+    """Calendars of several years in one response: ``?from=&to=`` or ``?years=``.
+    
+    Each item is the ``/api/calendar/<year>`` object of that year; the years
+    share one lunation, seasons and moon phase pass instead of one per year.
+    """
+    try:
+        years = request_years()
+        use_visibility, academic_mode = request_flags()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    try:
+        keys = [response_etag('calendar', year, use_visibility, academic_mode) for year in years]
+        etag = hashlib.sha256(''.join(key for key, _ in keys).encode('ascii')).hexdigest()
+        ctx = max((key_ctx for _, key_ctx in keys), key=last_modified)
+        response = not_modified(etag, ctx)
+        if response is not None:
+            return response
         
-        return jsonify({
-            'year': year,
-            'ephemeris': eph_name,
-            'embolismic': embolismic,
-            'nissan_start': nissan_start.date().isoformat() if hasattr(nissan_start, 'date') else nissan_start.isoformat(),
-            'months': months,
-            'festivals': festivals_data,
-            'seasons': seasons_data,
-            'moon_phases': moon_phases_data,
-            'current_season': current_season_data,
-            'use_visibility': use_visibility,
-            'academic_mode': academic_mode
-        })
+        bodies = calendar_bodies(years, use_visibility, academic_mode)
+        body = b''.join([b'{"years":', app.json.dumps(years).encode('utf-8'),
+                         b',"calendars":[', b','.join(bodies), b']}'])
+        return cacheable(Response(body, mimetype='application/json'), etag, ctx)
         
     except Exception as e:
         import traceback
@@ -208,73 +444,320 @@ def get_calendar(year):
             'type': type(e).__name__,
             'traceback': traceback.format_exc()
         }
-        print(f"ERROR in get_calendar: {error_details}")
+        print(f"ERROR in get_calendars: {error_details}")
         return jsonify(error_details), 500
 
+@app.route('/api/season/current', methods=['GET'])
+def get_current_season():
+    """Astronomical season today (or on ``?date=YYYY-MM-DD``) in both hemispheres.
+    
+    Kept out of /api/calendar so that calendar responses stay immutable.
+    """
+    try:
+        target_date = date.fromisoformat(request.args['date']) if 'date' in request.args else datetime.now().date()
+        ctx = ephemeris_context(target_date.year)
+        current_season = get_current_season_for_date(target_date, compute_seasons_for_year(target_date.year, ctx))
+        response = jsonify({
+            'date': target_date.isoformat(),
+            'jerusalem': current_season['jerusalem'] if current_season else 'N/A',
+            'sao_paulo': current_season['sao_paulo'] if current_season else 'N/A'
+        })
+        response.cache_control.no_cache = True
+        return response
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def biblical_date_response(target_date, use_visibility):
+    """Gregorian and biblical date of a day, with the bounds of its biblical month."""
+    index = get_month_index(use_visibility)
+    biblical = index.to_biblical(target_date)
+    month = index.month(biblical.year, biblical.month)
+    response = jsonify({
+        'date': target_date.isoformat(),
+        'year': biblical.year,
+        'month': biblical.month,
+        'name': biblical.name,
+        'day': biblical.day,
+        'month_start': month.start.isoformat(),
+        'month_end': month.end.isoformat(),
+        'month_days': month.days,
+        'use_visibility': use_visibility
+    })
+    response.cache_control.public = True
+    response.cache_control.max_age = HTTP_MAX_AGE
+    return response
+
+@app.route('/api/date/<iso_date>', methods=['GET'])
+def gregorian_to_biblical(iso_date):
+    """Biblical date of a Gregorian ``YYYY-MM-DD``, by binary search over the month index."""
+    use_visibility, _ = request_flags()
+    try:
+        return biblical_date_response(date.fromisoformat(iso_date), use_visibility)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/date', methods=['GET'])
+def biblical_to_gregorian():
+    """Gregorian date of the biblical ``?year=&month=&day=`` (month 1 = Nissan)."""
+    use_visibility, _ = request_flags()
+    try:
+        year, month, day = (int(request.args[name]) for name in ('year', 'month', 'day'))
+    except (KeyError, ValueError):
+        return jsonify({'error': "'year', 'month' and 'day' must be integers"}), 400
+    try:
+        target_date = get_month_index(use_visibility).from_biblical(year, month, day)
+        return biblical_date_response(target_date, use_visibility)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+def parse_dates(values):
+    """datetime64[D] array of the date part of ISO values, NaT where invalid."""
+    import numpy as np
+    cut = [str(value).strip()[:10] for value in values]
+    try:
+        days = np.array(cut, dtype='datetime64[D]')
+    except ValueError:
+        days = np.array([parse_date(value) for value in cut], dtype='datetime64[D]')
+    # numpy also reads partial dates such as '2025'; keep only exact YYYY-MM-DD
+    days[np.datetime_as_string(days) != np.array(cut, dtype=str)] = np.datetime64('NaT')
+    return days
+
+def parse_date(value):
+    """One ISO date as datetime64[D], or NaT."""
+    import numpy as np
+    try:
+        return np.datetime64(value, 'D')
+    except ValueError:
+        return np.datetime64('NaT')
+
+def converted_rows(values, use_visibility):
+    """(date, year, month, name, day) of each input value; None fields where not convertible."""
+    result = get_month_index(use_visibility).to_biblical_array(parse_dates(values))
+    rows = []
+    for value, year, month, code, day in zip(values, result.year.tolist(), result.month.tolist(),
+                                             result.name_code.tolist(), result.day.tolist()):
+        if month:
+            rows.append((value, year, month, MONTH_NAME_CODES[code], day))
+        else:
+            rows.append((value, None, None, None, None))
+    return rows
+
+def json_date_chunks(values):
+    """Batches of CONVERT_CHUNK_ROWS values of a parsed JSON array."""
+    for start in range(0, len(values), CONVERT_CHUNK_ROWS):
+        yield values[start:start + CONVERT_CHUNK_ROWS]
+
+def csv_date_chunks(stream):
+    """Batches of first-column values read from a CSV stream (header row skipped)."""
+    import numpy as np
+    reader = csv.reader(io.TextIOWrapper(stream, encoding='utf-8', newline=''))
+    chunk = []
+    for row in reader:
+        if not row:
+            continue
+        if reader.line_num == 1 and np.isnat(parse_dates(row[:1])[0]):
+            # a first row that is not a date is a header
+            continue
+        chunk.append(row[0])
+        if len(chunk) == CONVERT_CHUNK_ROWS:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def iter_converted_csv(chunks, use_visibility):
+    """CSV text of the converted dates, one block per chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(CONVERT_COLUMNS)
+    for chunk in chunks:
+        writer.writerows(converted_rows(chunk, use_visibility))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+def iter_converted_json(chunks, use_visibility):
+    """JSON array of the converted dates, one block per chunk."""
+    yield '['
+    separator = ''
+    for chunk in chunks:
+        items = [dict(zip(CONVERT_COLUMNS, row)) for row in converted_rows(chunk, use_visibility)]
+        if items:
+            yield separator + json.dumps(items, ensure_ascii=False, separators=(',', ':'))[1:-1]
+            separator = ','
+    yield ']'
+
+@app.route('/api/date/convert', methods=['POST'])
+def convert_dates():
+    """Biblical dates of many Gregorian dates, converted and streamed in chunks.
+    
+    The body is a JSON array of dates or CSV whose first column holds them
+    (header optional); timestamps are cut to their date. The answer uses the
+    same format unless ``?format=csv|json``, keeps the input order and leaves
+    the fields empty (null) for values that are invalid or outside the index.
+    """
+    use_visibility, _ = request_flags()
+    if request.mimetype == 'application/json':
+        values = request.get_json(silent=True)
+        if not isinstance(values, list):
+            return jsonify({'error': 'body must be a JSON array of dates'}), 400
+        chunks, input_format = json_date_chunks(values), 'json'
+    elif request.mimetype in ('text/csv', 'text/plain'):
+        chunks, input_format = csv_date_chunks(request.stream), 'csv'
+    else:
+        return jsonify({'error': 'send a JSON array (application/json) or CSV (text/csv)'}), 400
+    output_format = request.args.get('format', input_format)
+    if output_format not in ('csv', 'json'):
+        return jsonify({'error': "'format' must be 'csv' or 'json'"}), 400
+    try:
+        # built before streaming, so a failure is an error response and not a cut stream
+        get_month_index(use_visibility)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    if output_format == 'csv':
+        return Response(stream_with_context(iter_converted_csv(chunks, use_visibility)), mimetype='text/csv')
+    return Response(stream_with_context(iter_converted_json(chunks, use_visibility)), mimetype='application/json')
+
+def request_locations():
+    """Observers of ``?location=`` (registered names, repeated or comma-separated)
+    plus an optional ad-hoc one from ``?lat=&lon=&tz=&elevation=&name=``.
+    
+    Raises KeyError for unknown names and ValueError for invalid coordinates.
+    """
+    registry = get_location_registry()
+    names = [name.strip() for value in request.args.getlist('location')
+             for name in value.split(',') if name.strip()]
+    locations = [registry.get(name) for name in names]
+    if 'lat' in request.args or 'lon' in request.args:
+        try:
+            lat, lon = float(request.args['lat']), float(request.args['lon'])
+            elevation = float(request.args.get('elevation', 0))
+        except (KeyError, ValueError):
+            raise ValueError("'lat' and 'lon' must be numbers")
+        locations.append(make_location(request.args.get('name', f'{lat},{lon}'), lat, lon,
+                                       request.args.get('tz', 'UTC'), elevation))
+    if not locations:
+        locations = list(registry)
+    if len(locations) > SUN_MAX_LOCATIONS:
+        raise ValueError(f"at most {SUN_MAX_LOCATIONS} locations per request")
+    return locations
+
+@app.route('/api/locations', methods=['GET'])
+def list_locations():
+    """Registered observers."""
+    return jsonify({'locations': list(get_location_registry())})
+
+@app.route('/api/sun/<int:year>', methods=['GET'])
+def get_sun_times(year):
+    """Local sunrise and sunset of every day of ``year`` for one or more locations.
+    
+    All locations are computed in a single vectorized pass; without
+    ``?location=`` or ``?lat=&lon=`` every registered location is returned.
+    """
+    try:
+        locations = request_locations()
+    except KeyError as e:
+        return jsonify({'error': e.args[0]}), 404
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if not 2 <= year <= 9998:
+        return jsonify({'error': 'year must be between 2 and 9998'}), 400
+    table = sun_times_for_year(locations, year)
+    response = jsonify({
+        'year': year,
+        'dates': [day.isoformat() for day in table.dates],
+        'locations': [{**loc, **table.local_isoformat(i)} for i, loc in enumerate(table.locations)]
+    })
+    response.cache_control.public = True
+    response.cache_control.max_age = HTTP_MAX_AGE
+    return response
+
 @app.route('/api/export/csv/<int:year>', methods=['GET'])
 def export_csv(year):
     """Export calendar data as CSV."""
     try:
-        use_visibility = request.args.get('visibility', 'false').lower() == 'true'
-        academic_mode = request.args.get('academic', 'false').lower() == 'true'
+        use_visibility, academic_mode = request_flags()
+        etag, ctx = response_etag('csv', year, use_visibility, academic_mode)
+        response = not_modified(etag, ctx)
+        if response is not None:
+            return response
         
         # Generate months
-        months_df, _, _ = generate_biblical_months_dynamic(
-            year, use_visibility_heuristic=use_visibility
+        month_table = generate_month_table(
+            year, use_visibility_heuristic=use_visibility, ctx=ctx
         )
+        body = month_table.to_dataframe().to_csv(index=False)
         
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-        months_df.to_csv(temp_file.name, index=False)
-        temp_file.close()
-        
-        return send_file(
-            temp_file.name,
-            as_attachment=True,
-            download_name=f'biblical_calendar_{year}.csv',
-            mimetype='text/csv'
-        )
+        return cacheable(Response(body, mimetype='text/csv'), etag, ctx,
+                         download_name=f'biblical_calendar_{year}.csv')
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/export/csv', methods=['GET'])
+def export_csv_range():
+    """Stream months, festivals and optionally moon phases of ``?from=&to=`` as CSV.
+    
+    Rows are generated one year at a time and written straight into the
+    response, so memory use does not grow with the range.
+    """
+    try:
+        start_year, end_year = request_year_range()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    use_visibility, academic_mode = request_flags()
+    include_phases = request.args.get('phases', 'false').lower() == 'true'
+    rows = iter_calendar_csv(start_year, end_year, use_visibility_heuristic=use_visibility,
+                             include_phases=include_phases, force_academic=academic_mode)
+    response = Response(rows, mimetype='text/csv')
+    response.headers['Content-Disposition'] = f'attachment; filename=biblical_calendar_{start_year}-{end_year}.csv'
+    return response
+
 @app.route('/api/export/ics/<int:year>', methods=['GET'])
 def export_ics(year):
     """Export festivals as ICS."""
     try:
-        use_visibility = request.args.get('visibility', 'false').lower() == 'true'
-        academic_mode = request.args.get('academic', 'false').lower() == 'true'
-        
-        # Generate months and festivals
-        months_df, _, _ = generate_biblical_months_dynamic(
-            year, use_visibility_heuristic=use_visibility
-        )
-        
-        combined = FESTIVALS_DEF.copy()
-        combined.update(YESHUA_EVENTS_DEF)
-        festivals = map_festivals_to_dates(months_df, combined)
-        
-        events = []
-        for fest in festivals:
-            events.append({
-                'name': fest['name'],
-                'date': fest['date'],
-                'description': f'Calendário bíblico lunissolar - {CURRENT_EPHEMERIS}'
-            })
+        use_visibility, academic_mode = request_flags()
+        etag, ctx = response_etag('ics', year, use_visibility, academic_mode)
+        response = not_modified(etag, ctx)
+        if response is not None:
+            return response
         
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(mode='wb', suffix='.ics', delete=False)
-        export_events_to_ics(events, temp_file.name)
-        
-        return send_file(
-            temp_file.name,
-            as_attachment=True,
-            download_name=f'biblical_festivals_{year}.ics',
-            mimetype='text/calendar'
-        )
+        body = ''.join(iter_calendar_ics(year, year, use_visibility_heuristic=use_visibility,
+                                         force_academic=academic_mode, dtstamp=last_modified(ctx)))
+        return cacheable(Response(body, mimetype='text/calendar'), etag, ctx,
+                         download_name=f'biblical_festivals_{year}.ics')
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/export/ics', methods=['GET'])
+def export_ics_range():
+    """Stream the festivals of ``?from=&to=`` as ICS, one VEVENT at a time.
+    
+    UIDs are stable per year and festival, so the URL works as a calendar
+    subscription covering decades.
+    """
+    try:
+        start_year, end_year = request_year_range()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    use_visibility, academic_mode = request_flags()
+    try:
+        ctx = ephemeris_context(start_year, force_academic=academic_mode)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    events = iter_calendar_ics(start_year, end_year, use_visibility_heuristic=use_visibility,
+                               force_academic=academic_mode, dtstamp=last_modified(ctx))
+    response = Response(events, mimetype='text/calendar')
+    response.headers['Content-Disposition'] = f'attachment; filename=biblical_festivals_{start_year}-{end_year}.ics'
+    return response
+
 if __name__ == '__main__':
+    # with the reloader only the child process (WERKZEUG_RUN_MAIN) serves requests
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_warmup()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
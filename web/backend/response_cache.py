@@ -0,0 +1,82 @@
+"""Response Cache - Cache LRU em memória das respostas da API.
+
+Guarda respostas já serializadas (bytes JSON prontos para envio) por chave,
+com tamanho máximo configurável e contadores de acerto/falta.
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from collections import OrderedDict
+import threading
+
+# Environment variable with the maximum number of cached responses
+RESPONSE_CACHE_SIZE_ENV = "CALENDAR_RESPONSE_CACHE_SIZE"
+DEFAULT_RESPONSE_CACHE_SIZE = 32
+
+
+class ResponseCache:
+    """Cache LRU thread-safe de tamanho limitado.
+
+    Attributes:
+        max_entries (int): Número máximo de respostas guardadas (0 desativa).
+        hits (int): Consultas atendidas pelo cache.
+        misses (int): Consultas sem resposta em cache.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_RESPONSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key):
+        """Valor da chave (marcado como mais recente), ou None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def peek(self, key):
+        """Valor da chave, ou None, sem alterar a ordem LRU nem os contadores."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key, value) -> None:
+        """Guarda o valor, descartando os menos usados além do limite."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove todas as respostas e zera os contadores."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Tamanho, limite e contadores do cache."""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
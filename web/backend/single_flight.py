@@ -0,0 +1,94 @@
+"""Single Flight - Coalescência de cálculos idênticos e simultâneos.
+
+Quando várias requisições pedem a mesma chave ao mesmo tempo (ex.: o mesmo
+ano logo após expirar ou ser descartado do cache), apenas a primeira executa
+o cálculo; as demais esperam e recebem o mesmo resultado (ou a mesma
+exceção). Evita o estouro de cálculos repetidos ("cache stampede").
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+import threading
+
+
+class _Call:
+    """Cálculo em andamento para uma chave."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """Executa no máximo um cálculo por chave de cada vez.
+
+    Attributes:
+        leaders (int): Cálculos efetivamente executados.
+        shared (int): Chamadas que reaproveitaram um cálculo em andamento.
+    """
+
+    def __init__(self):
+        self.leaders = 0
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key, compute):
+        """Resultado de ``compute()`` para a chave, calculado uma única vez entre chamadas simultâneas.
+
+        Args:
+            key: Chave (hashable) do cálculo.
+            compute (Callable): Função sem argumentos que produz o valor.
+
+        Returns:
+            tuple: ``(valor, compartilhado)``; ``compartilhado`` é True quando o
+            valor veio do cálculo de outra chamada.
+
+        Raises:
+            Exception: A exceção levantada por ``compute``, repassada a todas
+                as chamadas que esperavam pelo mesmo cálculo.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = compute()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # Later callers start a new computation (normally a cache hit)
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value, False
+
+    def stats(self) -> dict:
+        """Cálculos em andamento e contadores."""
+        with self._lock:
+            return {
+                'in_flight': len(self._calls),
+                'leaders': self.leaders,
+                'shared': self.shared,
+            }
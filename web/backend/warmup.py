@@ -0,0 +1,121 @@
+"""Warm-up - Pré-cálculo dos calendários mais pedidos ao iniciar o servidor.
+
+Executa uma lista de tarefas em uma thread em segundo plano e expõe o
+progresso, usado pelo endpoint de prontidão (``/api/ready``).
+
+Autor:
+    Vander Loto - DATAMETRIA
+"""
+
+from datetime import datetime
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Environment variable with the years before/after the current one ("off" disables)
+WARMUP_YEARS_ENV = "CALENDAR_WARMUP_YEARS"
+DEFAULT_WARMUP_YEARS = 5
+
+
+def warmup_radius():
+    """Raio da janela (anos antes/depois do atual), ou None se desativado."""
+    value = os.environ.get(WARMUP_YEARS_ENV, str(DEFAULT_WARMUP_YEARS)).strip().lower()
+    if value in ("", "off", "false", "none"):
+        return None
+    return max(int(value), 0)
+
+
+def warmup_years(center_year, radius):
+    """Anos da janela, do ano central para fora (mais pedidos primeiro)."""
+    years = [center_year]
+    for offset in range(1, radius + 1):
+        years.extend([center_year + offset, center_year - offset])
+    return years
+
+
+class WarmUp:
+    """Executa tarefas de pré-cálculo em segundo plano e reporta o progresso.
+
+    Attributes:
+        jobs (list[tuple]): Argumentos de cada chamada de ``run``.
+        state (str): "pending", "running" ou "ready".
+        done (int): Tarefas concluídas (com ou sem erro).
+        errors (list[dict]): Tarefas que falharam.
+    """
+
+    def __init__(self, jobs, run, before=None):
+        """Prepara o pré-cálculo.
+
+        Args:
+            jobs (list[tuple]): Argumentos de cada tarefa.
+            run (Callable): Executa uma tarefa: ``run(*job)``.
+            before (Callable | None): Chamado uma vez antes das tarefas
+                (ex.: carregar a efeméride).
+        """
+        self.jobs = list(jobs)
+        self.state = "pending"
+        self.done = 0
+        self.errors = []
+        self.current = None
+        self.started_at = None
+        self.finished_at = None
+        self._run = run
+        self._before = before
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread = None
+
+    @property
+    def ready(self):
+        """True quando todas as tarefas foram tentadas."""
+        return self._ready.is_set()
+
+    def start(self):
+        """Inicia a thread (uma única vez) e retorna o próprio objeto."""
+        with self._lock:
+            if self._thread is None:
+                self.state = "running"
+                self.started_at = datetime.now()
+                self._thread = threading.Thread(target=self._work, name="calendar-warmup", daemon=True)
+                self._thread.start()
+        return self
+
+    def wait(self, timeout=None):
+        """Espera o fim do pré-cálculo; retorna ``ready``."""
+        return self._ready.wait(timeout)
+
+    def _work(self):
+        try:
+            if self._before is not None:
+                self._before()
+        except Exception as e:
+            self.errors.append({"job": None, "error": str(e)})
+        for job in self.jobs:
+            self.current = job
+            try:
+                self._run(*job)
+            except Exception as e:
+                self.errors.append({"job": list(job), "error": str(e)})
+                logger.exception("warm-up %s failed", job)
+            self.done += 1
+        self.current = None
+        self.finished_at = datetime.now()
+        self.state = "ready"
+        self._ready.set()
+
+    def status(self):
+        """Progresso do pré-cálculo, serializável em JSON."""
+        total = len(self.jobs)
+        return {
+            "state": self.state,
+            "ready": self.ready,
+            "done": self.done,
+            "total": total,
+            "progress": round(self.done / total, 3) if total else 1.0,
+            "current": list(self.current) if self.current else None,
+            "errors": list(self.errors),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
@@ -17,7 +17,7 @@ if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
 # Import the main Flask app
-from app import app
+from app import app, start_warmup
 
 # Configure static file serving
 STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
@@ -59,11 +59,21 @@ HTML_TEMPLATE = """
             <h3>📚 Endpoints Disponíveis</h3>
             <ul>
                 <li><code>GET /api/health</code> - Status da aplicação</li>
+                <li><code>GET /api/ready</code> - Prontidão (pré-cálculo concluído)</li>
                 <li><code>GET /api/calendar/{year}</code> - Calendário para um ano</li>
                 <li><code>GET /api/calendar/{year}?visibility=true</code> - Com heurística de visibilidade</li>
                 <li><code>GET /api/calendar/{year}?academic=true</code> - Modo acadêmico (DE440)</li>
+                <li><code>GET /api/calendars?from={year}&to={year}</code> - Calendários de vários anos (ou <code>?years=2020,2024</code>)</li>
+                <li><code>GET /api/date/{YYYY-MM-DD}</code> - Data bíblica de uma data gregoriana</li>
+                <li><code>GET /api/date?year=&month=&day=</code> - Data gregoriana de uma data bíblica</li>
+                <li><code>POST /api/date/convert</code> - Conversão em lote (CSV ou array JSON, em fluxo)</li>
+                <li><code>GET /api/season/current</code> - Estação astronômica de hoje</li>
+                <li><code>GET /api/locations</code> - Locais registrados</li>
+                <li><code>GET /api/sun/{year}?location=jerusalem</code> - Nascer e pôr do sol de cada dia do ano</li>
                 <li><code>GET /api/export/csv/{year}</code> - Exportar CSV</li>
+                <li><code>GET /api/export/csv?from={year}&to={year}</code> - Exportar CSV de vários anos (em fluxo)</li>
                 <li><code>GET /api/export/ics/{year}</code> - Exportar ICS</li>
+                <li><code>GET /api/export/ics?from={year}&to={year}</code> - Exportar ICS de vários anos (em fluxo)</li>
             </ul>
         </div>
     </div>
@@ -133,6 +143,12 @@ if __name__ == '__main__':
     print(f"📁 Static files directory: {STATIC_DIR}")
     print(f"🔧 Debug mode: {debug}")
     
+    # Precompute the hot set of years in the background; with the debug
+    # reloader only the child process (WERKZEUG_RUN_MAIN) serves requests
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        if start_warmup() is not None:
+            print("🔥 Warm-up started (GET /api/ready reports progress)")
+    
     app.run(
         host='0.0.0.0',
         port=port,